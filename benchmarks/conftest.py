@@ -0,0 +1,23 @@
+"""Benchmarks for the hot paths of siquant.
+
+Run with ``tox -e bench``, which compares every run against the committed
+baseline ``benchmarks/.baselines/Linux-CPython-3.11-64bit/0001_baseline.json``
+and fails if the mean time of any benchmark regresses by more than 10%.
+Runs aren't saved, so comparisons are only meaningful on a machine like the
+one which recorded the baseline, see ``tox.ini``.
+
+To record a new baseline, remove the old one and save a run in its place,
+which pytest-benchmark numbers ``0001`` again::
+
+    rm benchmarks/.baselines/Linux-CPython-3.11-64bit/0001_baseline.json
+    pytest benchmarks --benchmark-storage=file://benchmarks/.baselines \\
+        --benchmark-save=baseline
+"""
+import pytest
+
+SIZES = (10, 1000, 1000000)
+
+
+@pytest.fixture(params=SIZES, ids=lambda size: "n=%d" % size)
+def size(request):
+    return request.param
@@ -0,0 +1,60 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from siquant import make, si  # noqa: E402
+
+
+@pytest.fixture
+def lengths(size):
+    return make(np.linspace(1.0, 2.0, size), si.meters)
+
+
+@pytest.fixture
+def other_lengths(size):
+    return make(np.linspace(1000.0, 2000.0, size), si.millimeters)
+
+
+def test_array_make(benchmark, size):
+    values = np.linspace(1.0, 2.0, size)
+    benchmark(make, values, si.meters)
+
+
+def test_array_add(benchmark, lengths):
+    benchmark(lengths.__add__, lengths)
+
+
+def test_array_add_mixed(benchmark, lengths, other_lengths):
+    benchmark(lengths.__add__, other_lengths)
+
+
+def test_array_mul(benchmark, lengths):
+    benchmark(lengths.__mul__, lengths)
+
+
+def test_array_lt(benchmark, lengths, other_lengths):
+    benchmark(lengths.__lt__, other_lengths)
+
+
+def test_array_sqrt(benchmark, lengths):
+    area = lengths * lengths
+    benchmark(np.sqrt, area)
+
+
+def test_array_sum(benchmark, lengths):
+    benchmark(np.sum, lengths)
+
+
+def test_array_get_as(benchmark, lengths):
+    benchmark(lengths.get_as, si.millimeters)
+
+
+def test_array_chain(benchmark, lengths, other_lengths):
+    benchmark(lambda: (lengths * other_lengths + lengths * lengths) * 1.5)
+
+
+def test_array_chain_lazy(benchmark, lengths, other_lengths):
+    from siquant.lazy import lazy
+
+    a, b = lazy(lengths), lazy(other_lengths)
+    benchmark(lambda: ((a * b + a * a) * 1.5).evaluate())
@@ -0,0 +1,10 @@
+import subprocess
+import sys
+
+
+def _import_siquant():
+    subprocess.check_call([sys.executable, "-c", "import siquant"])
+
+
+def test_import_time(benchmark):
+    benchmark.pedantic(_import_siquant, rounds=10, warmup_rounds=1)
@@ -0,0 +1,67 @@
+from siquant import make, si
+
+
+def test_make(benchmark):
+    benchmark(make, 1.5, si.meters)
+
+
+def test_rmul_units(benchmark):
+    benchmark(si.meters.__rmul__, 1.5)
+
+
+def test_add_same_units(benchmark):
+    a = 1.5 * si.meters
+    b = 2.5 * si.meters
+    benchmark(a.__add__, b)
+
+
+def test_add_mixed_units(benchmark):
+    a = 1.5 * si.meters
+    b = 2.5 * si.millimeters
+    benchmark(a.__add__, b)
+
+
+def test_mul(benchmark):
+    force = 1.5 * si.kilonewtons
+    arm = 2.5 * si.meters
+    benchmark(force.__mul__, arm)
+
+
+def test_div(benchmark):
+    force = 1.5 * si.kilonewtons
+    area = 2.5 * si.meters ** 2
+    benchmark(force.__truediv__, area)
+
+
+def test_eq(benchmark):
+    a = 1.5 * si.meters
+    b = 1500 * si.millimeters
+    benchmark(a.__eq__, b)
+
+
+def test_lt(benchmark):
+    a = 1.5 * si.meters
+    b = 1600 * si.millimeters
+    benchmark(a.__lt__, b)
+
+
+def test_hash(benchmark):
+    benchmark(hash, 1.5 * si.meters)
+
+
+def test_get_as_same(benchmark):
+    benchmark((1.5 * si.meters).get_as, si.meters)
+
+
+def test_get_as_converted(benchmark):
+    benchmark((1.5 * si.meters).get_as, si.millimeters)
+
+
+def test_cvt_to(benchmark):
+    benchmark((1.5 * si.meters).cvt_to, si.millimeters)
+
+
+def test_approx(benchmark):
+    a = 1.234567890 * si.meters
+    b = 1234.567 * si.millimeters
+    assert benchmark(a.approx, b)
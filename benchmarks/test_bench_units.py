@@ -0,0 +1,36 @@
+from siquant import SIUnit, si
+from siquant.dimensions import force_t
+
+
+def test_unit_new_hit(benchmark):
+    units = SIUnit(1.25, force_t)
+    assert benchmark(SIUnit, 1.25, force_t) is units
+
+
+def test_unit_new_miss(benchmark):
+    benchmark(SIUnit, 1.2345, force_t)
+
+
+def test_unit_mul(benchmark):
+    benchmark(si.kilonewtons.__mul__, si.meters)
+
+
+def test_unit_mul_uncached(benchmark):
+    maxsize = SIUnit.cache.maxsize
+    SIUnit.cache.resize(0)
+    try:
+        benchmark(si.kilonewtons.__mul__, si.meters)
+    finally:
+        SIUnit.cache.resize(maxsize)
+
+
+def test_unit_div(benchmark):
+    benchmark(si.kilonewtons.__truediv__, si.meters)
+
+
+def test_unit_pow(benchmark):
+    benchmark(si.meters.__pow__, 2)
+
+
+def test_unit_compatible(benchmark):
+    benchmark(si.kilonewtons.compatible, si.newtons)
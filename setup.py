@@ -18,7 +18,11 @@ KEYWORDS = ["SI", "units", "dimensional analysis", "quantities"]
 
 
 INSTALL_REQUIRES = []
-EXTRAS_REQUIRE = {"docs": ["sphinx", "numpy"], "tests": ["coverage", "pytest", "numpy"]}
+EXTRAS_REQUIRE = {
+    "docs": ["sphinx", "numpy"],
+    "tests": ["coverage", "pytest", "numpy"],
+    "benchmarks": ["pytest", "pytest-benchmark", "numpy"],
+}
 EXTRAS_REQUIRE["dev"] = (
     EXTRAS_REQUIRE["docs"] + EXTRAS_REQUIRE["tests"] + ["pre-commit"]
 )
@@ -1,11 +1,50 @@
+import sys
+
+from importlib import import_module
+
 from .units import SIUnit
 from .quantities import Quantity, are_of, converter, validator, make
-from .systems import si, imperial
+from .quantities import NormalizedQuantity, normalize
+from .quantities import factory, register_factory
+
+#: Public attributes resolved on first access, by the module defining them.
+_LAZY = {
+    "si": ".systems.si",
+    "imperial": ".systems.imperial",
+    "parse_unit": ".parsing",
+    "parse_quantity": ".parsing",
+    "parse_quantities": ".parsing",
+    "compile": ".compiler",
+}
+
+
+def _load(name):
+    module = import_module(_LAZY[name], __name__)
+    value = module if module.__name__.endswith("." + name) else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        return _load(name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+if sys.version_info < (3, 7):  # module __getattr__ requires PEP 562
+    for _name in _LAZY:
+        _load(_name)
+
 
-SIUnit.factory = Quantity
+SIUnit.factory = staticmethod(factory)
 
 __all__ = (
     "Quantity",
+    "NormalizedQuantity",
     "SIUnit",
     "si",
     "imperial",
@@ -13,4 +52,10 @@ __all__ = (
     "converter",
     "validator",
     "make",
+    "register_factory",
+    "normalize",
+    "parse_unit",
+    "parse_quantity",
+    "parse_quantities",
+    "compile",
 )
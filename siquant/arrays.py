@@ -0,0 +1,599 @@
+"""Vectorized quantities backed by ``numpy.ndarray`` values.
+
+:class:`QuantityArray` is created automatically by
+:attr:`~siquant.units.SIUnit.factory` whenever the wrapped value is an
+``ndarray``, so the usual ``make(values, units)`` entry point applies.
+
+Numpy ufuncs are dispatched through ``__array_ufunc__``: the result units are
+resolved once per call from the operand units, operands are rescaled with a
+single multiplication where required, and the numeric work is left to numpy.
+
+Higher level numpy functions are dispatched through ``__array_function__``
+using :data:`HANDLED_FUNCTIONS`; functions which are not listed there raise
+``TypeError`` rather than silently stripping units.
+"""
+import numbers
+
+import numpy as np
+
+from .dimensions import SIDimensions
+from .exceptions import UnitMismatchError
+from .quantities import Quantity, make
+from .units import SIUnit
+
+_unity = SIUnit(1.0, SIDimensions())
+
+
+def from_buffer(buffer, units):
+    """Wrap a numeric buffer, such as an ``array.array``, without copying it.
+
+    Registered for ``array.array`` values with
+    :func:`~siquant.quantities.register_factory`.
+
+    :param buffer: An object supporting the buffer protocol.
+    :param units: The units of the values.
+    :type units: :class:`~siquant.units.SIUnit`
+    :rtype: :class:`QuantityArray`
+    """
+    dtype = getattr(buffer, "typecode", None)
+    return QuantityArray(np.frombuffer(buffer, dtype=dtype or float), units)
+
+
+def _units_of(value):
+    return value.units if isinstance(value, Quantity) else _unity
+
+
+def _value_as(value, units):
+    if isinstance(value, Quantity):
+        return value.get_as(units)
+    if not units.compatible(_unity):
+        raise UnitMismatchError(_unity, units)
+    if units.scale == 1:
+        return value
+    return 1 / units.scale * value
+
+
+def _common_units(inputs):
+    return min(value.units for value in inputs if isinstance(value, Quantity))
+
+
+def _matching(*inputs):
+    units = _common_units(inputs)
+    return tuple(_value_as(value, units) for value in inputs), units
+
+
+def _comparison(*inputs):
+    units = _common_units(inputs)
+    return tuple(_value_as(value, units) for value in inputs), None
+
+
+def _ratio(*inputs):
+    values, _ = _matching(*inputs)
+    return values, _unity
+
+
+def _angle(*inputs):
+    values, _ = _matching(*inputs)
+    return values, None
+
+
+def _dimensionless(*inputs):
+    return tuple(_value_as(value, _unity) for value in inputs), None
+
+
+def _predicate(*inputs):
+    return tuple(_strip(value) for value in inputs), None
+
+
+def _preserving(value):
+    return (value.quantity,), value.units
+
+
+def _multiply(lhs, rhs):
+    return (_strip(lhs), _strip(rhs)), _units_of(lhs) * _units_of(rhs)
+
+
+def _divide(lhs, rhs):
+    return (_strip(lhs), _strip(rhs)), _units_of(lhs) / _units_of(rhs)
+
+
+def _power(base, exponent):
+    if isinstance(exponent, Quantity):
+        exponent = exponent.get_as(_unity)
+    if not isinstance(base, Quantity):
+        return (base, exponent), None
+    exp = np.asarray(exponent)
+    if exp.ndim != 0:
+        raise TypeError("Quantity exponents must be scalars.", exponent)
+    return (base.quantity, exponent), base.units ** exp.item()
+
+
+def _exponent(exp):
+    def _handler(value):
+        return (value.quantity,), value.units ** exp
+
+    return _handler
+
+
+def _reciprocal(value):
+    return (value.quantity,), ~value.units
+
+
+def _strip(value):
+    return value.quantity if isinstance(value, Quantity) else value
+
+
+_HANDLERS = {
+    np.add: _matching,
+    np.subtract: _matching,
+    np.maximum: _matching,
+    np.minimum: _matching,
+    np.fmax: _matching,
+    np.fmin: _matching,
+    np.hypot: _matching,
+    np.fmod: _matching,
+    np.remainder: _matching,
+    np.equal: _comparison,
+    np.not_equal: _comparison,
+    np.less: _comparison,
+    np.less_equal: _comparison,
+    np.greater: _comparison,
+    np.greater_equal: _comparison,
+    np.floor_divide: _ratio,
+    np.arctan2: _angle,
+    np.negative: _preserving,
+    np.positive: _preserving,
+    np.absolute: _preserving,
+    np.fabs: _preserving,
+    np.rint: _preserving,
+    np.floor: _preserving,
+    np.ceil: _preserving,
+    np.trunc: _preserving,
+    np.conjugate: _preserving,
+    np.multiply: _multiply,
+    np.matmul: _multiply,
+    np.divide: _divide,
+    np.power: _power,
+    np.sqrt: _exponent(0.5),
+    np.cbrt: _exponent(1 / 3),
+    np.square: _exponent(2),
+    np.reciprocal: _reciprocal,
+    np.isnan: _predicate,
+    np.isinf: _predicate,
+    np.isfinite: _predicate,
+    np.signbit: _predicate,
+    np.sign: _predicate,
+}
+
+for _ufunc in (
+    np.exp,
+    np.exp2,
+    np.expm1,
+    np.log,
+    np.log2,
+    np.log10,
+    np.log1p,
+    np.sin,
+    np.cos,
+    np.tan,
+    np.arcsin,
+    np.arccos,
+    np.arctan,
+    np.sinh,
+    np.cosh,
+    np.tanh,
+    np.arcsinh,
+    np.arccosh,
+    np.arctanh,
+):
+    _HANDLERS[_ufunc] = _dimensionless
+
+#: Ufuncs which may be reduced (``np.add.reduce``, ``np.maximum.accumulate``...)
+#: while preserving the units of the operand.
+_REDUCIBLE = frozenset((np.add, np.maximum, np.minimum, np.fmax, np.fmin))
+
+
+class QuantityArray(np.lib.mixins.NDArrayOperatorsMixin, Quantity):
+    """Quantity wrapping a ``numpy.ndarray`` with vectorized unit handling.
+
+    Arithmetic operators and numpy ufuncs run as a single call on the
+    underlying array. Units are resolved once per operation following the
+    same rules as :class:`~siquant.quantities.Quantity`:
+
+    - addition, subtraction and comparison convert operands to a common unit,
+    - multiplication, division and powers combine units,
+    - transcendental functions require dimensionless operands and return
+      plain arrays,
+    - comparisons return plain boolean arrays.
+
+    Bare (unit-less) operands are treated as dimensionless.
+
+    .. note::
+
+        As with :class:`~siquant.quantities.Quantity`, creation through
+        :func:`~siquant.quantities.make` is preferred.
+
+    :param quantity: The array to be wrapped.
+    :type quantity: ``numpy.ndarray``
+    :param units: The units the array's values are expressed in.
+    :type units: :class:`~siquant.units.SIUnit`
+    """
+
+    __slots__ = ()
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if any(isinstance(out, Quantity) for out in kwargs.get("out", ())):
+            return NotImplemented
+
+        if method in ("__call__", "outer"):
+            handler = _HANDLERS.get(ufunc)
+            if handler is None:
+                return NotImplemented
+            try:
+                values, units = handler(*inputs)
+            except UnitMismatchError:
+                if ufunc is np.equal or ufunc is np.not_equal:
+                    shape = np.broadcast(*map(_strip, inputs)).shape
+                    return np.full(shape, ufunc is np.not_equal)
+                raise
+        elif method in ("reduce", "accumulate", "reduceat") and ufunc in _REDUCIBLE:
+            values = (inputs[0].quantity,) + inputs[1:]
+            units = inputs[0].units
+        else:
+            return NotImplemented
+
+        result = getattr(ufunc, method)(*values, **kwargs)
+        if units is None:
+            return result
+        return make(result, units)
+
+    def __array_function__(self, func, types, args, kwargs):
+        handler = HANDLED_FUNCTIONS.get(func)
+        if handler is None:
+            return NotImplemented
+        if not all(issubclass(t, (Quantity, np.ndarray)) for t in types):
+            return NotImplemented
+        return handler(*args, **kwargs)
+
+    __hash__ = None
+
+    # a bare zero is the identity of any units, as for scalar quantities
+    def __add__(self, other):
+        if isinstance(other, numbers.Number) and other == 0:
+            return self
+        return np.lib.mixins.NDArrayOperatorsMixin.__add__(self, other)
+
+    def __radd__(self, other):
+        if isinstance(other, numbers.Number) and other == 0:
+            return self
+        return np.lib.mixins.NDArrayOperatorsMixin.__radd__(self, other)
+
+    def __sub__(self, other):
+        if isinstance(other, numbers.Number) and other == 0:
+            return self
+        return np.lib.mixins.NDArrayOperatorsMixin.__sub__(self, other)
+
+    # quantities are immutable, in place operators rebind to new instances.
+    __iadd__ = __add__
+    __isub__ = __sub__
+    __imul__ = np.lib.mixins.NDArrayOperatorsMixin.__mul__
+    __imatmul__ = np.lib.mixins.NDArrayOperatorsMixin.__matmul__
+    __itruediv__ = np.lib.mixins.NDArrayOperatorsMixin.__truediv__
+
+    def __invert__(self):
+        return np.divide(1.0, self)
+
+
+#: Numpy functions supported on :class:`QuantityArray` mapped to their unit
+#: aware implementations.
+HANDLED_FUNCTIONS = {}
+
+
+def implements(*functions):
+    """Register an implementation of numpy functions for :class:`QuantityArray`.
+
+    The implementation receives the same arguments as the numpy function.
+
+    :param functions: The numpy functions to override.
+    :rtype: ``Callable[[Callable], Callable]``
+    """
+
+    def _decorator(implementation):
+        for function in functions:
+            HANDLED_FUNCTIONS[function] = implementation
+        return implementation
+
+    return _decorator
+
+
+def _check_out(kwargs):
+    out = kwargs.get("out")
+    if isinstance(out, Quantity):
+        raise TypeError("Quantities are immutable, 'out' must not be a quantity.")
+
+
+def _wrap_preserving(function):
+    def _preserving_function(a, *args, **kwargs):
+        _check_out(kwargs)
+        return make(function(a.quantity, *args, **kwargs), a.units)
+
+    return _preserving_function
+
+
+def _wrap_plain(function):
+    def _plain_function(a, *args, **kwargs):
+        return function(_strip(a), *args, **kwargs)
+
+    return _plain_function
+
+
+def _wrap_product(function):
+    def _product_function(*args, **kwargs):
+        _check_out(kwargs)
+        units = _unity
+        values = []
+        for arg in args:
+            if isinstance(arg, Quantity):
+                units = units * arg.units
+                arg = arg.quantity
+            values.append(arg)
+        return make(function(*values, **kwargs), units)
+
+    return _product_function
+
+
+def _wrap_squared(function):
+    def _squared_function(a, *args, **kwargs):
+        _check_out(kwargs)
+        return make(function(a.quantity, *args, **kwargs), a.units ** 2)
+
+    return _squared_function
+
+
+def _wrap_sequence(function):
+    def _sequence_function(arrays, *args, **kwargs):
+        _check_out(kwargs)
+        values, units = _matching(*arrays)
+        return make(function(values, *args, **kwargs), units)
+
+    return _sequence_function
+
+
+def _register(wrapper, *names, module=np):
+    for name in names:
+        function = getattr(module, name, None)
+        if function is not None:
+            HANDLED_FUNCTIONS[function] = wrapper(function)
+
+
+_register(
+    _wrap_preserving,
+    "sum",
+    "nansum",
+    "mean",
+    "nanmean",
+    "median",
+    "nanmedian",
+    "percentile",
+    "nanpercentile",
+    "quantile",
+    "nanquantile",
+    "std",
+    "nanstd",
+    "min",
+    "max",
+    "amin",
+    "amax",
+    "nanmin",
+    "nanmax",
+    "ptp",
+    "cumsum",
+    "nancumsum",
+    "diff",
+    "sort",
+    "round",
+    "around",
+    "reshape",
+    "ravel",
+    "transpose",
+    "swapaxes",
+    "moveaxis",
+    "squeeze",
+    "expand_dims",
+    "atleast_1d",
+    "atleast_2d",
+    "atleast_3d",
+    "broadcast_to",
+    "copy",
+    "flip",
+    "fliplr",
+    "flipud",
+    "roll",
+    "take",
+    "repeat",
+    "tile",
+    "diagonal",
+    "trace",
+    "zeros_like",
+    "ones_like",
+    "empty_like",
+)
+_register(_wrap_preserving, "norm", module=np.linalg)
+_register(
+    _wrap_plain,
+    "shape",
+    "ndim",
+    "size",
+    "argmin",
+    "argmax",
+    "nanargmin",
+    "nanargmax",
+    "argsort",
+    "nonzero",
+    "flatnonzero",
+    "count_nonzero",
+)
+_register(_wrap_squared, "var", "nanvar")
+_register(
+    _wrap_product,
+    "dot",
+    "vdot",
+    "inner",
+    "outer",
+    "tensordot",
+    "kron",
+    "cross",
+    "einsum",
+)
+_register(_wrap_product, "multi_dot", module=np.linalg)
+_register(
+    _wrap_sequence,
+    "concatenate",
+    "stack",
+    "vstack",
+    "hstack",
+    "dstack",
+    "column_stack",
+)
+
+
+@implements(np.average)
+def _average(a, axis=None, weights=None, returned=False, **kwargs):
+    result = np.average(
+        _strip(a), axis=axis, weights=_strip(weights), returned=returned, **kwargs
+    )
+    units = _units_of(a)
+    if returned:
+        return make(result[0], units), result[1]
+    return make(result, units)
+
+
+@implements(np.clip)
+def _clip(a, a_min, a_max, *args, **kwargs):
+    _check_out(kwargs)
+    a_min = None if a_min is None else _value_as(a_min, a.units)
+    a_max = None if a_max is None else _value_as(a_max, a.units)
+    return make(np.clip(a.quantity, a_min, a_max, *args, **kwargs), a.units)
+
+
+@implements(np.full_like)
+def _full_like(a, fill_value, *args, **kwargs):
+    units = _units_of(a)
+    fill_value = _value_as(fill_value, units)
+    return make(np.full_like(_strip(a), fill_value, *args, **kwargs), units)
+
+
+@implements(np.where)
+def _where(condition, *choices):
+    if not choices:
+        return np.where(_strip(condition))
+    values, units = _matching(*choices)
+    return make(np.where(_strip(condition), *values), units)
+
+
+@implements(np.interp)
+def _interp(x, xp, fp, left=None, right=None, period=None):
+    x_units = _units_of(xp)
+    fp_units = _units_of(fp)
+    if left is not None:
+        left = _value_as(left, fp_units)
+    if right is not None:
+        right = _value_as(right, fp_units)
+    if period is not None:
+        period = _value_as(period, x_units)
+    result = np.interp(
+        _value_as(x, x_units),
+        _strip(xp),
+        _strip(fp),
+        left=left,
+        right=right,
+        period=period,
+    )
+    if isinstance(fp, Quantity):
+        return make(result, fp_units)
+    return result
+
+
+@implements(np.searchsorted)
+def _searchsorted(a, v, *args, **kwargs):
+    return np.searchsorted(a.quantity, _value_as(v, a.units), *args, **kwargs)
+
+
+@implements(np.linspace)
+def _linspace(start, stop, *args, **kwargs):
+    (start, stop), units = _matching(start, stop)
+    result = np.linspace(start, stop, *args, **kwargs)
+    if kwargs.get("retstep"):
+        return make(result[0], units), make(result[1], units)
+    return make(result, units)
+
+
+@implements(np.linalg.inv)
+def _inv(a):
+    return make(np.linalg.inv(a.quantity), ~a.units)
+
+
+@implements(np.linalg.det)
+def _det(a):
+    return make(np.linalg.det(a.quantity), a.units ** np.shape(a.quantity)[-1])
+
+
+@implements(np.linalg.solve)
+def _solve(a, b):
+    return make(np.linalg.solve(_strip(a), _strip(b)), _units_of(b) / _units_of(a))
+
+
+def _trapezoid(function):
+    def _trapezoid_function(y, x=None, dx=1.0, axis=-1):
+        if x is not None:
+            units = _units_of(y) * _units_of(x)
+            result = function(_strip(y), x=_strip(x), axis=axis)
+        else:
+            units = _units_of(y) * _units_of(dx)
+            result = function(_strip(y), dx=_strip(dx), axis=axis)
+        return make(result, units)
+
+    return _trapezoid_function
+
+
+_register(_trapezoid, "trapezoid", "trapz")
+
+
+def isclose(a, b, rtol=1e-9, atol=1e-6):
+    """Compare scalar or array quantities elementwise, converting only once.
+
+    Matches :meth:`~siquant.quantities.Quantity.approx`: values are compared
+    in the units of ``a``, within
+    ``max(rtol * max(abs(a), abs(b), 1), atol)``. Quantities of different
+    dimensions are never close.
+
+    :param a: The quantity whose units are used for the comparison.
+    :type a: :class:`~siquant.quantities.Quantity`
+    :param b: The quantity to compare with.
+    :type b: :class:`~siquant.quantities.Quantity`
+    :param rtol: The relative tolerance.
+    :type rtol: ``float``
+    :param atol: The absolute tolerance, a number in the units of ``a`` or a
+        quantity.
+    :type atol: ``Union[float, Quantity]``
+    :raises: :class:`~siquant.exceptions.UnitMismatchError` if ``atol`` is
+        of different dimensions.
+    :rtype: ``numpy.ndarray`` of ``bool``
+    """
+    units = a.units
+    a = np.asarray(a.quantity)
+    if isinstance(atol, Quantity):
+        atol = atol.get_as(units)
+    if not units.compatible(b.units):
+        return np.zeros(np.broadcast(a, np.asarray(b.quantity)).shape, dtype=bool)
+    b = np.asarray(b.get_as(units))
+    scale = np.maximum(np.maximum(np.abs(a), np.abs(b)), 1.0)
+    return np.abs(b - a) <= np.maximum(rtol * scale, atol)
+
+
+def allclose(a, b, rtol=1e-9, atol=1e-6):
+    """Check whether quantities are close everywhere, see :func:`isclose`.
+
+    :rtype: ``bool``
+    """
+    return bool(np.all(isclose(a, b, rtol=rtol, atol=atol)))
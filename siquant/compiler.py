@@ -0,0 +1,399 @@
+"""Compile quantity formulas into functions of plain numbers.
+
+:func:`compile` traces a function once over symbolic quantities expressed in
+fixed units. The units of the result and every scale factor are resolved
+while tracing, constant factors are folded together, and what remains is
+generated as a plain Python function which works on floats and ndarrays
+alike.
+
+.. code-block:: python
+
+    def utilization(moment, section_modulus, yield_stress):
+        return moment / (0.9 * section_modulus * yield_stress)
+
+    check = compile(
+        utilization,
+        moment=si.kilonewtons * si.meters,
+        section_modulus=si.millimeters ** 3,
+        yield_stress=si.megapascals,
+    )
+    check(120.0, 1.2e6, 345.0)
+
+Formulas are traced, not interpreted: they may only use arithmetic, ``abs``
+and comparisons on their inputs, and must not branch on them.
+"""
+import builtins
+import math
+
+from inspect import Parameter, signature
+
+from .quantities import Quantity, make
+from .units import SIUnit
+from .util import immutable
+
+_PRECEDENCE = {"**": 3, "neg": 2, "*": 1, "/": 1, "+": 0, "-": 0}
+_COMPARISONS = ("<", "<=", ">", ">=", "==", "!=")
+
+
+class Expression:
+    """A node of a traced formula.
+
+    :ivar op: The operation, ``"const"`` and ``"var"`` for leaves.
+    :vartype op: ``str``
+    :ivar args: The operands, the value of constants or the name of variables.
+    :vartype args: ``tuple``
+    """
+
+    __slots__ = ("op", "args")
+
+    def __init__(self, op, *args):
+        self.op = op
+        self.args = args
+
+    def __repr__(self):
+        return "Expression(%r, %s)" % (self.op, ", ".join(map(repr, self.args)))
+
+    def __bool__(self):
+        raise TypeError("Traced formulas can't branch on their inputs.")
+
+    __hash__ = object.__hash__
+
+    def __add__(self, other):
+        return _binary("+", self, other)
+
+    def __radd__(self, other):
+        return _binary("+", other, self)
+
+    def __sub__(self, other):
+        return _binary("-", self, other)
+
+    def __rsub__(self, other):
+        return _binary("-", other, self)
+
+    def __mul__(self, other):
+        return _binary("*", self, other)
+
+    def __rmul__(self, other):
+        return _binary("*", other, self)
+
+    def __truediv__(self, other):
+        return _binary("/", self, other)
+
+    def __rtruediv__(self, other):
+        return _binary("/", other, self)
+
+    def __pow__(self, other):
+        return _binary("**", self, other)
+
+    def __rpow__(self, other):
+        return _binary("**", other, self)
+
+    def __neg__(self):
+        if self.op == "const":
+            return Expression("const", -self.args[0])
+        if self.op == "neg":
+            return self.args[0]
+        return Expression("neg", self)
+
+    def __abs__(self):
+        if self.op == "const":
+            return Expression("const", abs(self.args[0]))
+        return Expression("abs", self)
+
+    def __lt__(self, other):
+        return _binary("<", self, other)
+
+    def __le__(self, other):
+        return _binary("<=", self, other)
+
+    def __gt__(self, other):
+        return _binary(">", self, other)
+
+    def __ge__(self, other):
+        return _binary(">=", self, other)
+
+    def __eq__(self, other):
+        return _binary("==", self, other)
+
+    def __ne__(self, other):
+        return _binary("!=", self, other)
+
+
+def _constant(value):
+    if isinstance(value, Expression):
+        return value
+    return Expression("const", value)
+
+
+_FOLD = {
+    "+": lambda a, b: a + b,
+    "-": lambda a, b: a - b,
+    "*": lambda a, b: a * b,
+    "/": lambda a, b: a / b,
+    "**": lambda a, b: a ** b,
+}
+
+
+def _is_const(node, value=None):
+    if node.op != "const":
+        return False
+    # only scalars are folded, constant arrays are left alone
+    return type(node.args[0]) in (int, float) and (
+        value is None or node.args[0] == value
+    )
+
+
+def _binary(op, lhs, rhs):
+    # quantities and units fold their units into the traced quantity
+    if isinstance(lhs, (Quantity, SIUnit)) or isinstance(rhs, (Quantity, SIUnit)):
+        return NotImplemented
+    lhs, rhs = _constant(lhs), _constant(rhs)
+    if op in _FOLD and _is_const(lhs) and _is_const(rhs):
+        return Expression("const", _FOLD[op](lhs.args[0], rhs.args[0]))
+    if op == "*":
+        if _is_const(rhs):
+            lhs, rhs = rhs, lhs
+        if _is_const(lhs, 1):
+            return rhs
+        if _is_const(lhs) and rhs.op == "*" and _is_const(rhs.args[0]):
+            # combine scale factors: a * (b * x) -> (a * b) * x
+            factor = lhs.args[0] * rhs.args[0].args[0]
+            return _binary("*", factor, rhs.args[1])
+    elif op == "/":
+        if _is_const(rhs, 1):
+            return lhs
+    elif op == "+" or op == "-":
+        if _is_const(rhs, 0):
+            return lhs
+        if op == "+" and _is_const(lhs, 0):
+            return rhs
+    elif op == "**" and _is_const(rhs, 1):
+        return lhs
+    return Expression(op, lhs, rhs)
+
+
+class _Generator:
+    def __init__(self, roots):
+        self.lines = []
+        self.names = {}
+        self.namespace = {}
+        self.references = {}
+        for root in roots:
+            self.count(root)
+
+    def count(self, node):
+        seen = id(node) in self.references
+        self.references[id(node)] = self.references.get(id(node), 0) + 1
+        if not seen and node.op not in ("const", "var"):
+            for arg in node.args:
+                self.count(arg)
+
+    def constant(self, value):
+        if type(value) in (int, float) and math.isfinite(value):
+            return repr(value)
+        name = "_c%d" % len(self.namespace)
+        self.namespace[name] = value
+        return name
+
+    def emit(self, node, precedence=-1):
+        if id(node) in self.names:
+            return self.names[id(node)]
+        if node.op == "var":
+            return node.args[0]
+        if node.op == "const":
+            text = self.constant(node.args[0])
+            own = _PRECEDENCE["neg"] if text.startswith("-") else 4
+        elif node.op == "abs":
+            text, own = "abs(%s)" % self.emit(node.args[0]), 4
+        elif node.op == "neg":
+            own = _PRECEDENCE["neg"]
+            text = "-%s" % self.emit(node.args[0], own)
+        elif node.op in _COMPARISONS:
+            own = -1
+            text = "%s %s %s" % (
+                self.emit(node.args[0], 0),
+                node.op,
+                self.emit(node.args[1], 0),
+            )
+        else:
+            own = _PRECEDENCE[node.op]
+            # left associative, except for the right associative power
+            left, right = (own, own + 1) if node.op != "**" else (own + 1, own)
+            text = "%s %s %s" % (
+                self.emit(node.args[0], left),
+                node.op,
+                self.emit(node.args[1], right),
+            )
+        if self.references[id(node)] > 1 and node.op != "const":
+            name = "_t%d" % len(self.names)
+            self.lines.append("    %s = %s" % (name, text))
+            self.names[id(node)] = name
+            return name
+        if own < precedence:
+            return "(%s)" % text
+        return text
+
+
+def _generate(roots, names, keyword_only=()):
+    generator = _Generator(roots)
+    returned = ", ".join(generator.emit(root) for root in roots)
+    if len(roots) > 1:
+        returned = "(%s)" % returned
+    if keyword_only:
+        names = list(names) + ["*"] + list(keyword_only)
+    lines = ["def _formula(%s):" % ", ".join(names)]
+    lines.extend(generator.lines)
+    lines.append("    return %s" % returned)
+    return "\n".join(lines) + "\n", generator.namespace
+
+
+def _define(source, namespace, name):
+    namespace = dict(namespace)
+    exec(builtins.compile(source, "<compiled %s>" % name, "exec"), namespace)
+    function = namespace["_formula"]
+    function.__name__ = function.__qualname__ = name
+    return function
+
+
+@immutable
+class CompiledFormula:
+    """A formula compiled for fixed input units, see :func:`compile`.
+
+    :ivar function: The generated function of plain numbers, the fastest way
+        to evaluate the formula.
+    :vartype function: ``Callable``
+    :ivar input_units: The units each argument is expressed in, by name,
+        ``None`` for dimensionless arguments.
+    :vartype input_units: ``Dict[str, Optional[SIUnit]]``
+    :ivar units: The units of the result, ``None`` for a plain result, or a
+        tuple of those for formulas returning tuples.
+    :vartype units: :class:`~siquant.units.SIUnit`
+    :ivar source: The generated source code.
+    :vartype source: ``str``
+    """
+
+    __slots__ = ("function", "input_units", "units", "source", "_signature")
+
+    def __init__(self, function, input_units, units, source):
+        super().__setattr__("function", function)
+        super().__setattr__("input_units", input_units)
+        super().__setattr__("units", units)
+        super().__setattr__("source", source)
+        super().__setattr__("_signature", signature(function))
+
+    def __call__(self, *args, **kwargs):
+        """Evaluate the formula on values expressed in the input units.
+
+        :rtype: ``_T``
+        """
+        return self.function(*args, **kwargs)
+
+    def evaluate(self, *quantities, **kwargs):
+        """Evaluate the formula on quantities in any compatible units.
+
+        Arguments are bound as for the traced function, defaults included.
+
+        :param quantities: The arguments, in order.
+        :raises: ``TypeError`` for arguments the function doesn't accept.
+        :raises: :class:`~siquant.exceptions.UnitMismatchError` for arguments
+            of the wrong dimensions.
+        :rtype: ``_Q`` = :class:`~siquant.quantities.Quantity`
+        """
+        bound = self._signature.bind(*quantities, **kwargs)
+        arguments = bound.arguments
+        for name, value in arguments.items():
+            units = self.input_units[name]
+            if units is not None and isinstance(value, Quantity):
+                arguments[name] = value.get_as(units)
+        result = self.function(*bound.args, **bound.kwargs)
+        if isinstance(self.units, tuple):
+            return tuple(_attach(r, u) for r, u in zip(result, self.units))
+        return _attach(result, self.units)
+
+    def __repr__(self):
+        return "CompiledFormula(%s)" % ", ".join(
+            "%s=%r" % item for item in self.input_units.items()
+        )
+
+
+def _attach(value, units):
+    return value if units is None else make(value, units)
+
+
+def _split(result):
+    if isinstance(result, Quantity):
+        return _constant(result.quantity), result.units
+    return _constant(result), None
+
+
+def compile(fn, **input_units):
+    """Trace a formula once and compile it into a function of plain numbers.
+
+    :param fn: The formula, taking quantities and dimensionless numbers.
+    :type fn: ``Callable``
+    :param input_units: The units of each quantity argument, by name.
+        Arguments without units are treated as dimensionless numbers.
+    :type input_units: :class:`~siquant.units.SIUnit`
+    :raises: ``TypeError`` for unknown argument names, or formulas which
+        can't be traced.
+    :rtype: :class:`CompiledFormula`
+    """
+    parameters = signature(fn).parameters
+    names = list(parameters)
+    unknown = set(input_units) - set(names)
+    if unknown:
+        raise TypeError(
+            "%s() has no parameters %s" % (fn.__name__, ", ".join(sorted(unknown)))
+        )
+    variadic = [
+        name
+        for name, parameter in parameters.items()
+        if parameter.kind in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+    ]
+    if variadic:
+        raise TypeError("can't trace variadic parameters %s" % ", ".join(variadic))
+    units = {name: input_units.get(name) for name in names}
+    args = {
+        name: Expression("var", name)
+        if units[name] is None
+        else Quantity(Expression("var", name), units[name])
+        for name in names
+    }
+    keyword_only = [
+        name
+        for name, parameter in parameters.items()
+        if parameter.kind is Parameter.KEYWORD_ONLY
+    ]
+    positional = [name for name in names if name not in keyword_only]
+
+    result = fn(
+        *[args[name] for name in positional],
+        **{name: args[name] for name in keyword_only}
+    )
+    if isinstance(result, (tuple, list)):
+        roots, result_units = zip(*map(_split, result))
+    else:
+        root, result_units = _split(result)
+        roots = (root,)
+
+    source, namespace = _generate(roots, positional, keyword_only)
+    function = _define(source, namespace, fn.__name__)
+    # defaults of quantity arguments are kept as values in the input units
+    defaults = {
+        name: _default(parameter.default, units[name])
+        for name, parameter in parameters.items()
+        if parameter.default is not Parameter.empty
+    }
+    function.__defaults__ = (
+        tuple(defaults[name] for name in positional if name in defaults) or None
+    )
+    function.__kwdefaults__ = {
+        name: defaults[name] for name in keyword_only if name in defaults
+    } or None
+    return CompiledFormula(function, units, result_units, source)
+
+
+def _default(value, units):
+    if units is not None and isinstance(value, Quantity):
+        return value.get_as(units)
+    return value
@@ -0,0 +1,101 @@
+from array import array
+
+from .exceptions import UnitMismatchError
+from .util import immutable
+
+
+@immutable
+class Converter:
+    """A precompiled conversion of values between two compatible units.
+
+    Dimensions are validated and the scaling factor computed once, so applying
+    the converter is a single multiplication per value.
+
+    .. note::
+
+        Converters are normally obtained from
+        :meth:`~siquant.units.SIUnit.converter_to`, which caches them.
+
+    :ivar factor: The multiplier taking values in ``from_units`` to ``to_units``.
+    :vartype factor: ``float``
+
+    :param from_units: The units values are expressed in.
+    :type from_units: :class:`~siquant.units.SIUnit`
+    :param to_units: The units to express values in.
+    :type to_units: :class:`~siquant.units.SIUnit`
+    :raises: :class:`~siquant.exceptions.UnitMismatchError` if the units are
+        of different dimensions.
+    """
+
+    __slots__ = ("from_units", "to_units", "factor")
+
+    def __init__(self, from_units, to_units):
+        if not from_units.compatible(to_units):
+            raise UnitMismatchError(from_units, to_units)
+        super().__setattr__("from_units", from_units)
+        super().__setattr__("to_units", to_units)
+        super().__setattr__("factor", from_units.scale / to_units.scale)
+
+    def __call__(self, value):
+        """Convert a single value, or an object supporting scalar multiplication.
+
+        :param value: The value expressed in ``from_units``.
+        :rtype: ``_T``
+        """
+        if self.factor == 1:
+            return value
+        return self.factor * value
+
+    def values(self, iterable):
+        """Convert every value of an iterable.
+
+        :param iterable: The values expressed in ``from_units``.
+        :type iterable: ``Iterable[numbers.Real]``
+        :rtype: ``list``
+        """
+        factor = self.factor
+        if factor == 1:
+            return list(iterable)
+        return [factor * value for value in iterable]
+
+    def buffer(self, data):
+        """Convert a one dimensional numeric buffer, such as an ``array.array``.
+
+        :param data: Any object supporting the buffer protocol.
+        :rtype: ``array.array`` of typecode ``'d'``
+        """
+        return array("d", self.values(memoryview(data).tolist()))
+
+    def array(self, values, out=None):
+        """Convert a ``numpy.ndarray`` with a single vectorized multiplication.
+
+        :param values: The array expressed in ``from_units``.
+        :type values: ``numpy.ndarray``
+        :param out: Optional array to write the result to, may be ``values``.
+        :type out: ``numpy.ndarray``
+        :rtype: ``numpy.ndarray``
+        """
+        import numpy as np
+
+        return np.multiply(values, self.factor, out=out)
+
+    def quantity(self, quantity):
+        """Extract the value of a quantity expressed in ``to_units``.
+
+        :param quantity: A quantity expressed in ``from_units``.
+        :type quantity: :class:`~siquant.quantities.Quantity`
+        :rtype: ``_T``
+        """
+        if quantity.units is not self.from_units:
+            return quantity.get_as(self.to_units)
+        return self(quantity.quantity)
+
+    def inverse(self):
+        """Get the converter performing the opposite conversion.
+
+        :rtype: :class:`Converter`
+        """
+        return self.to_units.converter_to(self.from_units)
+
+    def __repr__(self):
+        return "Converter(%r, %r)" % (self.from_units, self.to_units)
@@ -1,5 +1,16 @@
 abbreviations = ("kg", "m", "s", "k", "a", "mol", "cd")
 
+#: Packed exponents are stored as integer multiples of 1 / DENOMINATOR, which
+#: represents every fraction with a denominator of up to 10 exactly.
+DENOMINATOR = 2520
+
+_FIELD_BITS = 24
+_FIELD_MASK = (1 << _FIELD_BITS) - 1
+_FIELD_LIMIT = 1 << (_FIELD_BITS - 1)
+
+_packed = {}
+_unpacked = {}
+
 
 def SIDimensions(kg=0, m=0, s=0, k=0, a=0, mol=0, cd=0):
     """Create a dimensionality tuple with base si units of provided exponents.
@@ -83,6 +94,61 @@ def dim_pow(dims, exp):
     )
 
 
+def dim_pack(dims):
+    """Encode a dimensionality tuple as a single integer.
+
+    Each exponent occupies a signed fixed-point field of the result, so
+    multiplying or dividing dimensions is an integer addition or subtraction
+    of their packed values, and comparing them is an integer comparison.
+
+    :param dims: The dimensions to pack.
+    :type dims: ``tuple``
+    :raises: ``ValueError`` if an exponent is not a multiple of
+        1 / :data:`DENOMINATOR` or its magnitude exceeds 3328.
+    :rtype: ``int``
+    """
+    try:
+        return _packed[dims]
+    except KeyError:
+        pass
+    packed = 0
+    for power in reversed(dims):
+        scaled = power * DENOMINATOR
+        field = int(round(scaled))
+        if abs(scaled - field) > 1e-6 or not -_FIELD_LIMIT < field < _FIELD_LIMIT:
+            raise ValueError("Dimension exponent can't be packed: %r" % power, dims)
+        packed = (packed << _FIELD_BITS) + field
+    _packed[dims] = packed
+    return packed
+
+
+def dim_unpack(packed):
+    """Decode an integer created by :func:`dim_pack` into a dimensionality tuple.
+
+    :param packed: The packed dimensions.
+    :type packed: ``int``
+    :rtype: ``tuple``
+    """
+    try:
+        return _unpacked[packed]
+    except KeyError:
+        pass
+    powers = []
+    remainder = packed
+    for _ in abbreviations:
+        field = remainder & _FIELD_MASK
+        if field >= _FIELD_LIMIT:
+            field -= 1 << _FIELD_BITS
+        remainder = (remainder - field) >> _FIELD_BITS
+        if field % DENOMINATOR:
+            powers.append(field / DENOMINATOR)
+        else:
+            powers.append(field // DENOMINATOR)
+    dims = tuple(powers)
+    _unpacked[packed] = dims
+    return dims
+
+
 def dim_str(dims):
     """Express dimensions as a human readable string.
 
@@ -8,6 +8,35 @@ class UnitMismatchError(ValueError):
         super().__init__("Unit Mismatch: %s, %s" % (u1, u2), u1, u2)
 
 
+class UnitParseError(ValueError):
+    def __init__(self, text, reason):
+        super().__init__(
+            "Can't parse units '{text}': {reason}".format(text=text, reason=reason),
+            text,
+        )
+
+
+class KernelError(ValueError):
+    def __init__(self, kernel, reason):
+        super().__init__(
+            "Can't strip units from '{kernel}': {reason}".format(
+                kernel=kernel, reason=reason
+            ),
+            kernel,
+        )
+
+
+class SchemaError(ValueError):
+    def __init__(self, errors):
+        super().__init__(
+            "{count} invalid field(s): {first}".format(
+                count=len(errors), first="; ".join(map(str, errors[:3]))
+            ),
+            errors,
+        )
+        self.errors = errors
+
+
 class ImmutabilityError(AttributeError):
     def __init__(self, instance, name):
         super().__init__(
@@ -0,0 +1,275 @@
+"""Quantities stored as exact integer counts of a fixed unit.
+
+A :class:`FixedQuantity` holds a scalar ``int`` number of its units, e.g. a
+count of micrometers or millijoules, within the range of a signed 64 bit
+integer. Arithmetic between counts is exact, conversions round once using
+exact rational factors derived from the unit scales, so accumulating long
+series never drifts, and any result outside the int64 range raises
+``OverflowError``.
+
+.. code-block:: python
+
+    position = fixed(0, si.micrometers)
+    for step in steps:
+        position += step  # rounded once to whole micrometers
+    position.get_as(si.meters)
+"""
+from fractions import Fraction
+import numbers
+
+from .exceptions import UnitMismatchError, unexpected_type_error
+from .quantities import Quantity
+from .units import SIUnit
+
+INT64_MIN = -(2 ** 63)
+INT64_MAX = 2 ** 63 - 1
+
+
+# {(id(from_units), id(to_units)): (from_units, to_units, ratio)}, interned
+# units share an id
+_ratios = {}
+
+
+class _Ratio:
+    __slots__ = ("numerator", "denominator", "factor", "exact")
+
+    def __init__(self, exact):
+        self.numerator = exact.numerator
+        self.denominator = exact.denominator
+        self.factor = float(exact)
+        self.exact = exact
+
+
+def _ratio(from_units, to_units):
+    # the exact factor taking counts of from_units to counts of to_units,
+    # from the shortest decimal form of the (float) scales
+    entry = _ratios.get((id(from_units), id(to_units)))
+    if entry is not None and entry[0] is from_units and entry[1] is to_units:
+        return entry[2]
+    if not from_units.compatible(to_units):
+        raise UnitMismatchError(from_units, to_units)
+    ratio = _Ratio(Fraction(repr(from_units.scale)) / Fraction(repr(to_units.scale)))
+    _ratios[id(from_units), id(to_units)] = (from_units, to_units, ratio)
+    return ratio
+
+
+def _exact(value):
+    # floats are taken at their shortest decimal form, 0.1 is one tenth
+    if isinstance(value, float):
+        return Fraction(repr(value))
+    return Fraction(value)
+
+
+def _rounded(numerator, denominator):
+    # numerator / denominator rounded half to even, in integers
+    count, remainder = divmod(numerator, denominator)
+    twice = 2 * remainder
+    if twice > denominator or (twice == denominator and count % 2):
+        count += 1
+    return count
+
+
+def _checked(count):
+    if not INT64_MIN <= count <= INT64_MAX:
+        raise OverflowError("%d does not fit in 64 bits." % count)
+    return count
+
+
+def _fixed(count, units):
+    quantity = object.__new__(FixedQuantity)
+    object.__setattr__(quantity, "quantity", _checked(count))
+    object.__setattr__(quantity, "units", units)
+    return quantity
+
+
+def _counts(quantity, units):
+    # the whole number of units in a quantity, rounded half to even
+    value = quantity.quantity
+    if quantity.units is units and isinstance(value, int):
+        return value
+    ratio = _ratio(quantity.units, units)
+    if isinstance(value, int):
+        return _rounded(value * ratio.numerator, ratio.denominator)
+    scaled = value * ratio.factor
+    count = round(scaled)
+    # the float product is within a few ulps of the exact one, so its
+    # rounding is only in doubt close to a tie
+    if abs(scaled - count) < 0.5 - 1e-9 - 1e-14 * abs(scaled):
+        return count
+    return round(_exact(value) * ratio.exact)
+
+
+class FixedQuantity(Quantity):
+    """Quantity storing an integer count of its units.
+
+    .. note::
+
+        Create fixed quantities with :func:`fixed`, which rounds and range
+        checks the count.
+
+    Sums and differences are counted in the units of the left operand, the
+    right operand being rounded to a whole count of them first. Operations
+    which can't keep an integer count, such as multiplication by a float,
+    return a plain :class:`~siquant.quantities.Quantity`.
+
+    :param quantity: The count of units.
+    :type quantity: ``int``
+    :param units: The units counted.
+    :type units: :class:`~siquant.units.SIUnit`
+    :raises: ``OverflowError`` if the count doesn't fit in 64 bits.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, quantity, units):
+        if not isinstance(quantity, numbers.Integral):
+            raise unexpected_type_error("quantity", int, quantity)
+        if not isinstance(units, SIUnit):
+            raise unexpected_type_error("units", SIUnit, units)
+        super().__init__(_checked(int(quantity)), units)
+
+    def get_as(self, units):
+        """Extract the value expressed in units, with a single rounding.
+
+        :param units: The units to express the value in.
+        :type units: :class:`~siquant.units.SIUnit`
+        :rtype: ``int`` in the units counted, ``float`` otherwise.
+        """
+        if units is self.units or units == self.units:
+            return self.quantity
+        ratio = _ratio(self.units, units)
+        return float(Fraction(self.quantity * ratio.numerator, ratio.denominator))
+
+    def exact_as(self, units):
+        """Extract the value expressed in units, without rounding.
+
+        :param units: The units to express the value in.
+        :type units: :class:`~siquant.units.SIUnit`
+        :rtype: ``fractions.Fraction``
+        """
+        return self.quantity * _ratio(self.units, units).exact
+
+    def cvt_to(self, units):
+        """Count the quantity in other units, see :func:`fixed`.
+
+        :rtype: :class:`FixedQuantity`
+        """
+        return fixed(self, units)
+
+    def __add__(self, other):
+        if isinstance(other, Quantity):
+            return _fixed(self.quantity + _counts(other, self.units), self.units)
+        if other == 0:
+            return self
+        return NotImplemented
+
+    __iadd__ = __add__
+
+    def __radd__(self, other):
+        if other == 0:
+            return self
+        return NotImplemented
+
+    def __sub__(self, other):
+        if isinstance(other, Quantity):
+            return _fixed(self.quantity - _counts(other, self.units), self.units)
+        if other == 0:
+            return self
+        return NotImplemented
+
+    __isub__ = __sub__
+
+    def __neg__(self):
+        return _fixed(-self.quantity, self.units)
+
+    def __abs__(self):
+        return _fixed(abs(self.quantity), self.units)
+
+    def __mul__(self, rhs):
+        if isinstance(rhs, numbers.Integral):
+            return _fixed(self.quantity * int(rhs), self.units)
+        return super().__mul__(rhs)
+
+    __imul__ = __mul__
+
+    def __rmul__(self, lhs):
+        if isinstance(lhs, numbers.Integral):
+            return _fixed(int(lhs) * self.quantity, self.units)
+        return super().__rmul__(lhs)
+
+    def __floordiv__(self, rhs):
+        if isinstance(rhs, numbers.Integral):
+            return _fixed(self.quantity // int(rhs), self.units)
+        if isinstance(rhs, Quantity) and rhs.units.compatible(self.units):
+            return self.exact_as(rhs.units) // _exact(rhs.quantity)
+        return NotImplemented
+
+    def __mod__(self, rhs):
+        if isinstance(rhs, Quantity):
+            return _fixed(self.quantity % _counts(rhs, self.units), self.units)
+        return NotImplemented
+
+    def __eq__(self, other):
+        if isinstance(other, Quantity):
+            if not self.units.compatible(other.units):
+                return False
+            if isinstance(other, FixedQuantity) and other.units is self.units:
+                return self.quantity == other.quantity
+            return self.exact_as(other.units) == _exact(other.quantity)
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __lt__(self, other):
+        if isinstance(other, Quantity):
+            if isinstance(other, FixedQuantity) and other.units is self.units:
+                return self.quantity < other.quantity
+            return self.exact_as(other.units) < _exact(other.quantity)
+        return NotImplemented
+
+    # as for plain quantities, so a count hashes as the same number of units
+    __hash__ = Quantity.__hash__
+
+    def __int__(self):
+        return self.quantity
+
+
+def fixed(quantity, units):
+    """Count a quantity in whole units, rounding half to even.
+
+    The count is computed exactly from the quantity's value and the unit
+    scales before rounding once, so ``fixed(0.1 * si.meters, si.millimeters)``
+    is exactly 100 millimeters.
+
+    :param quantity: The quantity to count, or a number of ``units``.
+    :type quantity: ``Union[Quantity, numbers.Real]``
+    :param units: The units to count.
+    :type units: :class:`~siquant.units.SIUnit`
+    :raises: :class:`~siquant.exceptions.UnitMismatchError` if the quantity
+        is of different dimensions.
+    :raises: ``OverflowError`` if the count doesn't fit in 64 bits.
+    :rtype: :class:`FixedQuantity`
+    """
+    if not isinstance(units, SIUnit):
+        raise unexpected_type_error("units", SIUnit, units)
+    if isinstance(quantity, Quantity):
+        return _fixed(_counts(quantity, units), units)
+    return _fixed(round(_exact(quantity)), units)
+
+
+def accumulate(quantities, units):
+    """Add quantities exactly, as a count of units.
+
+    Every quantity is counted in ``units`` first, with a single rounding
+    each; the counts are then added without any rounding.
+
+    :param quantities: The quantities to add.
+    :type quantities: ``Iterable[Quantity]``
+    :param units: The units to count.
+    :type units: :class:`~siquant.units.SIUnit`
+    :raises: ``OverflowError`` if the total doesn't fit in 64 bits.
+    :rtype: :class:`FixedQuantity`
+    """
+    return _fixed(sum(_counts(quantity, units) for quantity in quantities), units)
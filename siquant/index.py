@@ -0,0 +1,180 @@
+"""An index of quantities supporting range and nearest neighbour queries.
+
+Entries are bucketed by dimensions, and every bucket is kept sorted by the
+value of its quantities in base SI units, so queries are binary searches
+which never convert quantities pairwise.
+
+.. code-block:: python
+
+    index = QuantityIndex((member.stress, member) for member in members)
+    for stress, member in index.range(100 * si.megapascals, 250 * si.megapascals):
+        ...
+"""
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+
+from .dimensions import dim_pack
+from .exceptions import UnitMismatchError, unexpected_type_error
+from .quantities import Quantity, _base
+
+
+def _entry(item):
+    if isinstance(item, Quantity):
+        return item, None
+    quantity, value = item
+    if not isinstance(quantity, Quantity):
+        raise unexpected_type_error("quantity", Quantity, quantity)
+    return quantity, value
+
+
+class _Bucket:
+    __slots__ = ("keys", "entries")
+
+    def __init__(self):
+        self.keys = []
+        self.entries = []
+
+
+class QuantityIndex:
+    """A collection of quantities, each with an optional associated value.
+
+    :param items: Quantities, or ``(quantity, value)`` pairs.
+    :type items: ``Iterable``
+    """
+
+    __slots__ = ("_buckets", "_size")
+
+    def __init__(self, items=()):
+        self._buckets = {}
+        self._size = 0
+        self.update(items)
+
+    def _bucket(self, quantity, create=False):
+        dims = quantity.units.packed_dimensions
+        bucket = self._buckets.get(dims)
+        if bucket is None and create:
+            bucket = self._buckets[dims] = _Bucket()
+        return bucket
+
+    def add(self, quantity, value=None):
+        """Add a quantity, keeping its bucket sorted.
+
+        :param quantity: The quantity to index.
+        :type quantity: :class:`~siquant.quantities.Quantity`
+        :param value: The value associated with the quantity.
+        """
+        if not isinstance(quantity, Quantity):
+            raise unexpected_type_error("quantity", Quantity, quantity)
+        bucket = self._bucket(quantity, create=True)
+        key = _base(quantity)
+        position = bisect_right(bucket.keys, key)
+        bucket.keys.insert(position, key)
+        bucket.entries.insert(position, (quantity, value))
+        self._size += 1
+
+    def update(self, items):
+        """Add many quantities, sorting every bucket once.
+
+        :param items: Quantities, or ``(quantity, value)`` pairs.
+        :type items: ``Iterable``
+        """
+        touched = {}
+        for quantity, value in map(_entry, items):
+            bucket = self._bucket(quantity, create=True)
+            bucket.keys.append(_base(quantity))
+            bucket.entries.append((quantity, value))
+            touched[id(bucket)] = bucket
+            self._size += 1
+        for bucket in touched.values():
+            ordered = sorted(zip(bucket.keys, bucket.entries), key=itemgetter(0))
+            bucket.keys = [key for key, _ in ordered]
+            bucket.entries = [entry for _, entry in ordered]
+
+    def remove(self, quantity):
+        """Remove an entry whose quantity equals ``quantity``.
+
+        :param quantity: The quantity to remove.
+        :type quantity: :class:`~siquant.quantities.Quantity`
+        :raises: ``KeyError`` if there is no such entry.
+        :rtype: ``Tuple[Quantity, Any]`` the removed entry.
+        """
+        bucket = self._bucket(quantity)
+        if bucket is not None:
+            key = _base(quantity)
+            position = bisect_left(bucket.keys, key)
+            if position < len(bucket.keys) and bucket.keys[position] == key:
+                del bucket.keys[position]
+                self._size -= 1
+                return bucket.entries.pop(position)
+        raise KeyError(quantity)
+
+    def range(self, low, high):
+        """Get the entries between two quantities, inclusive, in ascending order.
+
+        :param low: The lower bound.
+        :type low: :class:`~siquant.quantities.Quantity`
+        :param high: The upper bound.
+        :type high: :class:`~siquant.quantities.Quantity`
+        :raises: :class:`~siquant.exceptions.UnitMismatchError` if the bounds
+            are of different dimensions.
+        :rtype: ``List[Tuple[Quantity, Any]]``
+        """
+        if not low.units.compatible(high.units):
+            raise UnitMismatchError(low.units, high.units)
+        bucket = self._bucket(low)
+        if bucket is None:
+            return []
+        start = bisect_left(bucket.keys, _base(low))
+        stop = bisect_right(bucket.keys, _base(high))
+        return bucket.entries[start:stop]
+
+    def nearest(self, quantity):
+        """Get the entry closest to a quantity.
+
+        :param quantity: The quantity to look up.
+        :type quantity: :class:`~siquant.quantities.Quantity`
+        :rtype: ``Optional[Tuple[Quantity, Any]]``, ``None`` if there are no
+            entries of the same dimensions.
+        """
+        bucket = self._bucket(quantity)
+        if bucket is None or not bucket.keys:
+            return None
+        key = _base(quantity)
+        keys = bucket.keys
+        position = bisect_left(keys, key)
+        if position == len(keys):
+            return bucket.entries[-1]
+        if position and key - keys[position - 1] <= keys[position] - key:
+            return bucket.entries[position - 1]
+        return bucket.entries[position]
+
+    def of(self, dimensions):
+        """Get the entries of given dimensions, in ascending order.
+
+        :param dimensions: The dimensions, see :func:`~siquant.dimensions.SIDimensions`.
+        :type dimensions: ``tuple``
+        :rtype: ``List[Tuple[Quantity, Any]]``
+        """
+        bucket = self._buckets.get(dim_pack(dimensions))
+        return list(bucket.entries) if bucket is not None else []
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        for bucket in self._buckets.values():
+            for quantity, _ in bucket.entries:
+                yield quantity
+
+    def __contains__(self, quantity):
+        if not isinstance(quantity, Quantity):
+            return False
+        bucket = self._bucket(quantity)
+        if bucket is None:
+            return False
+        key = _base(quantity)
+        position = bisect_left(bucket.keys, key)
+        return position < len(bucket.keys) and bucket.keys[position] == key
+
+    def __repr__(self):
+        return "QuantityIndex(<%d entries>)" % self._size
@@ -0,0 +1,190 @@
+"""Run numerical kernels on raw values, checking units only at their boundary.
+
+A kernel declares the units of its quantity parameters and of its result.
+By default kernels run checked: arguments are converted to the declared
+units and the body runs on quantities as usual. Within :func:`stripped`,
+arguments are converted once and the body runs on their raw values, so no
+intermediate quantities are created; units are re-attached to the result.
+
+.. code-block:: python
+
+    @kernel(si.newtons, area=si.meters ** 2, stress=si.pascals)
+    def capacity(area, stress, factor=0.9):
+        return factor * area * stress
+
+    with stripped():
+        for section in sections:
+            capacity(section.area, section.fy)
+
+The first stripped call of every kernel also runs the checked path, to learn
+the units of the raw result and to verify both paths agree exactly. Bodies
+must therefore not depend on units beyond arithmetic between quantities,
+and parameters which are added or compared should be declared in the same
+units.
+"""
+
+import threading
+
+from contextlib import contextmanager
+from functools import wraps
+from inspect import Parameter, signature
+
+from .exceptions import KernelError, unexpected_type_error
+from .quantities import Quantity, make
+
+# the mode is per thread, so stripping in one thread never affects another
+_mode = threading.local()
+
+_POSITIONAL = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+
+
+def is_stripped():
+    """Check whether kernels currently run on raw values in this thread.
+
+    :rtype: ``bool``
+    """
+    return getattr(_mode, "stripped", False)
+
+
+@contextmanager
+def stripped(enabled=True):
+    """Run kernels on raw values within a block, restoring the mode after.
+
+    The mode applies to the current thread only.
+
+    :param enabled: Whether to strip units, ``False`` forces checked execution.
+    :type enabled: ``bool``
+    """
+    previous = is_stripped()
+    _mode.stripped = enabled
+    try:
+        yield
+    finally:
+        _mode.stripped = previous
+
+
+def _identical(a, b):
+    if a is b:
+        return True
+    equal = a == b
+    if isinstance(equal, bool):
+        return equal or (a != a and b != b)
+    import numpy as np
+
+    try:
+        return np.array_equal(a, b, equal_nan=True)
+    except TypeError:
+        return np.array_equal(a, b)
+
+
+def kernel(returns, **parameters):
+    """Declare the units of a function's quantity parameters and result.
+
+    :param returns: The units of the result, or a tuple of units for
+        functions returning a tuple.
+    :type returns: :class:`~siquant.units.SIUnit`
+    :param parameters: The units of each quantity parameter, by name.
+    :type parameters: :class:`~siquant.units.SIUnit`
+    :raises: ``TypeError`` for parameters the function doesn't accept.
+    :rtype: ``Callable[[Callable], Callable]``
+    """
+    multiple = isinstance(returns, tuple)
+    return_units = returns if multiple else (returns,)
+
+    def decorate(fn):
+        fn_signature = signature(fn)
+        unknown = set(parameters) - set(fn_signature.parameters)
+        if unknown:
+            raise TypeError(
+                "%s() has no parameters %s" % (fn.__name__, ", ".join(sorted(unknown)))
+            )
+        converters = []
+
+        # declared parameters by position, so plain positional calls skip
+        # Signature.bind; anything else falls back to it
+        positional = [
+            name
+            for name, parameter in fn_signature.parameters.items()
+            if parameter.kind in _POSITIONAL
+        ]
+        declared = tuple(
+            (positional.index(name), name, units)
+            for name, units in parameters.items()
+            if name in positional
+        )
+        fast = len(declared) == len(parameters)
+        required = max(index for index, _, _ in declared) + 1 if declared else 0
+
+        def argument(name, value, units, strip):
+            if not isinstance(value, Quantity):
+                raise unexpected_type_error(name, Quantity, value)
+            if value.units is units:
+                return value.quantity if strip else value
+            value = value.get_as(units)
+            return value if strip else make(value, units)
+
+        def bind(args, kwargs, strip):
+            if fast and not kwargs and required <= len(args) <= len(positional):
+                args = list(args)
+                for index, name, units in declared:
+                    args[index] = argument(name, args[index], units, strip)
+                return args, kwargs
+            bound = fn_signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            for name, units in parameters.items():
+                arguments[name] = argument(name, arguments[name], units, strip)
+            return bound.args, bound.kwargs
+
+        def call(bound):
+            args, kwargs = bound
+            results = fn(*args, **kwargs)
+            if not multiple:
+                return (results,)
+            if len(results) != len(return_units):
+                raise KernelError(
+                    fn.__name__, "expected %d results" % len(return_units)
+                )
+            return results
+
+        def expressed(results, units):
+            for result in results:
+                if not isinstance(result, Quantity):
+                    raise unexpected_type_error("result", Quantity, result)
+            return tuple(make(r.get_as(u), u) for r, u in zip(results, units))
+
+        def verified(args, kwargs):
+            raw = call(bind(args, kwargs, True))
+            checked = call(bind(args, kwargs, False))
+            results = expressed(checked, return_units)
+            # the checked path knows which units the raw results are in
+            learned = [
+                result.units.converter_to(units)
+                for result, units in zip(checked, return_units)
+            ]
+            for value, result, convert in zip(raw, results, learned):
+                if not _identical(convert(value), result.quantity):
+                    raise KernelError(fn.__name__, "results differ from checked path")
+            converters[:] = learned
+            return results
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not getattr(_mode, "stripped", False):
+                results = call(bind(args, kwargs, False))
+                results = expressed(results, return_units)
+            elif not converters:
+                results = verified(args, kwargs)
+            else:
+                raw = call(bind(args, kwargs, True))
+                results = tuple(
+                    make(convert(value), convert.to_units)
+                    for value, convert in zip(raw, converters)
+                )
+            return results if multiple else results[0]
+
+        wrapper.parameters = dict(parameters)
+        wrapper.returns = returns
+        return wrapper
+
+    return decorate
@@ -0,0 +1,232 @@
+"""Deferred quantities evaluated in a single blocked pass.
+
+Arithmetic on a :class:`LazyQuantity` only records an expression; units are
+still resolved and checked immediately. :meth:`LazyQuantity.evaluate`
+compiles the whole expression once and applies it block by block, so
+temporaries are block sized instead of the size of the operands.
+
+.. code-block:: python
+
+    P, A, M, c, I = (lazy(q) for q in (P, A, M, c, I))
+    stress = (P / A + M * c / I) * factor
+    stress.evaluate(si.megapascals)
+
+Requires numpy.
+"""
+import operator
+
+from functools import lru_cache
+
+import numpy as np
+
+from .compiler import Expression, _define, _generate
+from .exceptions import unexpected_type_error
+from .quantities import Quantity, make, register_factory
+
+#: The number of elements evaluated at once.
+BLOCK_SIZE = 8192
+
+
+def _leaf(value):
+    if isinstance(value, Quantity) and not isinstance(value, LazyQuantity):
+        return LazyQuantity(value.quantity, value.units)
+    return value
+
+
+def _lifted(method):
+    def operator(self, *args):
+        result = method(self, *map(_leaf, args))
+        if result is NotImplemented or isinstance(result, LazyQuantity):
+            return result
+        return LazyQuantity(result.quantity, result.units)
+
+    operator.__name__ = method.__name__
+    return operator
+
+
+def _reflected(method, forward):
+    lifted = _lifted(method)
+
+    def operator(self, other):
+        # Quantity only reflects operators for plain values
+        if isinstance(other, Quantity):
+            return forward(_leaf(other), self)
+        return lifted(self, other)
+
+    operator.__name__ = method.__name__
+    return operator
+
+
+@lru_cache(maxsize=256)
+def _formula(source, constants):
+    return _define(source, dict(constants), "lazy")
+
+
+class LazyQuantity(Quantity):
+    """A quantity whose value is a deferred expression.
+
+    .. note::
+
+        Create lazy quantities with :func:`lazy`. Comparisons, iteration and
+        indexing evaluate the expression first.
+
+    :ivar quantity: The expression computing the value.
+    :vartype quantity: :class:`~siquant.compiler.Expression`
+    """
+
+    __slots__ = ()
+
+    __array_ufunc__ = None
+
+    def __init__(self, quantity, units):
+        if not isinstance(quantity, Expression):
+            quantity = Expression("const", quantity)
+        super().__init__(quantity, units)
+
+    __add__ = _lifted(Quantity.__add__)
+    __radd__ = _reflected(Quantity.__radd__, operator.add)
+    __sub__ = _lifted(Quantity.__sub__)
+    __rsub__ = _reflected(Quantity.__rsub__, operator.sub)
+    __mul__ = _lifted(Quantity.__mul__)
+    __rmul__ = _reflected(Quantity.__rmul__, operator.mul)
+    __truediv__ = _lifted(Quantity.__truediv__)
+    __rtruediv__ = _reflected(Quantity.__rtruediv__, operator.truediv)
+    __pow__ = _lifted(Quantity.__pow__)
+    __neg__ = _lifted(Quantity.__neg__)
+    __abs__ = _lifted(Quantity.__abs__)
+    __invert__ = _lifted(Quantity.__invert__)
+    __iadd__ = __add__
+    __isub__ = __sub__
+    __imul__ = __mul__
+    __itruediv__ = __truediv__
+
+    __hash__ = None
+
+    def evaluate(self, units=None):
+        """Compute the value in one blocked pass.
+
+        :param units: The units to express the result in, defaults to the
+            units of this quantity.
+        :type units: :class:`~siquant.units.SIUnit`
+        :raises: :class:`~siquant.exceptions.UnitMismatchError` if the units
+            are of different dimensions.
+        :rtype: ``_Q`` = :class:`~siquant.quantities.Quantity`
+        """
+        if units is None:
+            units = self.units
+        return make(_evaluate(self.get_as(units)), units)
+
+    def __eq__(self, other):
+        if isinstance(other, Quantity):
+            return self.evaluate() == _evaluated(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, Quantity):
+            return self.evaluate() != _evaluated(other)
+        return NotImplemented
+
+    def __lt__(self, other):
+        if isinstance(other, Quantity):
+            return self.evaluate() < _evaluated(other)
+        return NotImplemented
+
+    def __le__(self, other):
+        if isinstance(other, Quantity):
+            return self.evaluate() <= _evaluated(other)
+        return NotImplemented
+
+    def __gt__(self, other):
+        if isinstance(other, Quantity):
+            return self.evaluate() > _evaluated(other)
+        return NotImplemented
+
+    def __ge__(self, other):
+        if isinstance(other, Quantity):
+            return self.evaluate() >= _evaluated(other)
+        return NotImplemented
+
+    def __bool__(self):
+        return bool(self.evaluate())
+
+    def __float__(self):
+        return float(self.evaluate())
+
+    def __len__(self):
+        return len(self.evaluate())
+
+    def __iter__(self):
+        return iter(self.evaluate())
+
+    def __getitem__(self, idx):
+        return self.evaluate()[idx]
+
+    def __str__(self):
+        return str(self.evaluate())
+
+
+def _rewrapped(quantity, units):
+    # make(lazy, units), e.g. from units * lazy, stays lazy
+    return LazyQuantity(quantity.quantity, quantity.units * units)
+
+
+register_factory(LazyQuantity, _rewrapped)
+
+
+def _evaluated(quantity):
+    if isinstance(quantity, LazyQuantity):
+        return quantity.evaluate()
+    return quantity
+
+
+def lazy(quantity):
+    """Defer arithmetic on a quantity.
+
+    :param quantity: The quantity, typically an array quantity.
+    :type quantity: :class:`~siquant.quantities.Quantity`
+    :rtype: :class:`LazyQuantity`
+    """
+    if not isinstance(quantity, Quantity):
+        raise unexpected_type_error("quantity", Quantity, quantity)
+    return _leaf(quantity)
+
+
+def _operands(root):
+    # replace every non scalar constant by a parameter of the formula
+    operands = []
+    replaced = {}
+
+    def visit(node):
+        key = id(node)
+        if key not in replaced:
+            if node.op == "const" and type(node.args[0]) not in (int, float):
+                replaced[key] = Expression("var", "_a%d" % len(operands))
+                operands.append(node.args[0])
+            elif node.op in ("const", "var"):
+                replaced[key] = node
+            else:
+                replaced[key] = Expression(node.op, *map(visit, node.args))
+        return replaced[key]
+
+    return visit(root), operands
+
+
+def _evaluate(root):
+    root, operands = _operands(root)
+    names = ["_a%d" % i for i in range(len(operands))]
+    source, constants = _generate((root,), names)
+    function = _formula(source, tuple(sorted(constants.items())))
+
+    arrays = np.broadcast_arrays(*operands) if operands else ()
+    if not arrays or arrays[0].ndim == 0 or arrays[0].size <= BLOCK_SIZE:
+        return function(*operands)
+
+    shape = arrays[0].shape
+    step = max(1, BLOCK_SIZE * shape[0] // arrays[0].size)
+    first = np.asarray(function(*(array[:step] for array in arrays)))
+    out = np.empty(shape, dtype=first.dtype)
+    out[:step] = first
+    for start in range(step, shape[0], step):
+        stop = start + step
+        out[start:stop] = function(*(array[start:stop] for array in arrays))
+    return out
@@ -0,0 +1,250 @@
+"""Matrices whose entries have units structured by row and by column.
+
+The entry ``(i, j)`` of a :class:`UnitMatrix` is expressed in
+``row_units[i] * col_units[j]``, which describes stiffness, flexibility and
+mass matrices as well as mixed unit vectors (with no column units). Values
+are a single ``ndarray``; products check units with work proportional to
+the matrix dimensions, and the numeric work is left to numpy.
+
+.. code-block:: python
+
+    K = UnitMatrix(k, row_units=(kN, kN, kN * m), col_units=(~m, ~m, unity))
+    F = UnitMatrix(f, row_units=(kN, kN, kN * m))
+    u = solve(K, F)
+
+Requires numpy.
+"""
+import numpy as np
+
+from .exceptions import UnitMismatchError, unexpected_type_error
+from .quantities import Quantity, make
+from .units import SIUnit
+
+_unity = SIUnit.Unit()
+
+
+def _consistent(units):
+    # the common units of a sequence, and the factor of each to them
+    common = units[0]
+    factors = np.empty(len(units))
+    for i, unit in enumerate(units):
+        if not unit.compatible(common):
+            raise UnitMismatchError(common, unit)
+        factors[i] = unit.scale / common.scale
+    return common, factors
+
+
+def _scaled(values, row_factors=None, col_factors=None):
+    if row_factors is not None and np.any(row_factors != 1):
+        values = values * row_factors.reshape((-1,) + (1,) * (values.ndim - 1))
+    if col_factors is not None and np.any(col_factors != 1):
+        values = values * col_factors
+    return values
+
+
+class UnitMatrix:
+    """A one or two dimensional array with units per row and per column.
+
+    :ivar values: The entries, each in its row units times its column units.
+    :vartype values: ``numpy.ndarray``
+    :ivar row_units: The units of each row.
+    :vartype row_units: ``Tuple[SIUnit, ...]``
+    :ivar col_units: The units of each column, empty for vectors.
+    :vartype col_units: ``Tuple[SIUnit, ...]``
+
+    :param values: The entries.
+    :type values: ``numpy.ndarray``
+    :param row_units: The units of each row.
+    :type row_units: ``Sequence[SIUnit]``
+    :param col_units: The units of each column, omitted for vectors.
+    :type col_units: ``Sequence[SIUnit]``
+    :raises: ``ValueError`` if the units don't match the shape of the values.
+    """
+
+    __slots__ = ("values", "row_units", "col_units")
+
+    __array_ufunc__ = None
+
+    def __init__(self, values, row_units, col_units=()):
+        values = np.asarray(values)
+        row_units = tuple(row_units)
+        col_units = tuple(col_units)
+        if values.ndim not in (1, 2):
+            raise ValueError("Expected 1 or 2 dimensions.", values.shape)
+        if values.shape != (len(row_units),) + ((len(col_units),) if col_units else ()):
+            raise ValueError(
+                "Units don't match the shape.",
+                values.shape,
+                (len(row_units), len(col_units)),
+            )
+        self.values = values
+        self.row_units = row_units
+        self.col_units = col_units
+
+    @classmethod
+    def uniform(cls, quantity):
+        """Create a matrix from an array quantity, all of whose entries share units.
+
+        :param quantity: The array quantity.
+        :type quantity: :class:`~siquant.arrays.QuantityArray`
+        :rtype: :class:`UnitMatrix`
+        """
+        values = np.asarray(quantity.quantity)
+        rows = (quantity.units,) * values.shape[0]
+        cols = (_unity,) * values.shape[1] if values.ndim == 2 else ()
+        return cls(values, rows, cols)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    @property
+    def T(self):
+        """The transpose.
+
+        :rtype: :class:`UnitMatrix`
+        """
+        if not self.col_units:
+            return self
+        return UnitMatrix(self.values.T, self.col_units, self.row_units)
+
+    def units(self, i, j=None):
+        """Get the units of an entry.
+
+        :rtype: :class:`~siquant.units.SIUnit`
+        """
+        if j is None:
+            return self.row_units[i]
+        return self.row_units[i] * self.col_units[j]
+
+    def __getitem__(self, idx):
+        if isinstance(idx, tuple):
+            return make(self.values[idx], self.units(*idx))
+        if isinstance(idx, slice):
+            return UnitMatrix(self.values[idx], self.row_units[idx], self.col_units)
+        if self.col_units:
+            # a row of a matrix is a vector in its row units times each column's
+            units = self.row_units[idx]
+            return UnitMatrix(self.values[idx], [units * col for col in self.col_units])
+        return make(self.values[idx], self.row_units[idx])
+
+    def __len__(self):
+        return len(self.row_units)
+
+    def to_quantity(self, units):
+        """Express every entry in the same units.
+
+        :param units: The units of the result.
+        :type units: :class:`~siquant.units.SIUnit`
+        :raises: :class:`~siquant.exceptions.UnitMismatchError` if any entry
+            is of different dimensions.
+        :rtype: :class:`~siquant.arrays.QuantityArray`
+        """
+        row_common, row_factors = _consistent(self.row_units)
+        common, col_factors = row_common, None
+        if self.col_units:
+            col_common, col_factors = _consistent(self.col_units)
+            common = row_common * col_common
+        factor = common.converter_to(units).factor
+        return make(_scaled(self.values, row_factors * factor, col_factors), units)
+
+    def __matmul__(self, other):
+        if isinstance(other, Quantity):
+            other = UnitMatrix.uniform(other)
+        if not isinstance(other, UnitMatrix):
+            return NotImplemented
+        if not self.col_units:
+            raise ValueError("Can't multiply a vector on the left.")
+        if len(self.col_units) != len(other.row_units):
+            raise ValueError("Shapes don't align.", self.shape, other.shape)
+        inner = [c * r for c, r in zip(self.col_units, other.row_units)]
+        common, factors = _consistent(inner)
+        values = np.matmul(_scaled(self.values, col_factors=factors), other.values)
+        rows = tuple(units * common for units in self.row_units)
+        return UnitMatrix(values, rows, other.col_units)
+
+    def __rmatmul__(self, other):
+        if isinstance(other, Quantity):
+            return UnitMatrix.uniform(other).__matmul__(self)
+        return NotImplemented
+
+    def __neg__(self):
+        return UnitMatrix(-self.values, self.row_units, self.col_units)
+
+    def __mul__(self, scalar):
+        if isinstance(scalar, Quantity):
+            rows = tuple(units * scalar.units for units in self.row_units)
+            return UnitMatrix(self.values * scalar.quantity, rows, self.col_units)
+        return UnitMatrix(self.values * scalar, self.row_units, self.col_units)
+
+    __rmul__ = __mul__
+
+    def __add__(self, other):
+        if not isinstance(other, UnitMatrix):
+            return NotImplemented
+        return UnitMatrix(
+            self.values + self._values_of(other), self.row_units, self.col_units
+        )
+
+    def __sub__(self, other):
+        if not isinstance(other, UnitMatrix):
+            return NotImplemented
+        return UnitMatrix(
+            self.values - self._values_of(other), self.row_units, self.col_units
+        )
+
+    def _values_of(self, other):
+        # other's values in this matrix's units, entry (i, j) of other is
+        # rescaled by (other.row_units[i] / row_units[i]).scale times the
+        # same ratio for the columns, provided all ratios agree
+        if other.shape != self.shape:
+            raise ValueError("Shapes don't match.", self.shape, other.shape)
+        rows = [a / b for a, b in zip(other.row_units, self.row_units)]
+        row_common, row_factors = _consistent(rows)
+        col_factors = None
+        col_common = _unity
+        if self.col_units:
+            cols = [a / b for a, b in zip(other.col_units, self.col_units)]
+            col_common, col_factors = _consistent(cols)
+        ratio = row_common * col_common
+        if not ratio.compatible(_unity):
+            raise UnitMismatchError(self.units(0, 0 if self.col_units else None), ratio)
+        return _scaled(other.values, row_factors * ratio.scale, col_factors)
+
+    def solve(self, rhs):
+        """Solve ``self @ x = rhs`` for ``x``, see :func:`solve`."""
+        return solve(self, rhs)
+
+    def __repr__(self):
+        return "UnitMatrix(%r, row_units=%r, col_units=%r)" % (
+            self.values,
+            self.row_units,
+            self.col_units,
+        )
+
+
+def solve(matrix, rhs):
+    """Solve the linear system ``matrix @ x = rhs`` with units checked.
+
+    The units of ``x`` follow from those of the system: ``rhs[i] /
+    row_units[i]`` must be of the same dimensions for every row, and then
+    ``x[j]`` is expressed in that quotient divided by ``col_units[j]``.
+
+    :param matrix: A square matrix, e.g. stiffnesses.
+    :type matrix: :class:`UnitMatrix`
+    :param rhs: A vector or matrix of right hand sides, e.g. loads, or an
+        array quantity.
+    :type rhs: ``Union[UnitMatrix, QuantityArray]``
+    :raises: :class:`~siquant.exceptions.UnitMismatchError` if the units of
+        the system are inconsistent.
+    :rtype: :class:`UnitMatrix`
+    """
+    if isinstance(rhs, Quantity):
+        rhs = UnitMatrix.uniform(rhs)
+    if not isinstance(matrix, UnitMatrix) or not matrix.col_units:
+        raise unexpected_type_error("matrix", UnitMatrix, matrix)
+    ratios = [f / r for f, r in zip(rhs.row_units, matrix.row_units)]
+    common, factors = _consistent(ratios)
+    values = np.linalg.solve(matrix.values, _scaled(rhs.values, factors))
+    rows = tuple(common / units for units in matrix.col_units)
+    return UnitMatrix(values, rows, rhs.col_units)
@@ -0,0 +1,400 @@
+"""Parse unit expressions such as ``"kN*m/s**2"`` or ``"lbf/in^2"``.
+
+Units are resolved against :mod:`~siquant.systems.si` and
+:mod:`~siquant.systems.imperial`, either by symbol (``kN``, ``ft``), optionally
+with an SI prefix, or by attribute name (``kilonewtons``, ``foot``).
+
+Expressions may combine units with ``*``, ``·``, ``.`` or whitespace, divide
+with ``/``, group with parentheses and raise to integer or rational powers
+with ``**`` or ``^``, e.g. ``"m**(1/2)"``. Parsed results are memoized.
+
+Quantity literals are a number followed by a unit expression without
+whitespace, e.g. ``"12.5 kN"`` or ``"1.2e3 psi"``. Compound literals such as
+``"3 ft 4 in"`` are summed; a leading minus sign applies to every term.
+"""
+import re
+
+from fractions import Fraction
+from functools import lru_cache
+
+from .exceptions import UnitParseError
+from .quantities import make
+from .systems import imperial, si
+from .units import SIUnit
+
+#: Unit symbols which accept SI prefixes.
+PREFIXABLE_SYMBOLS = {
+    "m": si.meters,
+    "g": si.grams,
+    "s": si.seconds,
+    "K": si.kelvin,
+    "A": si.amperes,
+    "mol": si.mols,
+    "cd": si.candelas,
+    "rad": si.radians,
+    "sr": si.steradians,
+    "Hz": si.hertz,
+    "N": si.newtons,
+    "Pa": si.pascals,
+    "J": si.joules,
+    "W": si.watts,
+    "C": si.coulombs,
+    "V": si.volts,
+    "F": si.farads,
+    "ohm": si.ohms,
+    "Ω": si.ohms,
+    "S": si.siemens,
+    "Wb": si.webers,
+    "T": si.teslas,
+    "H": si.henrys,
+    "lm": si.lumens,
+    "lx": si.lux,
+    "Bq": si.becquerels,
+    "Gy": si.grays,
+    "Sv": si.sieverts,
+    "kat": si.katals,
+    "L": si.liters,
+    "l": si.liters,
+    "t": si.tonnes,
+}
+
+#: Unit symbols which don't accept SI prefixes.
+SYMBOLS = {
+    "min": si.minutes,
+    "h": si.hours,
+    "hr": si.hours,
+    "d": si.days,
+    "wk": si.weeks,
+    "yr": si.years,
+    "deg": si.degrees,
+    "°": si.degrees,
+    "in": imperial.inches,
+    "thou": imperial.thousandths,
+    "mil": imperial.thousandths,
+    "ft": imperial.feet,
+    "yd": imperial.yards,
+    "ch": imperial.chains,
+    "fur": imperial.furlongs,
+    "mi": imperial.miles,
+    "ac": imperial.acres,
+    "fl_oz": imperial.fluid_ounces,
+    "gi": imperial.gills,
+    "pt": imperial.pints,
+    "qt": imperial.quarts,
+    "gal": imperial.gallons,
+    "lb": imperial.pounds,
+    "lbm": imperial.pounds,
+    "oz": imperial.ounces,
+    "st": imperial.stones,
+    "ton": imperial.tons,
+    "lbf": imperial.pounds_force,
+    "kip": imperial.kips,
+    "psi": imperial.psi,
+    "ksi": imperial.ksi,
+}
+
+#: SI prefix symbols.
+PREFIXES = {
+    "n": si.nano,
+    "u": si.micro,
+    "µ": si.micro,
+    "μ": si.micro,
+    "m": si.milli,
+    "c": si.centi,
+    "d": si.deci,
+    "da": si.deca,
+    "h": si.hecta,
+    "k": si.kilo,
+    "M": si.mega,
+    "G": si.giga,
+    "T": si.tera,
+}
+
+_PREFIX_NAMES = {
+    "nano": si.nano,
+    "micro": si.micro,
+    "milli": si.milli,
+    "centi": si.centi,
+    "deci": si.deci,
+    "deca": si.deca,
+    "hecta": si.hecta,
+    "hecto": si.hecta,
+    "kilo": si.kilo,
+    "mega": si.mega,
+    "giga": si.giga,
+    "tera": si.tera,
+}
+
+_NAMES = {
+    name: units
+    for module in (si, imperial)
+    for name, units in vars(module).items()
+    if isinstance(units, SIUnit) and not name.startswith("_")
+}
+_NAMES["foot"] = imperial.feet
+
+_TOKEN = re.compile(
+    r"\s*(?:"
+    r"(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)"
+    r"|(?P<name>[^\W\d]\w*|°)"
+    r"|(?P<op>\*\*|[*/^()·.+-])"
+    r")"
+)
+
+_LITERAL_TERM = re.compile(
+    r"\s*(?P<value>[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)"
+    r"\s*(?P<units>[^\s\d.+-]\S*)?\s*"
+)
+
+_unity = SIUnit.Unit()
+
+
+def _tokenize(text):
+    tokens = []
+    position = 0
+    end = len(text.rstrip())
+    while position < end:
+        match = _TOKEN.match(text, position)
+        if match is None or match.end() == position:
+            raise UnitParseError(text, "unexpected character at %d" % position)
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+    return tokens
+
+
+def lookup_unit(name):
+    """Resolve a single unit symbol or name.
+
+    :param name: A symbol such as ``"kN"`` or a name such as ``"kilonewtons"``.
+    :type name: ``str``
+    :raises: :class:`~siquant.exceptions.UnitParseError` if it is unknown.
+    :rtype: :class:`~siquant.units.SIUnit`
+    """
+    units = SYMBOLS.get(name) or PREFIXABLE_SYMBOLS.get(name)
+    if units is not None:
+        return units
+    units = _NAMES.get(name) or _NAMES.get(name + "s")
+    if units is not None:
+        return units
+    for prefix_length in (2, 1):
+        prefix = PREFIXES.get(name[:prefix_length])
+        units = PREFIXABLE_SYMBOLS.get(name[prefix_length:])
+        if prefix is not None and units is not None:
+            return prefix * units
+    for prefix_name, prefix in _PREFIX_NAMES.items():
+        remainder = name[len(prefix_name):]
+        if name.startswith(prefix_name) and remainder:
+            units = _NAMES.get(remainder) or _NAMES.get(remainder + "s")
+            if units is not None:
+                return prefix * units
+    raise UnitParseError(name, "unknown unit")
+
+
+class _Parser:
+    def __init__(self, text):
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.position = 0
+
+    def peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return (None, None)
+
+    def take(self):
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def expect(self, op):
+        if self.take() != ("op", op):
+            raise UnitParseError(self.text, "expected '%s'" % op)
+
+    def parse(self):
+        if not self.tokens:
+            raise UnitParseError(self.text, "empty expression")
+        units = self.expression()
+        if self.position != len(self.tokens):
+            raise UnitParseError(self.text, "unexpected '%s'" % self.peek()[1])
+        return units
+
+    def expression(self):
+        units = self.power()
+        while True:
+            kind, value = self.peek()
+            if kind == "op" and value in ("*", "·", "."):
+                self.take()
+                units = units * self.power()
+            elif kind == "op" and value == "/":
+                self.take()
+                units = units / self.power()
+            elif kind in ("name", "number") or (kind, value) == ("op", "("):
+                units = units * self.power()
+            else:
+                return units
+
+    def power(self):
+        units = self.factor()
+        if self.peek() in (("op", "**"), ("op", "^")):
+            self.take()
+            units = units ** self.exponent()
+        return units
+
+    def factor(self):
+        kind, value = self.take()
+        if kind == "name":
+            return lookup_unit(value)
+        if kind == "number":
+            return SIUnit.Unit(float(value))
+        if (kind, value) == ("op", "("):
+            units = self.expression()
+            self.expect(")")
+            return units
+        raise UnitParseError(self.text, "expected a unit, got '%s'" % value)
+
+    def exponent(self):
+        exponent = self.fraction()
+        if exponent.denominator == 1:
+            return int(exponent)
+        return float(exponent)
+
+    def fraction(self):
+        if self.peek() == ("op", "("):
+            self.take()
+            value = self.fraction()
+            if self.peek() == ("op", "/"):
+                self.take()
+                value = value / self.fraction()
+            self.expect(")")
+            return value
+        sign = 1
+        while self.peek() in (("op", "-"), ("op", "+")):
+            if self.take()[1] == "-":
+                sign = -sign
+        kind, value = self.take()
+        if kind != "number":
+            raise UnitParseError(self.text, "expected an exponent")
+        return sign * Fraction(value)
+
+
+@lru_cache(maxsize=1024)
+def parse_unit(text):
+    """Parse a unit expression into :class:`~siquant.units.SIUnit`.
+
+    Results are memoized in a bounded LRU cache, ``parse_unit.cache_info()``
+    reports its statistics.
+
+    .. code-block:: python
+
+        parse_unit("kN*m/s**2")
+        parse_unit("lbf/in^2")
+        parse_unit("m**(1/2)")
+
+    :param text: The unit expression.
+    :type text: ``str``
+    :raises: :class:`~siquant.exceptions.UnitParseError` for malformed
+        expressions or unknown units.
+    :rtype: :class:`~siquant.units.SIUnit`
+    """
+    return _Parser(text).parse()
+
+
+def _literal_terms(text):
+    text = text.strip()
+    terms = []
+    position = 0
+    negative = False
+    end = len(text)
+    while position < end:
+        match = _LITERAL_TERM.match(text, position)
+        if match is None:
+            raise UnitParseError(text, "malformed quantity at %d" % position)
+        value = match.group("value")
+        if not terms:
+            negative = value.startswith("-")
+        elif negative and value[0] not in "+-":
+            value = "-" + value
+        terms.append((value, match.group("units") or ""))
+        position = match.end()
+    if len(terms) > 1 and not all(unit_text for _, unit_text in terms):
+        raise UnitParseError(text, "unitless term in a compound quantity")
+    return terms
+
+
+def _literal_units(unit_text, default):
+    return parse_unit(unit_text) if unit_text else default
+
+
+def parse_quantity(text, units=None):
+    """Parse a quantity literal such as ``"12.5 kN"`` or ``"3 ft 4 in"``.
+
+    :param text: The quantity literal.
+    :type text: ``str``
+    :param units: The units of the result, and of bare numbers. Defaults to
+        the units of the first term.
+    :type units: :class:`~siquant.units.SIUnit`
+    :raises: :class:`~siquant.exceptions.UnitParseError` for malformed input.
+    :rtype: ``_Q`` = :class:`~siquant.quantities.Quantity`
+    """
+    terms = _literal_terms(text)
+    if not terms:
+        raise UnitParseError(text, "empty quantity")
+    if units is None:
+        units = _literal_units(terms[0][1], _unity)
+    total = 0
+    for value, unit_text in terms:
+        total += _literal_units(unit_text, units).converter_to(units)(float(value))
+    return make(total, units)
+
+
+def parse_quantities(texts, units=None):
+    """Parse many quantity literals into a single array quantity.
+
+    Values are grouped by their unit text, and every group is converted with
+    one vectorized multiplication, no per value quantities are created.
+    Blank entries become ``nan``.
+
+    .. code-block:: python
+
+        parse_quantities(["12.5 kN", "3 kip", "1200 N"], si.kilonewtons)
+
+    Requires numpy.
+
+    :param texts: The quantity literals.
+    :type texts: ``Iterable[str]``
+    :param units: The units of the result, and of bare numbers. Defaults to
+        the units of the first term parsed.
+    :type units: :class:`~siquant.units.SIUnit`
+    :raises: :class:`~siquant.exceptions.UnitParseError` for malformed input.
+    :raises: :class:`~siquant.exceptions.UnitMismatchError` for values of
+        incompatible dimensions.
+    :rtype: :class:`~siquant.arrays.QuantityArray`
+    """
+    import numpy as np
+
+    groups = {}
+    blanks = []
+    count = 0
+    for row, text in enumerate(texts):
+        count += 1
+        terms = _literal_terms(text)
+        if not terms:
+            blanks.append(row)
+        for value, unit_text in terms:
+            group = groups.get(unit_text)
+            if group is None:
+                group = groups[unit_text] = ([], [])
+            group[0].append(row)
+            group[1].append(value)
+
+    if units is None:
+        units = _literal_units(next(iter(groups), ""), _unity)
+
+    result = np.zeros(count)
+    for unit_text, (rows, values) in groups.items():
+        converter = _literal_units(unit_text, units).converter_to(units)
+        values = converter.array(np.array(values, dtype=float))
+        result += np.bincount(rows, weights=values, minlength=count)
+    result[blanks] = np.nan
+    return make(result, units)
@@ -5,8 +5,11 @@ except ImportError:
 
 from copy import copy, deepcopy
 from functools import total_ordering
+from importlib import import_module
+import sys
 
 from .exceptions import UnitMismatchError, unexpected_type_error
+from .units import SIUnit
 from .util import immutable
 
 
@@ -22,6 +25,101 @@ def make(quantity, units):
     return units.factory(quantity, units)
 
 
+#: Quantity classes by value type, see :func:`register_factory`.
+_registry = {}
+
+#: Resolved quantity classes by the exact type of the value.
+_resolved = {}
+
+
+def register_factory(value_type, quantity_class):
+    """Register the quantity class which :func:`factory` uses for a value type.
+
+    Registrations apply to subclasses of ``value_type`` too. Either argument
+    may be given as a string, so registering costs no imports: a
+    ``"module.name"`` value type matches types of that qualified name, and
+    subclasses of the type reachable under that public name once its module
+    has been imported, and a ``"module:name"`` quantity class is imported
+    when first needed.
+
+    .. code-block:: python
+
+        register_factory(Vector, VectorQuantity)
+        register_factory("numpy.ndarray", "siquant.arrays:QuantityArray")
+
+    :param value_type: The type of values, or its qualified name.
+    :type value_type: ``Union[type, str]``
+    :param quantity_class: A callable taking ``(value, units)``, usually a
+        :class:`Quantity` subclass, or its ``"module:name"`` path. ``None``
+        removes the registration.
+    :type quantity_class: ``Union[Callable[[_T, SIUnit], _Q], str, None]``
+    """
+    if quantity_class is None:
+        _registry.pop(value_type, None)
+    else:
+        _registry[value_type] = quantity_class
+    _resolved.clear()
+
+
+def _load(quantity_class):
+    if not isinstance(quantity_class, str):
+        return quantity_class
+    module, _, name = quantity_class.partition(":")
+    try:
+        return getattr(import_module(module), name)
+    except ImportError:  # an optional dependency, fall back to the next type
+        return None
+
+
+def _public(key):
+    # the type a "module.name" key refers to, if its module is imported
+    module, _, name = key.rpartition(".")
+    registered = getattr(sys.modules.get(module), name, None)
+    return registered if isinstance(registered, type) else None
+
+
+def _resolve(value_type):
+    for cls in value_type.__mro__:
+        for key in (cls, "%s.%s" % (cls.__module__, cls.__qualname__)):
+            quantity_class = _load(_registry.get(key))
+            if quantity_class is not None:
+                _resolved[value_type] = quantity_class
+                return quantity_class
+    for key, quantity_class in list(_registry.items()):
+        if isinstance(key, str):
+            registered = _public(key)
+            if registered is not None and issubclass(value_type, registered):
+                quantity_class = _load(quantity_class)
+                if quantity_class is not None:
+                    _resolved[value_type] = quantity_class
+                    return quantity_class
+    _resolved[value_type] = Quantity
+    return Quantity
+
+
+def factory(quantity, units):
+    """Default :attr:`~siquant.units.SIUnit.factory`, dispatching on the type
+    of the value to the quantity class registered by :func:`register_factory`.
+
+    Resolutions are cached per type, so this costs one dict lookup.
+
+    :param quantity: The value to tag with units.
+    :type quantity: ``_T``
+    :param units: The units of the value.
+    :type units: :class:`~siquant.units.SIUnit`
+    :rtype: ``_Q`` = :class:`Quantity`
+    """
+    try:
+        quantity_class = _resolved[type(quantity)]
+    except KeyError:
+        quantity_class = _resolve(type(quantity))
+    return quantity_class(quantity, units)
+
+
+def _rewrap(quantity, units):
+    return factory(quantity.quantity, quantity.units * units)
+
+
 def converter(units):
     """Create a converter function which will return Quantities.
 
@@ -177,14 +275,6 @@ class Quantity:
             raise unexpected_type_error("other", Quantity, other)
         return self.units.compatible(other.units)
 
-    def __abs_epsilon(self, atol=1e-6):
-        if isinstance(atol, Quantity):
-            return atol
-        return atol * self.units
-
-    def __rel_epsilon(self, other, rtol=1e-9):
-        return rtol * max(abs(self), abs(other), 1 * self.units)
-
     def abs_approx(self, other, atol=1e-6):
         return self.approx(other, rtol=0, atol=atol)
 
@@ -206,8 +296,12 @@ class Quantity:
         if not self.compatible(other):
             return False
 
-        epsilon = max(self.__rel_epsilon(other, rtol), self.__abs_epsilon(atol))
-        return abs(other - self) <= epsilon
+        value = self.quantity
+        other = other.get_as(self.units)
+        if isinstance(atol, Quantity):
+            atol = atol.get_as(self.units)
+        epsilon = max(rtol * max(abs(value), abs(other), 1), atol)
+        return abs(other - value) <= epsilon
 
     def __add__(self, other):
         if other == 0:
@@ -260,7 +354,7 @@ class Quantity:
         return NotImplemented
 
     def __hash__(self):
-        return hash((self.quantity * self.units.scale, self.units.base_units()))
+        return hash((self.quantity * self.units.scale, self.units.packed_dimensions))
 
     def __str__(self):
         return "%s %s" % (self.quantity, self.units)
@@ -289,6 +383,9 @@ class Quantity:
     def __matmul__(self, rhs):
         if isinstance(rhs, Quantity):
             return make(matmul(self.quantity, rhs.quantity), self.units * rhs.units)
+        if getattr(rhs, "__array_ufunc__", True) is None:
+            # defer to operands which opt out of numpy, e.g. unit matrices
+            return NotImplemented
         return make(matmul(self.quantity, rhs), self.units)
 
     __imatmul__ = __matmul__
@@ -335,3 +432,168 @@ class Quantity:
 
     def __deepcopy__(self, memodict):
         return make(deepcopy(self.quantity), self.units)
+
+
+def _normalized(base, units):
+    quantity = object.__new__(NormalizedQuantity)
+    scale = units.scale
+    object.__setattr__(quantity, "quantity", base if scale == 1 else base / scale)
+    object.__setattr__(quantity, "units", units)
+    object.__setattr__(quantity, "base", base)
+    return quantity
+
+
+def _base(quantity):
+    if isinstance(quantity, NormalizedQuantity):
+        return quantity.base
+    return quantity.quantity * quantity.units.scale
+
+
+class NormalizedQuantity(Quantity):
+    """A quantity which also stores its value in base SI units.
+
+    Addition, subtraction, comparison and hashing work on the base value
+    directly, without converting either operand. Results are expressed in
+    the units of the left operand.
+
+    .. note::
+
+        Create normalized quantities with :func:`normalize`.
+
+    :ivar base: The value in base SI units, i.e. a scale of 1.0. read only.
+    :vartype base: ``_T``
+    """
+
+    __slots__ = ("base",)
+
+    def __init__(self, quantity, units):
+        if isinstance(quantity, Quantity):
+            units = quantity.units * units
+            quantity = quantity.quantity
+        object.__setattr__(self, "quantity", quantity)
+        object.__setattr__(self, "units", units)
+        object.__setattr__(self, "base", quantity * units.scale)
+
+    def __same(self, other):
+        dims = self.units.packed_dimensions
+        if dims != other.units.packed_dimensions:
+            raise UnitMismatchError(self.units, other.units)
+
+    def get_as(self, units):
+        if self.units is units:
+            return self.quantity
+        if not self.units.compatible(units):
+            raise UnitMismatchError(self.units, units)
+        return self.base / units.scale
+
+    def cvt_to(self, units):
+        if not self.units.compatible(units):
+            raise UnitMismatchError(self.units, units)
+        return _normalized(self.base, units)
+
+    def __add__(self, other):
+        if isinstance(other, Quantity):
+            self.__same(other)
+            return _normalized(self.base + _base(other), self.units)
+        if other == 0:
+            return self
+        return NotImplemented
+
+    def __sub__(self, other):
+        if isinstance(other, Quantity):
+            self.__same(other)
+            return _normalized(self.base - _base(other), self.units)
+        if other == 0:
+            return self
+        return NotImplemented
+
+    __iadd__ = __add__
+    __isub__ = __sub__
+
+    def __eq__(self, other):
+        if isinstance(other, Quantity):
+            dims = self.units.packed_dimensions
+            return dims == other.units.packed_dimensions and self.base == _base(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, Quantity):
+            dims = self.units.packed_dimensions
+            return dims != other.units.packed_dimensions or self.base != _base(other)
+        return NotImplemented
+
+    def __lt__(self, other):
+        if isinstance(other, Quantity):
+            self.__same(other)
+            return self.base < _base(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.base, self.units.packed_dimensions))
+
+    def __neg__(self):
+        return _normalized(-self.base, self.units)
+
+    def __abs__(self):
+        return _normalized(abs(self.base), self.units)
+
+    def __mul__(self, rhs):
+        if isinstance(rhs, Quantity):
+            return _normalized(self.base * _base(rhs), self.units * rhs.units)
+        if isinstance(rhs, SIUnit):
+            return NormalizedQuantity(self.quantity, self.units * rhs)
+        return _normalized(self.base * rhs, self.units)
+
+    __imul__ = __mul__
+
+    def __rmul__(self, lhs):
+        return _normalized(lhs * self.base, self.units)
+
+    def __truediv__(self, rhs):
+        if isinstance(rhs, Quantity):
+            return _normalized(self.base / _base(rhs), self.units / rhs.units)
+        if isinstance(rhs, SIUnit):
+            return NormalizedQuantity(self.quantity, self.units / rhs)
+        return _normalized(self.base / rhs, self.units)
+
+    __itruediv__ = __truediv__
+
+    def __rtruediv__(self, lhs):
+        return _normalized(lhs / self.base, ~self.units)
+
+    def __pow__(self, exponent):
+        try:
+            return _normalized(self.base ** exponent, self.units ** exponent)
+        except TypeError:
+            return NotImplemented
+
+    def __invert__(self):
+        return _normalized(1 / self.base, ~self.units)
+
+    def __copy__(self):
+        return _normalized(copy(self.base), self.units)
+
+    def __deepcopy__(self, memodict):
+        return _normalized(deepcopy(self.base), self.units)
+
+
+def normalize(quantity):
+    """Store a quantity's value in base SI units as well, see
+    :class:`NormalizedQuantity`.
+
+    :param quantity: The quantity to normalize.
+    :type quantity: :class:`Quantity`
+    :rtype: :class:`NormalizedQuantity`
+    """
+    if isinstance(quantity, NormalizedQuantity):
+        return quantity
+    if not isinstance(quantity, Quantity):
+        raise unexpected_type_error("quantity", Quantity, quantity)
+    return NormalizedQuantity(quantity.quantity, quantity.units)
+
+
+register_factory(Quantity, _rewrap)
+register_factory("numpy.ndarray", "siquant.arrays:QuantityArray")
+register_factory("array.array", "siquant.arrays:from_buffer")
+register_factory("scipy.sparse.spmatrix", "siquant.sparse:SparseQuantity")
+register_factory("scipy.sparse.sparray", "siquant.sparse:SparseQuantity")
@@ -0,0 +1,112 @@
+"""Stream delimited text with unit annotated headers into array quantities.
+
+Requires numpy.
+"""
+import csv
+import re
+
+from itertools import islice
+
+import numpy as np
+
+from .quantities import make
+from .parsing import parse_unit
+
+_HEADER = re.compile(r"^\s*(?P<name>.*?)\s*\[(?P<units>[^\]]*)\]\s*$")
+
+
+def parse_header(header):
+    """Split a column header such as ``"force [kN]"`` into its name and units.
+
+    :param header: The column header.
+    :type header: ``str``
+    :rtype: ``Tuple[str, Optional[SIUnit]]``
+    """
+    match = _HEADER.match(header)
+    if match is None:
+        return header.strip(), None
+    return match.group("name"), parse_unit(match.group("units"))
+
+
+def _floats(values):
+    try:
+        return np.array(values, dtype=float)
+    except ValueError:
+        return np.array(
+            [float(value) if value.strip() else np.nan for value in values],
+            dtype=float,
+        )
+
+
+def read_csv(lines, chunk_size=65536, units=None, **reader_options):
+    """Read delimited text in chunks of unit tagged column arrays.
+
+    The first row is the header. Columns annotated with units, e.g.
+    ``"force [kN]"``, are yielded as :class:`~siquant.arrays.QuantityArray`
+    keyed by their bare name (``"force"``), other columns are yielded as
+    arrays of strings. At most ``chunk_size`` rows are held in memory, and
+    no per row quantities are created. Blank values become ``nan``.
+
+    .. code-block:: python
+
+        with open("log.csv", newline="") as f:
+            for chunk in read_csv(f, units={"force": si.newtons}):
+                peak = np.max(chunk["force"])
+
+    :param lines: The text to read, e.g. an open file.
+    :type lines: ``Iterable[str]``
+    :param chunk_size: The maximum number of rows per chunk.
+    :type chunk_size: ``int``
+    :param units: Units to convert columns to as they are read, by name.
+    :type units: ``Mapping[str, SIUnit]``
+    :param reader_options: Passed through to ``csv.reader``, e.g. ``delimiter``.
+    :raises: :class:`~siquant.exceptions.UnitMismatchError` if a target unit
+        doesn't match the column's dimensions.
+    :raises: ``ValueError`` for unknown or unannotated target columns, and
+        rows with the wrong number of fields.
+    :rtype: ``Iterator[Dict[str, Any]]``
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive.", chunk_size)
+    reader = csv.reader(lines, **reader_options)
+    header = next(reader, None)
+    if header is None:
+        return
+    columns = [parse_header(title) for title in header]
+
+    targets = dict(units or {})
+    conversions = []
+    for name, source_units in columns:
+        target_units = targets.pop(name, source_units)
+        if source_units is None:
+            if target_units is not None:
+                raise ValueError("Column '%s' has no units." % name, name)
+            conversions.append((name, None, None))
+        else:
+            converter = source_units.converter_to(target_units)
+            conversions.append((name, target_units, converter))
+    if targets:
+        raise ValueError("Unknown columns: %s" % ", ".join(targets), tuple(targets))
+
+    width = len(columns)
+    while True:
+        batch = list(islice(reader, chunk_size))
+        if not batch:
+            return
+        rows = [row for row in batch if row]
+        if not rows:
+            continue
+        for row in rows:
+            if len(row) != width:
+                raise ValueError(
+                    "Expected %d fields, got %d." % (width, len(row)), row
+                )
+
+        chunk = {}
+        for (name, target_units, converter), values in zip(conversions, zip(*rows)):
+            if converter is None:
+                chunk[name] = np.array(values)
+            else:
+                data = _floats(values)
+                chunk[name] = make(converter.array(data, out=data), target_units)
+        yield chunk
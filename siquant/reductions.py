@@ -0,0 +1,185 @@
+"""Reductions over collections of quantities in possibly mixed units.
+
+Values are grouped by their units, dimensions are checked once per distinct
+unit, and every group is reduced on raw values before a single conversion
+to the result units, which are the smallest units in the collection, as for
+:meth:`~siquant.quantities.Quantity.__add__`.
+
+.. code-block:: python
+
+    from siquant import reductions
+
+    total = reductions.sum(member.axial_force for member in members)
+"""
+
+import builtins
+import math
+
+from collections import OrderedDict
+
+from .exceptions import UnitMismatchError, unexpected_type_error
+from .quantities import Quantity, make
+
+
+def _grouped(quantities, weights=None):
+    # {id(units): (units, values, weights)}, interned units share an id
+    groups = OrderedDict()
+    reference = None
+    if weights is None:
+        pairs = ((quantity, None) for quantity in quantities)
+    else:
+        pairs = zip(quantities, weights)
+    for quantity, weight in pairs:
+        try:
+            units = quantity.units
+            group = groups.get(id(units))
+        except AttributeError:
+            raise unexpected_type_error("quantities", Quantity, quantity)
+        if group is None:
+            if reference is None:
+                reference = units
+            elif not reference.compatible(units):
+                raise UnitMismatchError(reference, units)
+            group = groups[id(units)] = (units, [], [])
+        group[1].append(quantity.quantity)
+        group[2].append(weight)
+    return list(groups.values())
+
+
+def _units(groups):
+    return builtins.min(units for units, _, _ in groups)
+
+
+def _total(groups, units):
+    return builtins.sum(
+        group_units.converter_to(units)(builtins.sum(values))
+        for group_units, values, _ in groups
+    )
+
+
+def sum(quantities):
+    """Add quantities, converting once per distinct unit.
+
+    :param quantities: The quantities to add.
+    :type quantities: ``Iterable[Quantity]``
+    :raises: :class:`~siquant.exceptions.UnitMismatchError` for quantities
+        of different dimensions.
+    :rtype: ``_Q`` = :class:`~siquant.quantities.Quantity`, or ``0`` if
+        there are no quantities.
+    """
+    groups = _grouped(quantities)
+    if not groups:
+        return 0
+    units = _units(groups)
+    return make(_total(groups, units), units)
+
+
+def fsum(quantities):
+    """Add scalar quantities with compensated summation, see ``math.fsum``.
+
+    Every group is summed exactly and converted with a single rounding.
+
+    :param quantities: The quantities to add.
+    :type quantities: ``Iterable[Quantity]``
+    :raises: :class:`~siquant.exceptions.UnitMismatchError` for quantities
+        of different dimensions.
+    :rtype: ``_Q`` = :class:`~siquant.quantities.Quantity`, or ``0.0`` if
+        there are no quantities.
+    """
+    groups = _grouped(quantities)
+    if not groups:
+        return 0.0
+    units = _units(groups)
+    total = math.fsum(
+        group_units.converter_to(units)(math.fsum(values))
+        for group_units, values, _ in groups
+    )
+    return make(total, units)
+
+
+def mean(quantities):
+    """Get the arithmetic mean of quantities.
+
+    :param quantities: The quantities to average.
+    :type quantities: ``Iterable[Quantity]``
+    :raises: ``ValueError`` if there are no quantities.
+    :raises: :class:`~siquant.exceptions.UnitMismatchError` for quantities
+        of different dimensions.
+    :rtype: ``_Q`` = :class:`~siquant.quantities.Quantity`
+    """
+    groups = _grouped(quantities)
+    if not groups:
+        raise ValueError("mean requires at least one quantity")
+    units = _units(groups)
+    count = builtins.sum(len(values) for _, values, _ in groups)
+    return make(_total(groups, units) / count, units)
+
+
+def average(quantities, weights):
+    """Get the weighted mean of quantities.
+
+    :param quantities: The quantities to average.
+    :type quantities: ``Iterable[Quantity]``
+    :param weights: A dimensionless weight for each quantity.
+    :type weights: ``Iterable[numbers.Real]``
+    :raises: ``ValueError`` if there are no quantities, or the weights add
+        up to zero.
+    :raises: :class:`~siquant.exceptions.UnitMismatchError` for quantities
+        of different dimensions.
+    :rtype: ``_Q`` = :class:`~siquant.quantities.Quantity`
+    """
+    groups = _grouped(quantities, weights)
+    if not groups:
+        raise ValueError("average requires at least one quantity")
+    units = _units(groups)
+    total = builtins.sum(
+        group_units.converter_to(units)(
+            builtins.sum(w * v for v, w in zip(values, group_weights))
+        )
+        for group_units, values, group_weights in groups
+    )
+    weight = builtins.sum(builtins.sum(w) for _, _, w in groups)
+    if not weight:
+        raise ValueError("average requires weights with a non zero sum")
+    return make(total / weight, units)
+
+
+def _extreme(quantities, pick):
+    groups = _grouped(quantities)
+    if not groups:
+        raise ValueError("%s requires at least one quantity" % pick.__name__)
+    units = _units(groups)
+    candidates = [(group_units, pick(values)) for group_units, values, _ in groups]
+    # converted only to compare, the result keeps its own units
+    best = pick(
+        range(len(candidates)),
+        key=lambda i: candidates[i][0].converter_to(units)(candidates[i][1]),
+    )
+    group_units, value = candidates[best]
+    return make(value, group_units)
+
+
+def min(quantities):
+    """Get the smallest of scalar quantities, in its own units.
+
+    :param quantities: The quantities to compare.
+    :type quantities: ``Iterable[Quantity]``
+    :raises: ``ValueError`` if there are no quantities.
+    :raises: :class:`~siquant.exceptions.UnitMismatchError` for quantities
+        of different dimensions.
+    :rtype: ``_Q`` = :class:`~siquant.quantities.Quantity`
+    """
+    return _extreme(quantities, builtins.min)
+
+
+def max(quantities):
+    """Get the largest of scalar quantities, in its own units.
+
+    :param quantities: The quantities to compare.
+    :type quantities: ``Iterable[Quantity]``
+    :raises: ``ValueError`` if there are no quantities.
+    :raises: :class:`~siquant.exceptions.UnitMismatchError` for quantities
+        of different dimensions.
+    :rtype: ``_Q`` = :class:`~siquant.quantities.Quantity`
+    """
+    return _extreme(quantities, builtins.max)
@@ -0,0 +1,216 @@
+"""Validate and convert batches of records against declared units.
+
+A :class:`Schema` maps field names to either target units, to which values
+are converted, or dimensions, which values are only checked against. Every
+field remembers the outcome for each unit it has seen, so a batch costs one
+dict lookup per value rather than a dimension comparison.
+
+.. code-block:: python
+
+    loads = Schema({"force": si.kilonewtons, "lever_arm": distance_t})
+    records = loads.convert(incoming)
+
+Records may be mappings, sequences ordered as the fields are declared, or
+dataclass instances; all errors in a batch are reported together by
+:class:`~siquant.exceptions.SchemaError`.
+"""
+
+from collections import namedtuple
+
+from .dimensions import dim_pack, dim_str
+from .exceptions import SchemaError, unexpected_type_error
+from .quantities import make
+from .units import SIUnit
+
+_MISSING = object()
+
+
+class FieldError(namedtuple("FieldError", ("index", "field", "message"))):
+    """A field of a record which doesn't match its schema.
+
+    :ivar index: The position of the record in the batch.
+    :ivar field: The name of the field.
+    :ivar message: The reason.
+    """
+
+    __slots__ = ()
+
+    def __str__(self):
+        return "record %s, %r: %s" % self
+
+
+class _Field:
+    __slots__ = ("name", "position", "units", "dimensions", "packed", "outcomes")
+
+    def __init__(self, name, position, target):
+        self.name = name
+        self.position = position
+        if isinstance(target, SIUnit):
+            self.units = target
+            self.dimensions = target.dimensions
+        elif isinstance(target, tuple) and len(target) == 7:
+            self.units = None
+            self.dimensions = target
+        else:
+            raise unexpected_type_error(name, SIUnit, target)
+        self.packed = dim_pack(self.dimensions)
+        # {id(units): (units, factor or None)}, None marks a mismatch
+        self.outcomes = {}
+
+    def factor(self, units):
+        outcome = self.outcomes.get(id(units))
+        if outcome is not None and outcome[0] is units:
+            return outcome[1]
+        factor = None
+        if units.packed_dimensions == self.packed:
+            if self.units is None or units == self.units:
+                factor = 1
+            else:
+                factor = units.scale / self.units.scale
+        self.outcomes[id(units)] = (units, factor)
+        return factor
+
+    def expected(self):
+        if self.units is None:
+            return "dimensions %s" % dim_str(self.dimensions)
+        return "units of %s" % self.units
+
+
+def _reader(record):
+    if hasattr(record, "__dataclass_fields__"):
+        return lambda field: getattr(record, field.name, _MISSING)
+    if hasattr(record, "keys"):
+        return lambda field: record.get(field.name, _MISSING)
+    return lambda field: (
+        record[field.position] if field.position < len(record) else _MISSING
+    )
+
+
+class Schema:
+    """A compiled declaration of the units of record fields.
+
+    :param fields: Target units, to convert to, or dimensions, to check
+        against, by field name.
+    :type fields: ``Mapping[str, Union[SIUnit, tuple]]``
+    """
+
+    __slots__ = ("fields",)
+
+    def __init__(self, fields):
+        self.fields = tuple(
+            _Field(name, position, target)
+            for position, (name, target) in enumerate(fields.items())
+        )
+
+    def _values(self, records, errors):
+        for index, record in enumerate(records):
+            read = _reader(record)
+            values = {}
+            for field in self.fields:
+                value = read(field)
+                if value is _MISSING:
+                    errors.append(FieldError(index, field.name, "missing"))
+                    continue
+                try:
+                    factor = field.factor(value.units)
+                except AttributeError:
+                    message = "expected a quantity, got %r" % (value,)
+                    errors.append(FieldError(index, field.name, message))
+                    continue
+                if factor is None:
+                    message = "expected %s, got %s" % (
+                        field.expected(),
+                        value.units,
+                    )
+                    errors.append(FieldError(index, field.name, message))
+                elif field.units is None:
+                    values[field.name] = value
+                elif factor == 1:
+                    values[field.name] = make(value.quantity, field.units)
+                else:
+                    values[field.name] = make(factor * value.quantity, field.units)
+            yield record, values
+
+    def errors(self, records):
+        """Check a batch of records, collecting every error.
+
+        :param records: The records to check.
+        :type records: ``Iterable``
+        :rtype: ``List[FieldError]``
+        """
+        errors = []
+        for _ in self._values(records, errors):
+            pass
+        return errors
+
+    def validate(self, records):
+        """Check a batch of records.
+
+        :param records: The records to check.
+        :type records: ``Iterable``
+        :raises: :class:`~siquant.exceptions.SchemaError` listing every error.
+        """
+        errors = self.errors(records)
+        if errors:
+            raise SchemaError(errors)
+
+    def convert(self, records):
+        """Check a batch of records and convert their fields to target units.
+
+        Converted records are of the same kind as the input: dicts, tuples,
+        or dataclass instances created with ``dataclasses.replace``. Fields
+        declared by dimensions, and fields not in the schema, are kept as is.
+
+        :param records: The records to convert.
+        :type records: ``Iterable``
+        :raises: :class:`~siquant.exceptions.SchemaError` listing every error.
+        :rtype: ``list``
+        """
+        errors = []
+        converted = []
+        for record, values in self._values(records, errors):
+            if errors:
+                continue
+            if hasattr(record, "__dataclass_fields__"):
+                from dataclasses import replace
+
+                converted.append(replace(record, **values))
+            elif hasattr(record, "keys"):
+                result = dict(record)
+                result.update(values)
+                converted.append(result)
+            else:
+                result = list(record)
+                for field in self.fields:
+                    result[field.position] = values[field.name]
+                if hasattr(record, "_make"):
+                    converted.append(record._make(result))
+                else:
+                    converted.append(type(record)(result))
+        if errors:
+            raise SchemaError(errors)
+        return converted
+
+    def convert_columns(self, columns):
+        """Check and convert columnar data, e.g. array quantities by name.
+
+        :param columns: One quantity per field, by name.
+        :type columns: ``Mapping[str, Quantity]``
+        :raises: :class:`~siquant.exceptions.SchemaError` listing every error,
+            indexed as record ``None``.
+        :rtype: ``dict``
+        """
+        errors = []
+        values = {}
+        for _, values in self._values((columns,), errors):
+            pass
+        if errors:
+            raise SchemaError([error._replace(index=None) for error in errors])
+        result = dict(columns)
+        result.update(values)
+        return result
+
+    def __repr__(self):
+        return "Schema(%s)" % ", ".join(
+            "%s=%s" % (field.name, field.expected()) for field in self.fields
+        )
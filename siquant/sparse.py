@@ -0,0 +1,146 @@
+"""Quantities backed by ``scipy.sparse`` matrices.
+
+:class:`SparseQuantity` is created automatically by
+:attr:`~siquant.units.SIUnit.factory` whenever the wrapped value is a scipy
+sparse matrix or array. Unit conversions and scalar multiplication rescale
+the stored values only, so memory stays proportional to the number of
+nonzeros and no operation densifies.
+
+.. code-block:: python
+
+    K = make(stiffness, si.kilonewtons / si.meters)
+    F = make(loads, si.kilonewtons)
+    u = solve(K, F)
+
+Requires scipy.
+"""
+import numbers
+
+from operator import matmul
+
+from scipy.sparse import csr_matrix
+from scipy.sparse.linalg import spsolve
+
+from .exceptions import unexpected_type_error
+from .quantities import Quantity, make
+
+
+# formats which keep their stored values in a flat .data array
+_DATA_FORMATS = frozenset(("csr", "csc", "coo", "bsr", "dia"))
+
+
+def _rescaled(matrix, factor):
+    if factor == 1:
+        return matrix
+    if matrix.format in _DATA_FORMATS:
+        scaled = matrix.copy()
+        scaled.data = factor * matrix.data
+        return scaled
+    return factor * matrix
+
+
+class SparseQuantity(Quantity):
+    """Quantity wrapping a ``scipy.sparse`` matrix.
+
+    .. note::
+
+        As with :class:`~siquant.quantities.Quantity`, creation through
+        :func:`~siquant.quantities.make` is preferred.
+
+    :param quantity: The sparse matrix to be wrapped.
+    :type quantity: ``scipy.sparse.spmatrix``
+    :param units: The units the matrix's values are expressed in.
+    :type units: :class:`~siquant.units.SIUnit`
+    """
+
+    __slots__ = ()
+
+    # numpy operators defer to __rmatmul__ and friends rather than densifying
+    __array_ufunc__ = None
+
+    __hash__ = None
+
+    def get_as(self, units):
+        """Extract the sparse matrix expressed in units, scaling only its nonzeros.
+
+        :param units: The units to express the matrix in.
+        :type units: :class:`~siquant.units.SIUnit`
+        :raises: :class:`~siquant.exceptions.UnitMismatchError` if the units
+            are of different dimensions.
+        :rtype: ``scipy.sparse.spmatrix``
+        """
+        return _rescaled(self.quantity, self.units.converter_to(units).factor)
+
+    def __mul__(self, rhs):
+        if isinstance(rhs, Quantity) and isinstance(rhs.quantity, numbers.Number):
+            return make(_rescaled(self.quantity, rhs.quantity), self.units * rhs.units)
+        if isinstance(rhs, numbers.Number):
+            return make(_rescaled(self.quantity, rhs), self.units)
+        return super().__mul__(rhs)
+
+    __imul__ = __mul__
+
+    def __rmul__(self, lhs):
+        if isinstance(lhs, numbers.Number):
+            return make(_rescaled(self.quantity, lhs), self.units)
+        return super().__rmul__(lhs)
+
+    def __truediv__(self, rhs):
+        if isinstance(rhs, Quantity) and isinstance(rhs.quantity, numbers.Number):
+            return make(
+                _rescaled(self.quantity, 1 / rhs.quantity), self.units / rhs.units
+            )
+        if isinstance(rhs, numbers.Number):
+            return make(_rescaled(self.quantity, 1 / rhs), self.units)
+        return super().__truediv__(rhs)
+
+    __itruediv__ = __truediv__
+
+    def __neg__(self):
+        return make(_rescaled(self.quantity, -1), self.units)
+
+    def __rmatmul__(self, lhs):
+        if isinstance(lhs, Quantity):
+            return make(matmul(lhs.quantity, self.quantity), lhs.units * self.units)
+        return super().__rmatmul__(lhs)
+
+    def __len__(self):
+        return self.quantity.shape[0]
+
+    def __iter__(self):
+        rows = csr_matrix(self.quantity)
+        units = self.units
+        return (make(rows[i], units) for i in range(rows.shape[0]))
+
+    def __getitem__(self, idx):
+        return make(self.quantity[idx], self.units)
+
+    def __bool__(self):
+        return bool(self.quantity.nnz)
+
+    @property
+    def nnz(self):
+        """The number of stored values.
+
+        :rtype: ``int``
+        """
+        return self.quantity.nnz
+
+
+def solve(matrix, rhs):
+    """Solve the sparse linear system ``matrix @ x = rhs`` with units inferred.
+
+    The solution is expressed in ``rhs.units / matrix.units``, e.g.
+    displacements in meters from stiffnesses in kN/m and loads in kN.
+
+    :param matrix: A square sparse matrix quantity.
+    :type matrix: :class:`SparseQuantity`
+    :param rhs: The right hand side, a vector or matrix quantity.
+    :type rhs: :class:`~siquant.quantities.Quantity`
+    :rtype: ``_Q`` = :class:`~siquant.quantities.Quantity`
+    """
+    if not isinstance(matrix, SparseQuantity):
+        raise unexpected_type_error("matrix", SparseQuantity, matrix)
+    if not isinstance(rhs, Quantity):
+        raise unexpected_type_error("rhs", Quantity, rhs)
+    return make(spsolve(matrix.quantity, rhs.quantity), rhs.units / matrix.units)
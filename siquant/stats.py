@@ -0,0 +1,175 @@
+"""Runtime counters for the hot paths of siquant.
+
+Collection is disabled by default and costs nothing while disabled: enabling
+it swaps counting wrappers in for the instrumented functions, disabling it
+restores the originals.
+
+.. code-block:: python
+
+    from siquant import stats
+
+    with stats.collecting():
+        run_workload()
+    print(stats.snapshot())
+
+Counted while enabled:
+
+- ``quantities``: quantities constructed through
+  :class:`~siquant.quantities.Quantity`'s ``__init__``, by class name.
+  Classes with their own constructors skip it and aren't counted, such as
+  :class:`~siquant.quantities.NormalizedQuantity`, the results of
+  :class:`~siquant.fixed.FixedQuantity` arithmetic and vector quantities,
+- ``factory_calls``: calls to :attr:`~siquant.units.SIUnit.factory`, which
+  includes :func:`~siquant.quantities.make` and ``value * units``,
+- ``unit_cache``: hits and misses of :attr:`~siquant.units.SIUnit.cache`,
+- ``flyweight``: hits and misses when interning :class:`~siquant.units.SIUnit`,
+- ``conversions``: :meth:`~siquant.quantities.Quantity.get_as` calls by
+  ``(from_units, to_units)``,
+- ``unit_mismatches``: :class:`~siquant.exceptions.UnitMismatchError` raised.
+"""
+from collections import Counter
+from contextlib import contextmanager
+
+from . import units as _units
+from .dimensions import dim_unpack
+from .exceptions import UnitMismatchError
+from .quantities import Quantity
+from .units import SIUnit
+
+_counts = Counter()
+_cache_baseline = [0, 0]
+_originals = {}
+
+
+def _counting_init(self, quantity, units):
+    _counts["quantities", type(self).__name__] += 1
+    _originals["init"](self, quantity, units)
+
+
+def _counting_factory(quantity, units):
+    _counts["factory_calls"] += 1
+    return _originals["factory_callable"](quantity, units)
+
+
+def _counting_new(cls, *args):
+    hit = SIUnit._instances.get(args) is not None
+    _counts["flyweight", "hits" if hit else "misses"] += 1
+    return _originals["new"](cls, *args)
+
+
+def _counting_derived_unit(scale, packed, expected=None):
+    hit = SIUnit._instances.get((scale, dim_unpack(packed))) is not None
+    _counts["flyweight", "hits" if hit else "misses"] += 1
+    return _originals["derived_unit"](scale, packed, expected)
+
+
+def _counting_get_as(self, units):
+    _counts["conversions", self.units, units] += 1
+    return _originals["get_as"](self, units)
+
+
+def _counting_mismatch_init(self, u1, u2):
+    _counts["unit_mismatches"] += 1
+    _originals["mismatch_init"](self, u1, u2)
+
+
+def is_enabled():
+    """Check whether counters are being collected.
+
+    :rtype: ``bool``
+    """
+    return bool(_originals)
+
+
+def enable():
+    """Start collecting counters. Has no effect if already enabled."""
+    if _originals:
+        return
+    _originals["init"] = Quantity.__init__
+    _originals["factory"] = SIUnit.__dict__["factory"]
+    _originals["factory_callable"] = SIUnit.factory
+    _originals["new"] = SIUnit.__new__
+    _originals["derived_unit"] = _units._derived_unit
+    _originals["get_as"] = Quantity.get_as
+    _originals["mismatch_init"] = UnitMismatchError.__init__
+
+    Quantity.__init__ = _counting_init
+    SIUnit.factory = staticmethod(_counting_factory)
+    SIUnit.__new__ = _counting_new
+    _units._derived_unit = _counting_derived_unit
+    Quantity.get_as = _counting_get_as
+    UnitMismatchError.__init__ = _counting_mismatch_init
+    _cache_baseline[:] = [SIUnit.cache.hits, SIUnit.cache.misses]
+
+
+def disable():
+    """Stop collecting counters, restoring the uninstrumented functions.
+
+    Counters collected so far are kept until :func:`reset`.
+    """
+    if not _originals:
+        return
+    _counts["unit_cache", "hits"] += SIUnit.cache.hits - _cache_baseline[0]
+    _counts["unit_cache", "misses"] += SIUnit.cache.misses - _cache_baseline[1]
+
+    Quantity.__init__ = _originals.pop("init")
+    SIUnit.factory = _originals.pop("factory")
+    del _originals["factory_callable"]
+    SIUnit.__new__ = _originals.pop("new")
+    _units._derived_unit = _originals.pop("derived_unit")
+    Quantity.get_as = _originals.pop("get_as")
+    UnitMismatchError.__init__ = _originals.pop("mismatch_init")
+
+
+def reset():
+    """Zero all counters."""
+    _counts.clear()
+    _cache_baseline[:] = [SIUnit.cache.hits, SIUnit.cache.misses]
+
+
+@contextmanager
+def collecting(reset_counters=True):
+    """Collect counters within a block, restoring the previous state after.
+
+    :param reset_counters: Zero the counters before collecting.
+    :type reset_counters: ``bool``
+    """
+    was_enabled = is_enabled()
+    if reset_counters:
+        reset()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def snapshot():
+    """Get a copy of the current counters.
+
+    :rtype: ``dict``
+    """
+    cache_hits = _counts["unit_cache", "hits"]
+    cache_misses = _counts["unit_cache", "misses"]
+    if _originals:
+        cache_hits += SIUnit.cache.hits - _cache_baseline[0]
+        cache_misses += SIUnit.cache.misses - _cache_baseline[1]
+
+    result = {
+        "quantities": {},
+        "factory_calls": _counts["factory_calls"],
+        "unit_cache": {"hits": cache_hits, "misses": cache_misses},
+        "flyweight": {
+            "hits": _counts["flyweight", "hits"],
+            "misses": _counts["flyweight", "misses"],
+        },
+        "conversions": {},
+        "unit_mismatches": _counts["unit_mismatches"],
+    }
+    for key, count in _counts.items():
+        if key[0] == "quantities":
+            result["quantities"][key[1]] = count
+        elif key[0] == "conversions":
+            result["conversions"][key[1:]] = count
+    return result
@@ -1,6 +1,6 @@
 from siquant.units import SIUnit
 
-from .si import pascals
+from .si import g_0, pascals
 
 #:
 inches = SIUnit.Unit(25.4 / 1000, m=1)
@@ -59,6 +59,12 @@ stones = SIUnit.Unit(14) * pounds
 #:
 tons = SIUnit.Unit(2240) * pounds
 
+#:
+pounds_force = pounds * g_0
+
+#:
+kips = SIUnit.Unit(1000) * pounds_force
+
 #:
 psi = SIUnit.Unit(6894.75729) * pascals
 
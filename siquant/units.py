@@ -1,9 +1,20 @@
 from functools import total_ordering
 
-from .dimensions import SIDimensions, dim_div, dim_mul, dim_pow, dim_str
-from .util import immutable, flyweight
+from .dimensions import (
+    SIDimensions,
+    dim_div,
+    dim_mul,
+    dim_pack,
+    dim_pow,
+    dim_str,
+    dim_unpack,
+)
+from .converters import Converter
+from .util import BoundedCache, immutable, flyweight
 from .exceptions import UnitMismatchError
 
+_MUL, _DIV, _POW, _INV, _CVT = range(5)
+
 
 @total_ordering
 @flyweight
@@ -18,18 +29,26 @@ class SIUnit:
     :type scale: ``numbers.Real``
     :param dimensions: The base SI dimensions.
     :type dimensions: ``tuple``
+
+    :ivar packed_dimensions: The dimensions encoded by
+        :func:`~siquant.dimensions.dim_pack`, used for unit arithmetic and
+        compatibility checks.
+    :vartype packed_dimensions: ``int``
     """
 
-    __slots__ = ("scale", "dimensions", "__weakref__")
+    __slots__ = ("scale", "dimensions", "packed_dimensions", "__weakref__")
 
     #:
     #: The factory function which unit instances use to create quantities.
     #:
     #:    .. note::
     #:
-    #:        SIUnit.factory is mapped to :class:`~siquant.quantities.Quantity`
-    #:        in __init__ by default. However, it is *not* required to be a type,
-    #:        and can be overwritten in client configuration.
+    #:        SIUnit.factory is mapped to :func:`~siquant.quantities.factory`
+    #:        in __init__ by default, which picks the quantity class registered
+    #:        for the type of the value with
+    #:        :func:`~siquant.quantities.register_factory`. However, it is *not*
+    #:        required to be a type, and can be overwritten in client
+    #:        configuration.
     #:
     #:        It's purpose is to provide a consistent way to wrap values, and allow
     #:        simple extensibility.
@@ -38,15 +57,27 @@ class SIUnit:
     #:
     #:        .. code-block:: python
     #:
-    #:            def ext_factory(q, u):
-    #:                if isinstance(q, Vector):
-    #:                    return VectorQuantity(q, u)
-    #:                return Quantity(q, u)
-    #:
-    #:            SIUnit.factory = staticmethod(ext_factory)
+    #:            register_factory(Vector, VectorQuantity)
     #:
     factory = None
 
+    #:
+    #: Results of unit arithmetic (``*``, ``/``, ``**`` and ``~``), keyed on the
+    #: identity of the operands.
+    #:
+    #:    .. note::
+    #:
+    #:        Units are flyweights, so equal units are the same object and a
+    #:        cache hit is a single dict lookup. The size can be changed with
+    #:        ``SIUnit.cache.resize(n)`` (``0`` disables caching) and
+    #:        ``SIUnit.cache.info()`` reports hits and misses.
+    #:
+    cache = BoundedCache(4096)
+
+    #: Defer numpy operators (``array * units``) to the unit's reflected
+    #: operators so arrays are wrapped whole rather than element by element.
+    __array_ufunc__ = None
+
     @staticmethod
     def Unit(scale=1.0, kg=0, m=0, s=0, k=0, a=0, mol=0, cd=0):
         """Create a new SIUnit with a scale of provided base units.
@@ -76,6 +107,7 @@ class SIUnit:
             raise ValueError("SIunit scale must be positive.")
         super().__setattr__("scale", scale)
         super().__setattr__("dimensions", dimensions)
+        super().__setattr__("packed_dimensions", dim_pack(dimensions))
 
     kg = property(lambda self: self.dimensions[0])
     m = property(lambda self: self.dimensions[1])
@@ -99,7 +131,7 @@ class SIUnit:
         :type units: :class:`~siquant.units.SIUnit`
         :rtype: ``bool``
         """
-        return self.dimensions == units.dimensions
+        return self.packed_dimensions == units.packed_dimensions
 
     def quantities(self, iterable):
         """Create quantities these units for all arguments.
@@ -118,13 +150,35 @@ class SIUnit:
     def unpack(self, *quantities):
         return self.values(quantities)
 
+    def converter_to(self, units):
+        """Get a precompiled converter of values from these units to others.
+
+        :param units: The units to convert values to.
+        :type units: :class:`~siquant.units.SIUnit`
+        :raises: :class:`~siquant.exceptions.UnitMismatchError` if the units
+            are of different dimensions.
+        :rtype: :class:`~siquant.converters.Converter`
+        """
+        key = (_CVT, id(self), id(units))
+        converter = self.cache.get(key)
+        if converter is None:
+            converter = self.cache.put(key, Converter(self, units), self, units)
+        return converter
+
     __call__ = quantities
 
     def __mul__(self, rhs):
         if isinstance(rhs, SIUnit):
-            return SIUnit(
-                self.scale * rhs.scale, dim_mul(self.dimensions, rhs.dimensions)
-            )
+            key = (_MUL, id(self), id(rhs))
+            units = self.cache.get(key)
+            if units is None:
+                units = _derived_unit(
+                    self.scale * rhs.scale,
+                    self.packed_dimensions + rhs.packed_dimensions,
+                    dim_mul(self.dimensions, rhs.dimensions),
+                )
+                self.cache.put(key, units, self, rhs)
+            return units
         return self.factory(rhs, self)
 
     def __rmul__(self, lhs):
@@ -132,45 +186,103 @@ class SIUnit:
 
     def __truediv__(self, rhs):
         if isinstance(rhs, SIUnit):
-            return SIUnit(
-                self.scale / rhs.scale, dim_div(self.dimensions, rhs.dimensions)
-            )
+            key = (_DIV, id(self), id(rhs))
+            units = self.cache.get(key)
+            if units is None:
+                units = _derived_unit(
+                    self.scale / rhs.scale,
+                    self.packed_dimensions - rhs.packed_dimensions,
+                    dim_div(self.dimensions, rhs.dimensions),
+                )
+                self.cache.put(key, units, self, rhs)
+            return units
         return self.factory(1 / rhs, self)
 
     def __rtruediv__(self, lhs):
         return self.factory(lhs, ~self)
 
     def __pow__(self, rhs):
+        cacheable = type(rhs) in (int, float)
+        if cacheable:
+            key = (_POW, id(self), rhs)
+            units = self.cache.get(key)
+            if units is not None:
+                return units
         try:
-            return SIUnit(self.scale ** rhs, dim_pow(self.dimensions, rhs))
+            scale = self.scale ** rhs
+            dimensions = dim_pow(self.dimensions, rhs)
+            if type(rhs) is int:
+                packed = self.packed_dimensions * rhs
+            else:
+                packed = dim_pack(dimensions)
         except TypeError:
             return NotImplemented
+        units = _derived_unit(scale, packed, dimensions)
+        if cacheable:
+            self.cache.put(key, units, self)
+        return units
 
     def __invert__(self):
-        return SIUnit(1 / self.scale, dim_div(SIDimensions(), self.dimensions))
+        key = (_INV, id(self))
+        units = self.cache.get(key)
+        if units is None:
+            units = _derived_unit(1 / self.scale, -self.packed_dimensions)
+            self.cache.put(key, units, self)
+        return units
 
     def __eq__(self, other):
         if isinstance(other, SIUnit):
-            return self.scale == other.scale and self.dimensions == other.dimensions
+            dims = self.packed_dimensions
+            return self.scale == other.scale and dims == other.packed_dimensions
         return NotImplemented
 
     def __lt__(self, other):
         if isinstance(other, SIUnit):
-            if self.dimensions != other.dimensions:
+            if self.packed_dimensions != other.packed_dimensions:
                 raise UnitMismatchError(self, other)
             return self.scale < other.scale
         return NotImplemented
 
     def __ne__(self, other):
         if isinstance(other, SIUnit):
-            return self.scale != other.scale or self.dimensions != other.dimensions
+            dims = self.packed_dimensions
+            return self.scale != other.scale or dims != other.packed_dimensions
         return NotImplemented
 
     def __hash__(self):
-        return hash((self.scale, self.dimensions))
+        return hash((self.scale, self.packed_dimensions))
 
     def __str__(self):
         return "%g*%s" % (self.scale, dim_str(self.dimensions))
 
     def __repr__(self):
         return "SIUnit(%f, %r)" % (self.scale, self.dimensions)
+
+
+_instances = SIUnit._instances
+
+
+def _derived_unit(scale, packed, expected=None):
+    """Get the unit for a validated scale and packed dimensions.
+
+    Internal fast path for unit arithmetic which skips the validation
+    performed by :class:`SIUnit`'s constructor. Packed arithmetic carries
+    silently from a field which overflows into the next, so when the
+    ``expected`` dimensions disagree with the packed result they are
+    packed again, which raises ``ValueError`` for exponents out of range.
+    """
+    dimensions = dim_unpack(packed)
+    if expected is not None and any(
+        abs(a - b) > 1e-6 for a, b in zip(dimensions, expected)
+    ):
+        packed = dim_pack(expected)
+        dimensions = dim_unpack(packed)
+    key = (scale, dimensions)
+    units = _instances.get(key)
+    if units is None:
+        units = object.__new__(SIUnit)
+        object.__setattr__(units, "scale", scale)
+        object.__setattr__(units, "dimensions", dimensions)
+        object.__setattr__(units, "packed_dimensions", packed)
+        _instances[key] = units
+    return units
@@ -18,6 +18,119 @@ def immutable(cls):
 
 
 def flyweight(cls):
+    """Intern instances of cls by their constructor arguments.
+
+    Existing instances are returned without allocating or re-running
+    ``__init__``, which is only invoked when a new instance is created.
+    The interned instances are exposed as ``cls._instances``.
+    """
     instances = weakref.WeakValueDictionary()
-    cls.__new__ = lambda cls, *args: instances.setdefault(args, object.__new__(cls))
+    init = cls.__init__
+
+    def __new__(cls, *args):
+        instance = instances.get(args)
+        if instance is None:
+            instance = object.__new__(cls)
+            init(instance, *args)
+            instances[args] = instance
+        return instance
+
+    cls.__new__ = __new__
+    cls.__init__ = object.__init__
+    cls._instances = instances
     return cls
+
+
+def _evict_oldest(entries):
+    # threads may race to evict the same entry, or resize the dict while the
+    # oldest key is looked up; either way an entry is gone, which suffices
+    try:
+        entries.pop(next(iter(entries), None), None)
+    except RuntimeError:
+        pass
+
+
+class BoundedCache:
+    """A bounded result cache which evicts its oldest entries first.
+
+    Entries may hold references to the objects their key was derived from,
+    which allows keys to be built from ``id()`` without the risk of the ids
+    being recycled while the entry is alive.
+
+    :ivar hits: The number of successful lookups.
+    :ivar misses: The number of failed lookups.
+
+    :param maxsize: The maximum number of entries, ``None`` for unbounded or
+        ``0`` to disable caching.
+    :type maxsize: ``Optional[int]``
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "_entries")
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+
+    def get(self, key):
+        """Look up a cached value.
+
+        :param key: The cache key.
+        :return: The cached value, or ``None`` on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value, *refs):
+        """Store a value, evicting the oldest entry if the cache is full.
+
+        :param key: The cache key.
+        :param value: The value to store.
+        :param refs: Objects to keep alive as long as the entry is cached.
+        :return: ``value``
+        """
+        entries = self._entries
+        if self.maxsize is not None and len(entries) >= self.maxsize:
+            if not self.maxsize:
+                return value
+            _evict_oldest(entries)
+        entries[key] = (value,) + refs
+        return value
+
+    def resize(self, maxsize):
+        """Change the maximum size, evicting the oldest entries as required.
+
+        :param maxsize: The new maximum number of entries.
+        :type maxsize: ``Optional[int]``
+        """
+        self.maxsize = maxsize
+        if maxsize is not None:
+            entries = self._entries
+            while len(entries) > maxsize:
+                _evict_oldest(entries)
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """Get the cache statistics.
+
+        :rtype: ``dict`` with ``hits``, ``misses``, ``maxsize`` and ``size``.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "maxsize": self.maxsize,
+            "size": len(self._entries),
+        }
+
+    def __len__(self):
+        return len(self._entries)
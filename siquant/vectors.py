@@ -0,0 +1,403 @@
+"""Two and three dimensional vector quantities.
+
+Components are stored as plain numbers in slots next to a single unit, so
+vector arithmetic costs no more than the equivalent scalar arithmetic, and
+no intermediate quantities are created.
+
+.. code-block:: python
+
+    force = Vector3Quantity(1.0, 0.0, -2.5, si.kilonewtons)
+    arm = Vector3Quantity(0.0, 3.0, 0.0, si.meters)
+    moment = arm.cross(force)
+    moment.norm()
+"""
+import math
+
+from .exceptions import UnitMismatchError, unexpected_type_error
+from .quantities import Quantity, make, register_factory
+from .units import SIUnit
+from .util import immutable
+
+_unity = SIUnit.Unit()
+
+
+def _factors(a, b):
+    # converts both operands to the smaller units, as Quantity.__add__
+    if a is b:
+        return a, 1, 1
+    if not a.compatible(b):
+        raise UnitMismatchError(a, b)
+    units = min(a, b)
+    return units, a.scale / units.scale, b.scale / units.scale
+
+
+def _scalar(value):
+    if isinstance(value, Quantity):
+        return value.quantity, value.units
+    if isinstance(value, SIUnit):
+        return 1, value
+    return value, None
+
+
+def _angle(angle):
+    if isinstance(angle, Quantity):
+        return angle.get_as(_unity)
+    return angle
+
+
+class _VectorQuantity:
+    __slots__ = ()
+
+    def components(self):
+        """Get the components in the vector's units.
+
+        :rtype: ``tuple``
+        """
+        return tuple(getattr(self, name) for name in self.__slots__[:-1])
+
+    def is_of(self, dimensions):
+        """Check whether the vector is of given dimensions.
+
+        :param dimensions: The dimensions to check.
+        :type dimensions: ``tuple``
+        :rtype: ``bool``
+        """
+        return self.units.dimensions == dimensions
+
+    def compatible(self, other):
+        """Check whether another vector is of the same dimensions.
+
+        :rtype: ``bool``
+        """
+        return self.units.compatible(other.units)
+
+    def get_as(self, units):
+        """Get the components expressed in units.
+
+        :param units: The units to express the components in.
+        :type units: :class:`~siquant.units.SIUnit`
+        :raises: :class:`~siquant.exceptions.UnitMismatchError` if the units
+            are of different dimensions.
+        :rtype: ``tuple``
+        """
+        factor = self.units.converter_to(units).factor
+        if factor == 1:
+            return self.components()
+        return tuple(factor * value for value in self.components())
+
+    def cvt_to(self, units):
+        """Create an equivalent vector expressed in units.
+
+        :rtype: ``_V``
+        """
+        return type(self)(*(self.get_as(units) + (units,)))
+
+    def __len__(self):
+        return len(self.__slots__) - 1
+
+    def __iter__(self):
+        units = self.units
+        return (make(value, units) for value in self.components())
+
+    def __getitem__(self, idx):
+        return make(self.components()[idx], self.units)
+
+    def __eq__(self, other):
+        if isinstance(other, type(self)):
+            return self.units.compatible(other.units) and self.components() == (
+                other.get_as(self.units)
+            )
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        scale = self.units.scale
+        base = tuple(value * scale for value in self.components())
+        return hash((base, self.units.packed_dimensions))
+
+    def __repr__(self):
+        return "%s(%s, %r)" % (
+            type(self).__name__,
+            ", ".join(map(repr, self.components())),
+            self.units,
+        )
+
+    def __str__(self):
+        return "(%s) %s" % (", ".join(map(str, self.components())), self.units)
+
+
+def _vector2(x, y, units):
+    vector = object.__new__(Vector2Quantity)
+    object.__setattr__(vector, "x", x)
+    object.__setattr__(vector, "y", y)
+    object.__setattr__(vector, "units", units)
+    return vector
+
+
+def _vector3(x, y, z, units):
+    vector = object.__new__(Vector3Quantity)
+    object.__setattr__(vector, "x", x)
+    object.__setattr__(vector, "y", y)
+    object.__setattr__(vector, "z", z)
+    object.__setattr__(vector, "units", units)
+    return vector
+
+
+@immutable
+class Vector2Quantity(_VectorQuantity):
+    """A two dimensional vector quantity.
+
+    :param x: The first component.
+    :type x: ``numbers.Real``
+    :param y: The second component.
+    :type y: ``numbers.Real``
+    :param units: The units of the components.
+    :type units: :class:`~siquant.units.SIUnit`
+    """
+
+    __slots__ = ("x", "y", "units")
+
+    def __init__(self, x, y, units):
+        if not isinstance(units, SIUnit):
+            raise unexpected_type_error("units", SIUnit, units)
+        super().__setattr__("x", x)
+        super().__setattr__("y", y)
+        super().__setattr__("units", units)
+
+    def __add__(self, other):
+        if isinstance(other, Vector2Quantity):
+            units, a, b = _factors(self.units, other.units)
+            return _vector2(a * self.x + b * other.x, a * self.y + b * other.y, units)
+        return NotImplemented
+
+    def __sub__(self, other):
+        if isinstance(other, Vector2Quantity):
+            units, a, b = _factors(self.units, other.units)
+            return _vector2(a * self.x - b * other.x, a * self.y - b * other.y, units)
+        return NotImplemented
+
+    def __neg__(self):
+        return _vector2(-self.x, -self.y, self.units)
+
+    def __mul__(self, scalar):
+        value, units = _scalar(scalar)
+        units = self.units if units is None else self.units * units
+        return _vector2(self.x * value, self.y * value, units)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, scalar):
+        value, units = _scalar(scalar)
+        units = self.units if units is None else self.units / units
+        return _vector2(self.x / value, self.y / value, units)
+
+    def dot(self, other):
+        """Get the scalar product.
+
+        :rtype: ``_Q`` = :class:`~siquant.quantities.Quantity`
+        """
+        return make(self.x * other.x + self.y * other.y, self.units * other.units)
+
+    def cross(self, other):
+        """Get the out of plane component of the vector product.
+
+        :rtype: ``_Q`` = :class:`~siquant.quantities.Quantity`
+        """
+        return make(self.x * other.y - self.y * other.x, self.units * other.units)
+
+    def norm(self):
+        """Get the length.
+
+        :rtype: ``_Q`` = :class:`~siquant.quantities.Quantity`
+        """
+        return make(math.hypot(self.x, self.y), self.units)
+
+    def rotate(self, angle):
+        """Rotate counterclockwise.
+
+        :param angle: The angle, an angle quantity or a number of radians.
+        :type angle: ``Union[Quantity, float]``
+        :rtype: :class:`Vector2Quantity`
+        """
+        angle = _angle(angle)
+        cos, sin = math.cos(angle), math.sin(angle)
+        return _vector2(
+            cos * self.x - sin * self.y, sin * self.x + cos * self.y, self.units
+        )
+
+
+@immutable
+class Vector3Quantity(_VectorQuantity):
+    """A three dimensional vector quantity.
+
+    :param x: The first component.
+    :type x: ``numbers.Real``
+    :param y: The second component.
+    :type y: ``numbers.Real``
+    :param z: The third component.
+    :type z: ``numbers.Real``
+    :param units: The units of the components.
+    :type units: :class:`~siquant.units.SIUnit`
+    """
+
+    __slots__ = ("x", "y", "z", "units")
+
+    def __init__(self, x, y, z, units):
+        if not isinstance(units, SIUnit):
+            raise unexpected_type_error("units", SIUnit, units)
+        super().__setattr__("x", x)
+        super().__setattr__("y", y)
+        super().__setattr__("z", z)
+        super().__setattr__("units", units)
+
+    def __add__(self, other):
+        if isinstance(other, Vector3Quantity):
+            units, a, b = _factors(self.units, other.units)
+            return _vector3(
+                a * self.x + b * other.x,
+                a * self.y + b * other.y,
+                a * self.z + b * other.z,
+                units,
+            )
+        return NotImplemented
+
+    def __sub__(self, other):
+        if isinstance(other, Vector3Quantity):
+            units, a, b = _factors(self.units, other.units)
+            return _vector3(
+                a * self.x - b * other.x,
+                a * self.y - b * other.y,
+                a * self.z - b * other.z,
+                units,
+            )
+        return NotImplemented
+
+    def __neg__(self):
+        return _vector3(-self.x, -self.y, -self.z, self.units)
+
+    def __mul__(self, scalar):
+        value, units = _scalar(scalar)
+        units = self.units if units is None else self.units * units
+        return _vector3(self.x * value, self.y * value, self.z * value, units)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, scalar):
+        value, units = _scalar(scalar)
+        units = self.units if units is None else self.units / units
+        return _vector3(self.x / value, self.y / value, self.z / value, units)
+
+    def dot(self, other):
+        """Get the scalar product.
+
+        :rtype: ``_Q`` = :class:`~siquant.quantities.Quantity`
+        """
+        return make(
+            self.x * other.x + self.y * other.y + self.z * other.z,
+            self.units * other.units,
+        )
+
+    def cross(self, other):
+        """Get the vector product.
+
+        :rtype: :class:`Vector3Quantity`
+        """
+        return _vector3(
+            self.y * other.z - self.z * other.y,
+            self.z * other.x - self.x * other.z,
+            self.x * other.y - self.y * other.x,
+            self.units * other.units,
+        )
+
+    def norm(self):
+        """Get the length.
+
+        :rtype: ``_Q`` = :class:`~siquant.quantities.Quantity`
+        """
+        return make(
+            math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z),
+            self.units,
+        )
+
+    def rotate(self, angle, axis):
+        """Rotate counterclockwise about an axis, by Rodrigues' formula.
+
+        :param angle: The angle, an angle quantity or a number of radians.
+        :type angle: ``Union[Quantity, float]``
+        :param axis: The direction of the axis, a vector or three numbers.
+        :type axis: ``Union[Vector3Quantity, Tuple[float, float, float]]``
+        :rtype: :class:`Vector3Quantity`
+        """
+        angle = _angle(angle)
+        kx, ky, kz = axis.components() if isinstance(axis, Vector3Quantity) else axis
+        length = math.sqrt(kx * kx + ky * ky + kz * kz)
+        kx, ky, kz = kx / length, ky / length, kz / length
+        cos, sin = math.cos(angle), math.sin(angle)
+        x, y, z = self.x, self.y, self.z
+        dot = (1 - cos) * (kx * x + ky * y + kz * z)
+        return _vector3(
+            cos * x + sin * (ky * z - kz * y) + dot * kx,
+            cos * y + sin * (kz * x - kx * z) + dot * ky,
+            cos * z + sin * (kx * y - ky * x) + dot * kz,
+            self.units,
+        )
+
+
+def to_array(vectors, units=None):
+    """Convert vectors to an array quantity of shape ``(n, 2)`` or ``(n, 3)``.
+
+    Requires numpy.
+
+    :param vectors: Vectors of the same length and dimensions.
+    :type vectors: ``Sequence[_V]``
+    :param units: The units of the array, defaults to those of the first
+        vector.
+    :type units: :class:`~siquant.units.SIUnit`
+    :raises: :class:`~siquant.exceptions.UnitMismatchError` for vectors of
+        different dimensions.
+    :rtype: :class:`~siquant.arrays.QuantityArray`
+    """
+    import numpy as np
+
+    vectors = list(vectors)
+    if units is None:
+        units = vectors[0].units if vectors else _unity
+    factors = {}
+    rows = []
+    for vector in vectors:
+        factor = factors.get(id(vector.units))
+        if factor is None:
+            factor = factors[id(vector.units)] = vector.units.converter_to(units)
+        rows.append(vector.components())
+    values = np.array(rows, dtype=float)
+    if len(factors) > 1 or any(cvt.factor != 1 for cvt in factors.values()):
+        scales = np.array([factors[id(vector.units)].factor for vector in vectors])
+        values *= scales[:, np.newaxis]
+    return make(values, units)
+
+
+def from_array(array):
+    """Convert an array quantity of shape ``(n, 2)`` or ``(n, 3)`` to vectors.
+
+    :param array: The array quantity.
+    :type array: :class:`~siquant.arrays.QuantityArray`
+    :rtype: ``List[_V]``
+    """
+    values, units = array.quantity, array.units
+    width = values.shape[-1]
+    if width == 2:
+        return [_vector2(x, y, units) for x, y in values.tolist()]
+    if width == 3:
+        return [_vector3(x, y, z, units) for x, y, z in values.tolist()]
+    raise ValueError("Expected 2 or 3 columns, got %d." % width, values.shape)
+
+
+def _scaled(vector, units):
+    # make(vector, units), e.g. from scalar quantity * vector
+    return vector * units
+
+
+register_factory(_VectorQuantity, _scaled)
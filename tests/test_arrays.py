@@ -0,0 +1,234 @@
+import math
+
+import pytest
+import numpy as np
+
+from siquant import make, si
+from siquant.arrays import QuantityArray, allclose, isclose
+from siquant.exceptions import UnitMismatchError
+from siquant.quantities import Quantity
+
+
+def test_factory():
+    assert type(make(np.array([1.0, 2.0]), si.meters)) is QuantityArray
+    assert type(np.array([1.0, 2.0]) * si.meters) is QuantityArray
+    assert type(si.meters * np.array([1.0, 2.0])) is QuantityArray
+    assert type(make(1.0, si.meters)) is Quantity
+
+    distances = make(np.array([1.0, 2.0]), si.meters)
+    assert type(distances / si.seconds) is QuantityArray
+    assert (distances / si.seconds).units == si.meters / si.seconds
+
+
+def test_add_sub():
+    a = make(np.array([1.0, 2.0]), si.meters)
+    b = make(np.array([1000.0, 1000.0]), si.millimeters)
+
+    total = a + b
+    assert type(total) is QuantityArray
+    assert total.units == si.millimeters
+    assert np.allclose(total.get_as(si.meters), [2.0, 3.0])
+
+    diff = np.subtract(a, b)
+    assert np.allclose(diff.get_as(si.meters), [0.0, 1.0])
+
+    assert sum([a, b]).units == si.millimeters
+    assert a + 0 is a
+    assert a - 0 is a
+    assert 0 + a is a
+
+    with pytest.raises(UnitMismatchError):
+        a + make(np.array([1.0, 2.0]), si.seconds)
+    with pytest.raises(UnitMismatchError):
+        a + 1
+
+
+def test_mul_div():
+    forces = make(np.array([1.0, 2.0]), si.kilonewtons)
+    arms = make(np.array([2.0, 3.0]), si.meters)
+
+    moments = forces * arms
+    assert moments.units == si.kilonewtons * si.meters
+    assert np.array_equal(moments.quantity, [2.0, 6.0])
+
+    assert np.array_equal((forces * 2).quantity, [2.0, 4.0])
+    assert np.array_equal((2 * forces).quantity, [2.0, 4.0])
+
+    ratio = forces / arms
+    assert ratio.units == si.kilonewtons / si.meters
+
+    inverse = 1 / arms
+    assert inverse.units == ~si.meters
+    assert np.allclose(inverse.quantity, [0.5, 1 / 3])
+    assert (~arms).units == ~si.meters
+
+    forces *= 2
+    assert np.array_equal(forces.get_as(si.kilonewtons), [2.0, 4.0])
+
+
+def test_pow_sqrt():
+    areas = make(np.array([4.0, 9.0]), si.meters ** 2)
+
+    lengths = np.sqrt(areas)
+    assert lengths.units == si.meters
+    assert np.array_equal(lengths.quantity, [2.0, 3.0])
+
+    assert (lengths ** 2).units == si.meters ** 2
+    assert np.square(lengths).units == si.meters ** 2
+
+    with pytest.raises(TypeError):
+        lengths ** np.array([1, 2])
+
+
+def test_comparison():
+    a = make(np.array([1.0, 2.0, 3.0]), si.meters)
+    b = make(np.array([2000.0, 2000.0, 2000.0]), si.millimeters)
+
+    assert np.array_equal(a < b, [True, False, False])
+    assert np.array_equal(a == b, [False, True, False])
+    assert np.array_equal(a >= 2 * si.meters, [False, True, True])
+
+    assert np.array_equal(a == make(np.ones(3), si.seconds), [False] * 3)
+    assert np.array_equal(a != make(np.ones(3), si.seconds), [True] * 3)
+
+    with pytest.raises(UnitMismatchError):
+        a < make(np.ones(3), si.seconds)
+
+
+def test_dimensionless_ufuncs():
+    angles = make(np.array([0.0, 90.0]), si.degrees)
+    assert np.allclose(np.sin(angles), [0.0, 1.0])
+
+    with pytest.raises(UnitMismatchError):
+        np.sin(make(np.array([1.0]), si.meters))
+
+
+def test_reduce():
+    a = make(np.array([1.0, 2.0, 3.0]), si.meters)
+
+    total = np.add.reduce(a)
+    assert total == 6 * si.meters
+    assert np.maximum.reduce(a) == 3 * si.meters
+    assert np.array_equal(np.add.accumulate(a).quantity, [1.0, 3.0, 6.0])
+
+    with pytest.raises(TypeError):
+        np.multiply.reduce(a)
+
+
+def test_unsupported():
+    a = make(np.array([1, 2]), si.meters)
+    with pytest.raises(TypeError):
+        a & a
+    with pytest.raises(TypeError):
+        np.add(a, a, out=(a,))
+    with pytest.raises(TypeError):
+        hash(a)
+
+
+def test_indexing():
+    a = make(np.array([1.0, 2.0, 3.0]), si.meters)
+    assert type(a[1:]) is QuantityArray
+    assert a[0] == 1 * si.meters
+    assert len(a) == 3
+    assert math.isclose(float(abs(-a)[2].get_as(si.meters)), 3.0)
+
+
+def test_reductions():
+    a = make(np.array([1.0, 2.0, 3.0, 4.0]), si.meters)
+
+    assert np.sum(a) == 10 * si.meters
+    assert np.mean(a) == 2.5 * si.meters
+    assert np.max(a) == 4 * si.meters
+    assert np.min(a) == 1 * si.meters
+    assert np.std(a).units == si.meters
+    assert np.var(a).units == si.meters ** 2
+    assert np.argmax(a) == 3
+    assert np.shape(a) == (4,)
+    assert np.cumsum(a).units == si.meters
+
+    grid = make(np.arange(6.0).reshape(2, 3), si.newtons)
+    col_sums = np.sum(grid, axis=0)
+    assert type(col_sums) is QuantityArray
+    assert np.array_equal(col_sums.quantity, [3.0, 5.0, 7.0])
+
+    with pytest.raises(TypeError):
+        np.sum(a, out=a)
+
+
+def test_stacking():
+    a = make(np.array([1.0, 2.0]), si.meters)
+    b = make(np.array([1000.0]), si.millimeters)
+
+    joined = np.concatenate([a, b])
+    assert joined.units == si.millimeters
+    assert np.allclose(joined.get_as(si.meters), [1.0, 2.0, 1.0])
+
+    stacked = np.stack([a, a])
+    assert stacked.quantity.shape == (2, 2)
+    assert stacked.units == si.meters
+
+    with pytest.raises(UnitMismatchError):
+        np.concatenate([a, make(np.array([1.0]), si.seconds)])
+
+
+def test_linear_algebra():
+    forces = make(np.array([3.0, 4.0]), si.kilonewtons)
+    arms = make(np.array([2.0, 1.0]), si.meters)
+
+    assert np.dot(forces, arms) == 10 * si.kilonewtons * si.meters
+    assert np.einsum("i,i", forces, arms) == 10 * si.kilonewtons * si.meters
+    assert np.linalg.norm(forces) == 5 * si.kilonewtons
+    assert np.outer(forces, arms).units == si.kilonewtons * si.meters
+
+    stiffness = make(np.array([[2.0, 0.0], [0.0, 4.0]]), si.kilonewtons / si.meters)
+    displacement = np.linalg.solve(stiffness, forces)
+    assert displacement.units == si.meters
+    assert np.array_equal(displacement.quantity, [1.5, 1.0])
+
+    assert np.linalg.inv(stiffness).units == si.meters / si.kilonewtons
+    assert np.linalg.det(stiffness).units == (si.kilonewtons / si.meters) ** 2
+
+
+def test_interp_where():
+    xp = make(np.array([0.0, 1.0, 2.0]), si.meters)
+    fp = make(np.array([0.0, 10.0, 20.0]), si.newtons)
+
+    x = make(np.array([500.0, 1500.0]), si.millimeters)
+    result = np.interp(x, xp, fp)
+    assert result.units == si.newtons
+    assert np.allclose(result.quantity, [5.0, 15.0])
+
+    with pytest.raises(UnitMismatchError):
+        np.interp(make(np.array([1.0]), si.seconds), xp, fp)
+
+    chosen = np.where(xp.quantity > 0.5, xp, make(np.zeros(3), si.millimeters))
+    assert chosen.units == si.millimeters
+    assert np.allclose(chosen.get_as(si.meters), [0.0, 1.0, 2.0])
+
+    assert np.array_equal(np.where(xp > 0.5 * si.meters)[0], [1, 2])
+
+
+def test_unsupported_function():
+    a = make(np.array([1.0, 2.0]), si.meters)
+    with pytest.raises(TypeError):
+        np.prod(a)
+
+
+def test_isclose():
+    a = make(np.array([1.0, 2.0, 3.0, 1e9]), si.meters)
+    b = make(np.array([1000.0, 2000.5, 2999.9999999, 1e12 + 1]), si.millimeters)
+
+    assert isclose(a, b).tolist() == [True, False, True, True]
+    assert isclose(a, b, atol=1 * si.millimeters).tolist() == [True, True, True, True]
+    assert not allclose(a, b)
+    assert allclose(a, b, atol=1e-3)
+    assert isclose(a, 2 * si.meters).tolist() == [False, True, False, False]
+    assert isclose(1 * si.meters, 1000 * si.millimeters)
+    assert not isclose(a, b, rtol=0).all()
+
+    assert isclose(a, make(np.ones(4), si.seconds)).tolist() == [False] * 4
+    with pytest.raises(UnitMismatchError):
+        isclose(a, b, atol=1 * si.seconds)
+
+    for x, y in zip(a, b):
+        assert isclose(x, y) == x.approx(y)
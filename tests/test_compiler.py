@@ -0,0 +1,118 @@
+import pytest
+import numpy as np
+
+import siquant
+from siquant import si, imperial
+from siquant.compiler import CompiledFormula, compile
+from siquant.exceptions import UnitMismatchError
+
+
+def utilization(moment, section_modulus, yield_stress, phi=0.9):
+    return moment / (phi * section_modulus * yield_stress)
+
+
+def test_compile():
+    check = compile(
+        utilization,
+        moment=si.kilonewtons * si.meters,
+        section_modulus=si.millimeters ** 3,
+        yield_stress=si.megapascals,
+    )
+    assert siquant.compile is compile
+    assert isinstance(check, CompiledFormula)
+    assert check.input_units["phi"] is None
+
+    expected = utilization(
+        120 * si.kilonewtons * si.meters,
+        1.2e6 * si.millimeters ** 3,
+        345 * si.megapascals,
+    )
+    assert check.units == expected.units
+    assert check(120.0, 1.2e6, 345.0, 0.9) == expected.quantity
+    assert check.evaluate(
+        120 * si.kilonewtons * si.meters,
+        1.2e3 * si.centimeters ** 3,
+        345 * si.megapascals,
+        0.9,
+    ).approx(expected)
+
+    moments = np.array([60.0, 120.0])
+    assert np.allclose(check(moments, 1.2e6, 345.0, 0.9), np.array([0.5, 1]) * expected.quantity)
+
+    with pytest.raises(UnitMismatchError):
+        check.evaluate(1 * si.meters, 1 * si.meters, 1 * si.pascals, 1)
+
+
+def test_compile_defaults():
+    check = compile(
+        utilization,
+        moment=si.kilonewtons * si.meters,
+        section_modulus=si.millimeters ** 3,
+        yield_stress=si.megapascals,
+    )
+    assert check(120.0, 1.2e6, 345.0) == check(120.0, 1.2e6, 345.0, 0.9)
+    result = check.evaluate(
+        120 * si.kilonewtons * si.meters,
+        1.2e6 * si.millimeters ** 3,
+        yield_stress=345 * si.megapascals,
+    )
+    assert result == check.evaluate(
+        120 * si.kilonewtons * si.meters,
+        1.2e6 * si.millimeters ** 3,
+        345 * si.megapascals,
+        0.9,
+    )
+    with pytest.raises(TypeError):
+        check.evaluate(1 * si.kilonewtons * si.meters)
+    with pytest.raises(TypeError):
+        check.evaluate(*[1 * si.kilonewtons * si.meters] * 5)
+
+    def offset(x, *, dx=1 * si.millimeters):
+        return x + dx
+
+    shifted = compile(offset, x=si.meters, dx=si.meters)
+    assert shifted(1.0) == 1.001
+    assert shifted(1.0, dx=2.0) == 3.0
+    assert shifted.evaluate(1 * si.meters, dx=1 * si.centimeters).approx(1.01 * si.meters)
+
+    with pytest.raises(TypeError):
+        compile(lambda *xs: xs[0])
+
+
+def test_compile_folds_units():
+    def f(a, b):
+        total = a + b
+        return total * total, -(a - b) ** 2, a < b, abs(a) * 2 * 3
+
+    formula = compile(f, a=si.meters, b=imperial.feet)
+    assert "si" not in formula.source
+    assert "* 2 * 3" not in formula.source
+    assert formula.source.count("a + b") <= 1
+
+    results = formula.evaluate(1 * si.meters, 2 * imperial.feet)
+    for actual, expected in zip(results, f(1 * si.meters, 2 * imperial.feet)):
+        if isinstance(expected, siquant.Quantity):
+            assert actual.approx(expected)
+        else:
+            assert actual == expected
+
+
+def test_compile_unit_factors():
+    formula = compile(lambda t, k: k * t * si.meters / si.kilograms, t=si.seconds)
+    assert formula.units == si.meters * si.seconds / si.kilograms
+    assert "_c" not in formula.source
+    assert formula(2.0, 3.0) == 6.0
+
+    formula = compile(lambda k: si.meters * k / si.seconds)
+    assert formula.units == si.meters / si.seconds
+    assert formula(2.0) == 2.0
+
+
+def test_compile_untraceable():
+    def branching(a):
+        return a if a > 0 * si.meters else -a
+
+    with pytest.raises(TypeError):
+        compile(branching, a=si.meters)
+    with pytest.raises(TypeError):
+        compile(utilization, length=si.meters)
@@ -0,0 +1,49 @@
+from array import array
+
+import pytest
+import numpy as np
+
+from siquant import si, imperial
+from siquant.converters import Converter
+from siquant.exceptions import UnitMismatchError, ImmutabilityError
+
+
+def test_converter_create():
+    cvt = si.kilonewtons.converter_to(si.newtons)
+    assert isinstance(cvt, Converter)
+    assert cvt.factor == 1000
+    assert si.kilonewtons.converter_to(si.newtons) is cvt
+
+    with pytest.raises(UnitMismatchError):
+        si.kilonewtons.converter_to(si.meters)
+
+    with pytest.raises(ImmutabilityError):
+        cvt.factor = 1
+
+
+def test_converter_scalar():
+    cvt = imperial.feet.converter_to(si.meters)
+    assert cvt(10) == (10 * imperial.feet).get_as(si.meters)
+    assert cvt.quantity(10 * imperial.feet) == (10 * imperial.feet).get_as(si.meters)
+    assert cvt.quantity(1 * si.kilometers) == 1000
+
+    identity = si.meters.converter_to(si.meters)
+    value = object()
+    assert identity(value) is value
+
+    assert cvt.inverse()(cvt(3.0)) == pytest.approx(3.0)
+
+
+def test_converter_bulk():
+    cvt = si.millimeters.converter_to(si.meters)
+
+    assert cvt.values([1000, 2000]) == [1.0, 2.0]
+
+    converted = cvt.buffer(array("i", [1000, 2000]))
+    assert converted == array("d", [1.0, 2.0])
+
+    values = np.array([1000.0, 2000.0])
+    assert np.array_equal(cvt.array(values), [1.0, 2.0])
+
+    cvt.array(values, out=values)
+    assert np.array_equal(values, [1.0, 2.0])
@@ -1,3 +1,5 @@
+import pytest
+
 import siquant.dimensions as d
 
 
@@ -41,3 +43,27 @@ def test_dim_pow():
 def test_dim_to_str():
     s = d.dim_str(d.SIDimensions(kg=1, m=1, s=-2))
     assert s == "kg**1*m**1*s**-2"
+
+
+def test_dim_pack():
+    force = d.dim_pack(d.force_t)
+    area = d.dim_pack(d.area_t)
+
+    assert d.dim_unpack(force) == d.force_t
+    assert d.dim_unpack(force - area) == d.stress_t
+    assert d.dim_unpack(force + d.dim_pack(d.distance_t)) == d.moment_t
+    assert d.dim_pack(d.SIDimensions()) == 0
+    assert d.dim_pack(d.angle_t) == d.dim_pack(d.strain_t)
+
+
+def test_dim_pack_rational():
+    dims = d.SIDimensions(kg=0.5, m=-1 / 3, s=-7)
+    assert d.dim_unpack(d.dim_pack(dims)) == dims
+
+    root = d.dim_unpack(d.dim_pack(d.dim_pow(d.volume_t, 1 / 3)))
+    assert root == d.distance_t
+
+    with pytest.raises(ValueError):
+        d.dim_pack(d.SIDimensions(m=0.123))
+    with pytest.raises(ValueError):
+        d.dim_pack(d.SIDimensions(m=4000))
@@ -0,0 +1,104 @@
+from fractions import Fraction
+
+import pytest
+
+from siquant import imperial, make, si
+from siquant.exceptions import UnitMismatchError
+from siquant.fixed import INT64_MAX, FixedQuantity, accumulate, fixed
+
+um, mm, m = si.micrometers, si.millimeters, si.meters
+
+
+def test_fixed():
+    q = fixed(0.1 * m, mm)
+    assert isinstance(q, FixedQuantity)
+    assert q.quantity == 100
+    assert type(q.quantity) is int
+    assert q.get_as(mm) == 100
+    assert q.get_as(m) == 0.1
+    assert q.exact_as(m) * 10 == 1
+
+    assert fixed(2.5, mm).quantity == 2
+    assert fixed(make(1.0000005, mm), um).quantity == 1000
+    assert q.cvt_to(um).quantity == 100000
+    assert FixedQuantity(3, mm).quantity == 3
+
+    with pytest.raises(UnitMismatchError):
+        fixed(1 * si.seconds, mm)
+    with pytest.raises(TypeError):
+        FixedQuantity(1.5, mm)
+
+
+def test_arithmetic():
+    a = fixed(1, mm)
+    b = fixed(250, um)
+
+    assert (a + b).units is mm
+    assert (a + b).quantity == 1
+    assert (b + a).quantity == 1250
+    assert (b - a).quantity == -750
+    assert (a + 0.5 * mm).quantity == 1
+    assert (a + 0.6 * mm).quantity == 2
+    assert (-a).quantity == -1
+    assert abs(-a) == a
+    assert (3 * b).quantity == 750
+    assert isinstance(b * 3, FixedQuantity)
+    assert not isinstance(b * 0.5, FixedQuantity)
+    assert (b * 0.5).get_as(um) == 125.0
+    assert fixed(1, mm) // b == 4
+    assert (fixed(1100, um) % a).quantity == 100
+    assert sum([a, a, a]).quantity == 3
+
+
+def test_no_drift():
+    step = 0.1 * mm
+    total = fixed(0, um)
+    floats = 0 * mm
+    for _ in range(1000):
+        total += step
+        floats += step
+    assert total.quantity == 100000
+    assert total.get_as(m) == 0.1
+    assert floats.get_as(mm) != 100.0
+
+    assert accumulate([step] * 1000, um) == 100 * mm
+
+
+def test_rounding_exact():
+    import random
+
+    rng = random.Random(0)
+    for _ in range(2000):
+        value = round(rng.uniform(-1e6, 1e6), rng.randrange(7))
+        expected = round(Fraction(repr(value)) * 1000)
+        assert fixed(make(value, mm), um).quantity == expected
+    assert fixed(0.0005 * mm, um).quantity == 0
+    assert fixed(0.0015 * mm, um).quantity == 2
+    assert fixed(make(3, mm), si.meters).quantity == 0
+    assert fixed(make(2500, um), mm).quantity == 2
+    assert fixed(make(3500, um), mm).quantity == 4
+
+
+def test_comparison_and_overflow():
+    assert fixed(1, mm) == fixed(1000, um)
+    assert fixed(1, mm) == 0.001 * m
+    assert fixed(1, mm) != fixed(1, um)
+    assert fixed(1, mm) != 1 * si.seconds
+    assert fixed(1, um) < fixed(1, mm)
+    assert fixed(1, mm) > 999 * um
+    assert hash(fixed(1, mm)) == hash(fixed(1000, um))
+    assert len({fixed(5, um), make(5, um)}) == 1
+    for units in (mm, um, imperial.inches):
+        for n in range(1, 2000):
+            assert hash(fixed(n, units)) == hash(make(n, units))
+    assert {make(1, mm): "a"}[fixed(1, mm)] == "a"
+
+    big = fixed(INT64_MAX, um)
+    with pytest.raises(OverflowError):
+        big + fixed(1, um)
+    with pytest.raises(OverflowError):
+        2 * big
+    with pytest.raises(OverflowError):
+        fixed(1e20, um)
+    with pytest.raises(OverflowError):
+        big.cvt_to(si.nanometers)
@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+import siquant
+
+
+def _run(code):
+    return subprocess.check_output([sys.executable, "-c", code]).decode().split()
+
+
+def test_import_is_lazy():
+    loaded = _run(
+        "import sys, siquant; "
+        "print(*(m in sys.modules for m in "
+        "('numpy', 'siquant.systems.si', 'siquant.parsing')))"
+    )
+    assert loaded == ["False", "False", "False"]
+
+
+def test_lazy_attributes():
+    from siquant import si, imperial, parse_unit
+    from siquant.systems import si as si_module
+
+    assert si is si_module
+    assert siquant.imperial is imperial
+    assert parse_unit("kN") == si.kilonewtons
+    assert {"si", "imperial", "parse_quantity"} <= set(dir(siquant))
+    assert all(hasattr(siquant, name) for name in siquant.__all__)
+
+
+def test_array_factory_after_numpy_import():
+    assert _run(
+        "import siquant; import numpy; "
+        "print(type(siquant.make(numpy.ones(2), siquant.SIUnit.Unit())).__name__)"
+    ) == ["QuantityArray"]
@@ -0,0 +1,51 @@
+import pytest
+
+from siquant import si, imperial, normalize
+from siquant.dimensions import distance_t, stress_t
+from siquant.exceptions import UnitMismatchError
+from siquant.index import QuantityIndex
+
+
+def test_index_build():
+    index = QuantityIndex(
+        [
+            (300 * si.megapascals, "a"),
+            (20 * imperial.ksi, "b"),
+            1 * si.meters,
+            (120e6 * si.pascals, "c"),
+        ]
+    )
+    index.add(normalize(200 * si.megapascals), "d")
+    assert len(index) == 5
+    assert 1000 * si.millimeters in index
+    assert 2 * si.meters not in index
+    assert 1.0 not in index
+
+    stresses = [value for _, value in index.of(stress_t)]
+    assert stresses == ["c", "b", "d", "a"]
+    assert [q for q, _ in index.of(distance_t)] == [1 * si.meters]
+    assert index.of((0, 0, 1, 0, 0, 0, 0)) == []
+    assert len(list(index)) == 5
+
+    with pytest.raises(TypeError):
+        index.add(1.0)
+
+
+def test_index_queries():
+    index = QuantityIndex((i * si.megapascals, i) for i in range(0, 500, 10))
+    found = index.range(100 * si.megapascals, 0.25 * si.gigapascals)
+    assert [value for _, value in found] == list(range(100, 260, 10))
+    assert index.range(1 * si.meters, 2 * si.meters) == []
+    with pytest.raises(UnitMismatchError):
+        index.range(1 * si.megapascals, 2 * si.meters)
+
+    assert index.nearest(104 * si.megapascals)[1] == 100
+    assert index.nearest(106 * si.megapascals)[1] == 110
+    assert index.nearest(-5 * si.megapascals)[1] == 0
+    assert index.nearest(1 * si.gigapascals)[1] == 490
+    assert index.nearest(1 * si.meters) is None
+
+    assert index.remove(0.1 * si.gigapascals) == (100 * si.megapascals, 100)
+    assert len(index) == 49
+    with pytest.raises(KeyError):
+        index.remove(0.1 * si.gigapascals)
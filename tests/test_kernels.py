@@ -0,0 +1,100 @@
+import threading
+
+import pytest
+import numpy as np
+
+from siquant import make, si, imperial
+from siquant.exceptions import KernelError, UnitMismatchError
+from siquant.kernels import kernel, stripped, is_stripped
+
+
+@kernel(si.kilonewtons, area=si.millimeters ** 2, stress=si.megapascals)
+def capacity(area, stress, factor=0.9):
+    return factor * area * stress
+
+
+@kernel((si.meters, si.meters), lengths=si.meters)
+def extents(lengths):
+    return min(lengths), max(lengths)
+
+
+def test_kernel_checked():
+    assert not is_stripped()
+    result = capacity(2 * imperial.inches ** 2, 50 * imperial.ksi)
+    assert result.units is si.kilonewtons
+    assert result.approx(0.9 * 100 * imperial.kips)
+
+    with pytest.raises(UnitMismatchError):
+        capacity(1 * si.meters, 1 * si.pascals)
+    with pytest.raises(TypeError):
+        capacity(1.0, 1 * si.pascals)
+
+
+def test_kernel_stripped_identical():
+    areas = [(i + 1) * imperial.inches ** 2 for i in range(5)]
+    checked = [capacity(area, 345 * si.megapascals) for area in areas]
+    with stripped():
+        assert is_stripped()
+        fast = [capacity(area, 345 * si.megapascals) for area in areas]
+        with stripped(False):
+            assert not is_stripped()
+    assert not is_stripped()
+
+    for a, b in zip(checked, fast):
+        assert a.units is b.units
+        assert a.quantity == b.quantity
+
+
+def test_kernel_stripped_arrays():
+    lengths = make(np.array([3.0, 1.0, 2.0]), si.millimeters)
+    checked = extents(lengths)
+    with stripped():
+        fast = extents(lengths)
+        fast = extents(lengths)
+    assert [q.units for q in fast] == [si.meters, si.meters]
+    assert [q.quantity for q in fast] == [q.quantity for q in checked]
+
+    areas = make(np.array([1.0, np.nan]), si.millimeters ** 2)
+    checked = capacity(areas, 1 * si.megapascals)
+    with stripped():
+        result = capacity(areas, 1 * si.megapascals)
+    assert np.array_equal(result.quantity, checked.quantity, equal_nan=True)
+
+
+def test_kernel_unstrippable():
+    @kernel(si.meters, a=si.meters, b=si.millimeters)
+    def total(a, b):
+        return a + b
+
+    assert total(1 * si.meters, 1 * si.meters) == 2 * si.meters
+    with stripped():
+        with pytest.raises(KernelError):
+            total(1 * si.meters, 1 * si.meters)
+
+    with pytest.raises(TypeError):
+        kernel(si.meters, c=si.meters)(total)
+
+
+def test_kernel_arguments():
+    area, stress = 2 * si.millimeters ** 2, 50 * si.megapascals
+    expected = capacity(area, stress)
+    assert capacity(area, stress=stress) == expected
+    assert capacity(stress=stress, area=area) == expected
+    assert capacity(area, stress, 0.5).approx(expected * (0.5 / 0.9))
+    with stripped():
+        assert capacity(area, stress) == expected
+        assert capacity(area, stress=stress) == expected
+        with pytest.raises(TypeError):
+            capacity(area)
+        with pytest.raises(TypeError):
+            capacity(area, stress, 0.9, 1)
+
+
+def test_kernel_mode_per_thread():
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(is_stripped()))
+    with stripped():
+        thread.start()
+        thread.join()
+        assert is_stripped()
+    assert seen == [False]
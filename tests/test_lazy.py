@@ -0,0 +1,72 @@
+import pytest
+import numpy as np
+
+from siquant import make, si
+from siquant.exceptions import UnitMismatchError
+from siquant import lazy as lazy_module
+from siquant.lazy import LazyQuantity, lazy
+
+
+def test_lazy_build():
+    a = lazy(make(np.arange(3.0), si.meters))
+    b = make(np.arange(3.0), si.millimeters)
+
+    expression = (a + b) * a / 2
+    assert isinstance(expression, LazyQuantity)
+    assert expression.units == si.millimeters * si.meters
+
+    for result in (b + a, b - a, b * a, 2 / (a + 1 * si.meters), -a, abs(a), a ** 2):
+        assert isinstance(result, LazyQuantity)
+
+    with pytest.raises(UnitMismatchError):
+        a + 1 * si.seconds
+    with pytest.raises(TypeError):
+        lazy(1.0)
+
+
+def test_lazy_evaluate():
+    P = make(np.linspace(1, 2, 5), si.kilonewtons)
+    A = make(np.linspace(100, 200, 5), si.millimeters ** 2)
+    M = make(np.linspace(0, 1, 5), si.kilonewtons * si.meters)
+    c = 50 * si.millimeters
+    inertia = make(np.linspace(1e6, 2e6, 5), si.millimeters ** 4)
+
+    eager = ((P / A + M * c / inertia) * 1.2).cvt_to(si.megapascals)
+    stress = (lazy(P) / A + lazy(M) * c / inertia) * 1.2
+    result = stress.evaluate(si.megapascals)
+    assert result.units is si.megapascals
+    assert np.allclose(result.quantity, eager.quantity)
+
+    assert float(lazy(2 * si.meters) * 3) == 6
+    assert lazy(1 * si.meters) < 2 * si.meters
+    assert lazy(1 * si.meters) == 1000 * si.millimeters
+
+
+def test_lazy_units():
+    x = make(np.arange(1.0, 4.0), si.meters)
+
+    for result, expected in (
+        (lazy(x) * si.seconds, x * si.seconds),
+        (si.seconds * lazy(x), si.seconds * x),
+        (lazy(x) / si.seconds, x / si.seconds),
+        (si.seconds / lazy(x), si.seconds / x),
+        (make(lazy(x), si.seconds), make(x, si.seconds)),
+    ):
+        assert isinstance(result, LazyQuantity)
+        assert result.units == expected.units
+        evaluated = result.evaluate(expected.units)
+        assert np.allclose(evaluated.quantity, expected.quantity)
+
+    product = lazy(x) * si.seconds
+    assert np.array_equal(
+        (product + x * si.seconds).evaluate().quantity, 2 * x.quantity
+    )
+
+
+def test_lazy_evaluate_blocks(monkeypatch):
+    monkeypatch.setattr(lazy_module, "BLOCK_SIZE", 7)
+    values = make(np.arange(60.0).reshape(20, 3), si.meters)
+    offset = make(np.arange(3.0), si.millimeters)
+
+    result = (lazy(values) * 2 - offset).evaluate()
+    assert np.array_equal(result.quantity, (values * 2 - offset).quantity)
@@ -0,0 +1,116 @@
+from operator import matmul
+
+import pytest
+import numpy as np
+
+from siquant import make, si
+from siquant.exceptions import UnitMismatchError
+from siquant.matrices import UnitMatrix, solve
+
+m, mm, kN, N = si.meters, si.millimeters, si.kilonewtons, si.newtons
+unity = si.unity
+
+
+def stiffness():
+    # a spring (kN / m) coupled to a rotation (kN m / rad)
+    return UnitMatrix([[2.0, 1.0], [1.0, 3.0]], (kN, kN * m), (~m, unity))
+
+
+def test_solve():
+    K = stiffness()
+    F = UnitMatrix([4.0, 5.0], (kN, kN * m))
+
+    u = solve(K, F)
+    assert u[0].units == m
+    assert u[1].units == unity
+    assert np.allclose(u.values, [1.4, 1.2])
+
+    residual = K.solve(F)
+    assert np.allclose(residual.values, u.values)
+
+    F = UnitMatrix([4000.0, 5.0], (N, kN * m))
+    u = solve(K, F)
+    assert np.isclose(u[0].get_as(m), 1.4)
+    assert np.isclose(u[1].get_as(unity), 1.2)
+
+    with pytest.raises(UnitMismatchError):
+        solve(K, UnitMatrix([4.0, 5.0], (kN, kN)))
+
+
+def test_matmul():
+    K = stiffness()
+    u = UnitMatrix([1400.0, 1.2], (mm, unity))
+
+    F = np.matmul(K.values, [1.4, 1.2])
+    product = K.__matmul__(u)
+    assert np.allclose(product[0].get_as(kN), F[0])
+    assert np.allclose(product[1].get_as(kN * m), F[1])
+
+    with pytest.raises(UnitMismatchError):
+        K.__matmul__(UnitMatrix([1.0, 1.0], (m, m)))
+    with pytest.raises(ValueError):
+        K.__matmul__(UnitMatrix([1.0], (m,)))
+
+
+def test_matmul_quantity_array():
+    K = UnitMatrix([[1.0, 2.0], [3.0, 4.0]], (kN, kN), (~m, ~m))
+    x = make(np.array([1.0, 1000.0]), mm)
+
+    product = K.__matmul__(x)
+    assert np.allclose(product.to_quantity(kN).get_as(kN), [2.001, 4.003])
+
+    row = make(np.array([[1.0, 1.0]]), m)
+    product = matmul(row, K)
+    assert isinstance(product, UnitMatrix)
+    assert np.allclose(product.to_quantity(kN).get_as(kN), [[4.0, 6.0]])
+
+
+def test_add_and_entries():
+    K = stiffness()
+    other = UnitMatrix([[2000.0, 1000.0], [1.0, 3.0]], (N, kN * m), (~m, unity))
+
+    total = K + other
+    assert total.row_units == K.row_units
+    assert np.allclose(total.values, 2 * K.values)
+    assert np.allclose((K - other).values, 0)
+    assert np.allclose((-K).values, -K.values)
+
+    assert K[0, 0] == 2 * kN / m
+    assert K[1, 1] == 3 * kN * m
+    assert K.units(0, 1) == kN
+    assert K.T[1, 0] == 1 * kN
+
+    scaled = K * (2 * si.seconds)
+    assert scaled[0, 0] == 4 * kN * si.seconds / m
+
+    with pytest.raises(UnitMismatchError):
+        K + UnitMatrix(K.values, (kN, kN), (~m, ~m))
+    with pytest.raises(ValueError):
+        UnitMatrix([1.0, 2.0], (m,))
+
+
+def test_rows_and_slices():
+    K = UnitMatrix(
+        [[2.0, 1.0, 0.0], [1.0, 3.0, 1.0], [0.0, 1.0, 4.0]],
+        (kN, kN * m, kN),
+        (~m, unity, ~m),
+    )
+
+    row = K[1]
+    assert row.shape == (3,)
+    assert row.row_units == (kN, kN * m, kN)
+    assert row[0] == 1 * kN
+    assert row[1] == 3 * kN * m
+
+    block = K[0:2]
+    assert block.shape == (2, 3)
+    assert block.row_units == (kN, kN * m)
+    assert block.col_units == K.col_units
+    assert block[1, 1] == K[1, 1]
+
+    F = UnitMatrix([4.0, 5.0, 6.0], (kN, kN * m, kN))
+    head = F[0:2]
+    assert head.shape == (2,)
+    assert head.row_units == (kN, kN * m)
+    assert head[1] == 5 * kN * m
+    assert F[-1] == 6 * kN
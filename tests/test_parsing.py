@@ -0,0 +1,92 @@
+import pytest
+import numpy as np
+
+from siquant import si, imperial
+from siquant.exceptions import UnitMismatchError, UnitParseError
+from siquant.parsing import lookup_unit, parse_quantities, parse_quantity, parse_unit
+
+
+def test_lookup_unit():
+    assert lookup_unit("m") is si.meters
+    assert lookup_unit("kN") == si.kilonewtons
+    assert lookup_unit("MPa") == si.megapascals
+    assert lookup_unit("µm") == si.micrometers
+    assert lookup_unit("dam") == si.decameters
+    assert lookup_unit("min") is si.minutes
+    assert lookup_unit("ft") is imperial.feet
+    assert lookup_unit("kilonewtons") is si.kilonewtons
+    assert lookup_unit("meter") is si.meters
+    assert lookup_unit("meganewtons") == si.mega * si.newtons
+
+    with pytest.raises(UnitParseError):
+        lookup_unit("furlong_per_fortnight")
+
+
+def test_parse_unit():
+    assert parse_unit("kN*m/s**2") == si.kilonewtons * si.meters / si.seconds ** 2
+    assert parse_unit("lbf/in^2") == imperial.pounds_force / imperial.inches ** 2
+    assert parse_unit("kN m") == si.kilonewton_meters
+    assert parse_unit("N·m") == si.newton_meters
+    assert parse_unit("1/s") == si.hertz
+    assert parse_unit("s^-1") == si.hertz
+    assert parse_unit("(m/s)^-2") == (si.meters / si.seconds) ** -2
+    assert parse_unit("m**(1/2)") == si.meters ** 0.5
+    assert parse_unit("m^(-3/2)") == si.meters ** -1.5
+
+
+def test_parse_unit_cached():
+    parse_unit.cache_clear()
+    units = parse_unit("kN/m^2")
+    assert parse_unit("kN/m^2") is units
+    assert parse_unit.cache_info().hits == 1
+
+
+@pytest.mark.parametrize("text", ["", "  ", "foo", "m**", "m)", "(m", "m^x", "m & s"])
+def test_parse_unit_errors(text):
+    with pytest.raises(UnitParseError):
+        parse_unit(text)
+
+
+def test_parse_quantity():
+    force = parse_quantity("12.5 kN")
+    assert force.quantity == 12.5
+    assert force.units == si.kilonewtons
+
+    assert parse_quantity("1.2e3 psi") == 1200 * imperial.psi
+    assert parse_quantity("3 ft 4 in").approx(40 * imperial.inches)
+    assert parse_quantity("-3 ft 4 in").approx(-40 * imperial.inches)
+    assert parse_quantity("5", si.meters) == 5 * si.meters
+    assert parse_quantity("5 mm", si.meters).units == si.meters
+
+    with pytest.raises(UnitParseError):
+        parse_quantity("")
+    with pytest.raises(UnitParseError):
+        parse_quantity("kN")
+    with pytest.raises(UnitParseError):
+        parse_quantity("5 m 6")
+    with pytest.raises(UnitParseError):
+        parse_quantity("5 6 m")
+
+
+def test_parse_quantities():
+    forces = parse_quantities(
+        ["12.5 kN", "3 kip", "1200 N", "", "1 kN 200 N", "5"], si.kilonewtons
+    )
+    assert forces.units == si.kilonewtons
+
+    values = forces.quantity
+    assert values[0] == 12.5
+    assert values[1] == pytest.approx((3 * imperial.kips).get_as(si.kilonewtons))
+    assert values[2] == pytest.approx(1.2)
+    assert np.isnan(values[3])
+    assert values[4] == pytest.approx(1.2)
+    assert values[5] == 5
+
+    lengths = parse_quantities(["1 m", "2 mm"])
+    assert lengths.units == si.meters
+    assert np.allclose(lengths.quantity, [1.0, 0.002])
+
+    with pytest.raises(UnitMismatchError):
+        parse_quantities(["1 m", "2 s"])
+    with pytest.raises(UnitParseError):
+        parse_quantities(["1 m", "2 parsecs"])
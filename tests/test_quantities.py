@@ -1,7 +1,9 @@
 import sys
 import math
 
+from array import array
 from copy import copy, deepcopy
+from fractions import Fraction
 
 import pytest
 import numpy as np
@@ -10,6 +12,9 @@ import siquant.dimensions as dims
 
 from siquant.exceptions import UnitMismatchError, ImmutabilityError
 from siquant import make, converter, validator, are_of, si, SIUnit
+from siquant import NormalizedQuantity, normalize, register_factory
+from siquant.arrays import QuantityArray
+from siquant.quantities import Quantity
 
 
 def test_q_copying():
@@ -119,10 +124,8 @@ def test_q_matmul():
     value = matmul(distances, np.array([1, 2, 3]))
     assert value.get_as(si.meters ** 1) == 14
 
-    with pytest.raises(TypeError):
-        # numpy really should just return NotImplemented instead of throwing a TypeError
-        value = matmul(np.array([1, 2, 3]), distances)
-        assert value.get_as(si.meters ** 1) == 14
+    value = matmul(np.array([1, 2, 3]), distances)
+    assert value.get_as(si.meters ** 1) == 14
 
 
 def test_are_of_validator():
@@ -392,3 +395,73 @@ def test_q_converters():
 
     with pytest.raises(UnitMismatchError):
         cvtr(1000 * si.kilograms)
+
+
+def test_normalized():
+    length = normalize(2 * si.kilometers)
+    assert isinstance(length, NormalizedQuantity)
+    assert length.base == 2000 and length.quantity == 2
+    assert normalize(length) is length
+    with pytest.raises(TypeError):
+        normalize(1.0)
+
+    total = length + 500 * si.meters
+    assert isinstance(total, NormalizedQuantity)
+    assert total.units is si.kilometers
+    assert total.quantity == 2.5 and total.base == 2500
+    assert (length - normalize(2000 * si.meters)).base == 0
+    assert length + 0 is length
+
+    assert length == 2000 * si.meters
+    assert length != 2 * si.meters
+    assert length != 2 * si.seconds
+    assert 1 * si.kilometers < length <= normalize(2000 * si.meters)
+    assert hash(length) == hash(normalize(2000 * si.meters))
+    assert hash(length) == hash(2000 * si.meters)
+    with pytest.raises(UnitMismatchError):
+        length < 1 * si.seconds
+    with pytest.raises(UnitMismatchError):
+        length + 1 * si.seconds
+
+    area = length * length
+    assert isinstance(area, NormalizedQuantity)
+    assert area.units == si.kilometers ** 2 and area.base == 4e6
+    assert (length / (2 * si.seconds)).base == 1000
+    assert (length * si.meters).units == si.kilometers * si.meters
+    assert (-length).base == -2000 and abs(-length) == length
+    assert length.get_as(si.meters) == 2000
+    assert length.cvt_to(si.meters).quantity == 2000
+
+
+def test_register_factory():
+    class FractionQuantity(Quantity):
+        __slots__ = ()
+
+    class Ratio(Fraction):
+        pass
+
+    assert type(make(Fraction(1, 2), si.meters)) is Quantity
+    register_factory(Fraction, FractionQuantity)
+    try:
+        assert type(make(Fraction(1, 2), si.meters)) is FractionQuantity
+        assert type(Ratio(1, 2) * si.meters) is FractionQuantity
+        assert type(make(1.0, si.meters)) is Quantity
+        rewrapped = make(make(Fraction(1, 2), si.meters), si.meters)
+        assert type(rewrapped) is FractionQuantity
+        assert rewrapped.units == si.meters ** 2
+    finally:
+        register_factory(Fraction, None)
+    assert type(make(Fraction(1, 2), si.meters)) is Quantity
+
+    register_factory("fractions.Fraction", "siquant.missing:Quantity")
+    try:
+        assert type(make(Fraction(1, 2), si.meters)) is Quantity
+    finally:
+        register_factory("fractions.Fraction", None)
+
+    assert isinstance(make(np.ones(2), si.meters), QuantityArray)
+    values = array("d", [1.0, 2.0])
+    buffered = make(values, si.meters)
+    assert isinstance(buffered, QuantityArray)
+    values[0] = 3.0
+    assert buffered.quantity[0] == 3.0
@@ -0,0 +1,62 @@
+import io
+
+import pytest
+import numpy as np
+
+from siquant import si
+from siquant.arrays import QuantityArray
+from siquant.exceptions import UnitMismatchError
+from siquant.readers import parse_header, read_csv
+
+CSV = """time [s],force [kN],label
+0,1.5,a
+1,2.5,b
+
+2,,c
+3,4.0,d
+4,5.0,e
+"""
+
+
+def test_parse_header():
+    assert parse_header("force [kN]") == ("force", si.kilonewtons)
+    assert parse_header(" stress[MPa] ") == ("stress", si.megapascals)
+    assert parse_header("label") == ("label", None)
+
+
+def test_read_csv_chunks():
+    chunks = list(read_csv(io.StringIO(CSV), chunk_size=2))
+    assert [len(chunk["time"]) for chunk in chunks] == [2, 1, 2]
+
+    force = chunks[0]["force"]
+    assert type(force) is QuantityArray
+    assert force.units == si.kilonewtons
+    assert np.array_equal(force.quantity, [1.5, 2.5])
+
+    assert np.isnan(chunks[1]["force"].quantity[0])
+    assert list(chunks[2]["label"]) == ["d", "e"]
+
+
+def test_read_csv_convert():
+    (chunk,) = read_csv(io.StringIO(CSV), units={"force": si.newtons})
+    assert chunk["force"].units == si.newtons
+    assert chunk["force"].quantity[0] == 1500
+    assert chunk["time"].units == si.seconds
+
+    with pytest.raises(UnitMismatchError):
+        next(read_csv(io.StringIO(CSV), units={"force": si.meters}))
+    with pytest.raises(ValueError):
+        next(read_csv(io.StringIO(CSV), units={"label": si.meters}))
+    with pytest.raises(ValueError):
+        next(read_csv(io.StringIO(CSV), units={"torque": si.newton_meters}))
+
+
+def test_read_csv_edge_cases():
+    assert list(read_csv(io.StringIO(""))) == []
+    assert list(read_csv(io.StringIO("time [s]\n"))) == []
+
+    with pytest.raises(ValueError):
+        list(read_csv(io.StringIO("a [m],b [m]\n1,2\n3\n")))
+
+    (chunk,) = read_csv(io.StringIO("a [m];b [m]\n1;2\n"), delimiter=";")
+    assert chunk["b"].quantity[0] == 2
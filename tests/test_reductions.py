@@ -0,0 +1,52 @@
+import pytest
+import numpy as np
+
+from siquant import make, si, imperial
+from siquant import reductions
+from siquant.exceptions import UnitMismatchError
+
+
+def test_sum():
+    forces = [1 * si.kilonewtons, 500 * si.newtons, 2 * si.kilonewtons]
+    total = reductions.sum(forces)
+    assert total.units is si.newtons
+    assert total.quantity == 3500
+    assert reductions.sum(iter(forces)) == sum(forces)
+    assert reductions.sum([]) == 0
+
+    arrays = [make(np.ones(3), si.meters), make(np.ones(3), si.millimeters)]
+    assert np.array_equal(reductions.sum(arrays).quantity, [1001.0] * 3)
+
+    with pytest.raises(UnitMismatchError):
+        reductions.sum([1 * si.meters, 1 * si.seconds])
+    with pytest.raises(TypeError):
+        reductions.sum([1 * si.meters, 1.0])
+
+
+def test_fsum():
+    values = [1e16 * si.meters, 1 * si.meters, -1e16 * si.meters] * 10
+    assert reductions.fsum(values) == 10 * si.meters
+    assert reductions.fsum([]) == 0.0
+
+
+def test_mean_and_average():
+    lengths = [1 * si.meters, 2000 * si.millimeters, 3 * si.meters]
+    assert reductions.mean(lengths).approx(2 * si.meters)
+    assert reductions.average(lengths, [1, 0, 1]).approx(2 * si.meters)
+    assert reductions.average(lengths, [0, 1, 3]).approx(2.75 * si.meters)
+
+    with pytest.raises(ValueError):
+        reductions.mean([])
+    with pytest.raises(ValueError):
+        reductions.average(lengths, [0, 0, 0])
+
+
+def test_min_max():
+    lengths = [1 * si.meters, 3 * imperial.feet, 90 * si.centimeters]
+    smallest = reductions.min(lengths)
+    assert smallest.units is si.centimeters and smallest.quantity == 90
+    largest = reductions.max(lengths)
+    assert largest.units is si.meters and largest.quantity == 1
+
+    with pytest.raises(ValueError):
+        reductions.max([])
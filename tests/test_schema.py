@@ -0,0 +1,88 @@
+from collections import namedtuple
+
+import pytest
+import numpy as np
+
+from siquant import make, si, imperial
+from siquant.dimensions import distance_t
+from siquant.exceptions import SchemaError
+from siquant.schema import FieldError, Schema
+
+loads = Schema({"force": si.kilonewtons, "lever_arm": distance_t})
+
+Load = namedtuple("Load", ("force", "lever_arm"))
+
+
+def test_schema_convert():
+    records = [
+        {"force": 2 * imperial.kips, "lever_arm": 3 * imperial.feet, "id": 1},
+        (500 * si.newtons, 1 * si.meters),
+        Load(1 * si.kilonewtons, 2 * si.meters),
+    ]
+    converted = loads.convert(records)
+
+    assert converted[0]["id"] == 1
+    assert converted[0]["force"].units is si.kilonewtons
+    assert converted[0]["force"].approx(2 * imperial.kips)
+    assert converted[0]["lever_arm"] is records[0]["lever_arm"]
+    assert converted[1] == (0.5 * si.kilonewtons, 1 * si.meters)
+    assert isinstance(converted[2], Load)
+    assert converted[2].force.units is si.kilonewtons
+
+    loads.validate(records)
+    assert loads.errors(records) == []
+
+
+def test_schema_dataclasses():
+    dataclasses = pytest.importorskip("dataclasses")
+    LoadRecord = dataclasses.make_dataclass(
+        "LoadRecord",
+        ["force", "lever_arm", ("name", str, dataclasses.field(default=""))],
+    )
+    records = [LoadRecord(1000 * si.newtons, 2 * si.millimeters, "a")]
+    converted = loads.convert(records)
+
+    assert isinstance(converted[0], LoadRecord) and converted[0].name == "a"
+    assert converted[0].force.quantity == 1
+    assert converted[0].lever_arm is records[0].lever_arm
+    errors = loads.errors([LoadRecord(1 * si.meters, 1 * si.meters)])
+    assert [(e.index, e.field) for e in errors] == [(0, "force")]
+
+
+def test_schema_errors():
+    records = [
+        {"force": 1 * si.meters, "lever_arm": 1 * si.meters},
+        {"lever_arm": 1.0},
+        (1 * si.newtons,),
+    ]
+    errors = loads.errors(records)
+    assert [(e.index, e.field) for e in errors] == [
+        (0, "force"),
+        (1, "force"),
+        (1, "lever_arm"),
+        (2, "lever_arm"),
+    ]
+    assert all(isinstance(e, FieldError) for e in errors)
+    assert "record 1, 'force': missing" in [str(e) for e in errors]
+
+    with pytest.raises(SchemaError) as raised:
+        loads.convert(records)
+    assert raised.value.errors == errors
+    with pytest.raises(SchemaError):
+        loads.validate(records)
+    with pytest.raises(TypeError):
+        Schema({"force": 1.0})
+
+
+def test_schema_columns():
+    columns = {
+        "force": make(np.array([1.0, 2.0]), imperial.kips),
+        "lever_arm": make(np.array([1.0, 2.0]), si.meters),
+    }
+    converted = loads.convert_columns(columns)
+    assert converted["force"].units is si.kilonewtons
+    assert np.allclose(converted["force"].quantity, [4.448222, 8.896443])
+
+    with pytest.raises(SchemaError) as raised:
+        loads.convert_columns({"force": columns["lever_arm"]})
+    assert [e.index for e in raised.value.errors] == [None, None]
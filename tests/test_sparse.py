@@ -0,0 +1,85 @@
+from operator import matmul
+
+import pytest
+import numpy as np
+
+scipy_sparse = pytest.importorskip("scipy.sparse")
+
+from siquant import make, si  # noqa: E402
+from siquant.exceptions import UnitMismatchError  # noqa: E402
+from siquant.sparse import SparseQuantity, solve  # noqa: E402
+
+kN, N, m, mm = si.kilonewtons, si.newtons, si.meters, si.millimeters
+
+
+def stiffness():
+    values = scipy_sparse.csr_matrix(
+        [[2.0, -1.0, 0.0], [-1.0, 2.0, -1.0], [0.0, -1.0, 2.0]]
+    )
+    return make(values, kN / m)
+
+
+def test_factory():
+    K = stiffness()
+    assert isinstance(K, SparseQuantity)
+    if hasattr(scipy_sparse, "csr_array"):  # scipy >= 1.8
+        array = scipy_sparse.csr_array(K.quantity)
+        assert isinstance(make(array, N), SparseQuantity)
+    assert isinstance(make(K.quantity.tolil(), N), SparseQuantity)
+    assert K.nnz == 7
+    assert len(K) == 3
+
+
+def test_conversion_scales_data():
+    K = stiffness()
+    converted = K.get_as(N / mm)
+    assert scipy_sparse.issparse(converted)
+    assert converted.nnz == K.quantity.nnz
+    assert np.allclose(converted.data, K.quantity.data)
+    assert K.get_as(kN / m) is K.quantity
+
+    in_newtons = K.cvt_to(N / m)
+    assert isinstance(in_newtons, SparseQuantity)
+    assert np.allclose(in_newtons.quantity.toarray(), 1000 * K.quantity.toarray())
+
+    lil = make(K.quantity.tolil(), kN / m)
+    assert np.allclose(lil.get_as(N / m).toarray(), 1000 * K.quantity.toarray())
+
+    with pytest.raises(UnitMismatchError):
+        K.get_as(N)
+
+
+def test_arithmetic():
+    K = stiffness()
+    assert np.allclose((2 * K).quantity.toarray(), 2 * K.quantity.toarray())
+    assert (K * (2 * m)).units == kN
+    assert np.allclose((K / 2).quantity.data, K.quantity.data / 2)
+    assert (K / (2 * si.seconds)).units == kN / m / si.seconds
+    assert np.allclose((-K).quantity.data, -K.quantity.data)
+
+    rows = list(K)
+    assert len(rows) == 3
+    assert rows[1].units == kN / m
+    assert np.allclose(rows[1].quantity.toarray(), [[-1.0, 2.0, -1.0]])
+    assert K[0, 1] == -1 * kN / m
+
+
+def test_matmul_and_solve():
+    K = stiffness()
+    u = make(np.array([1.0, 2.0, 3.0]), mm)
+
+    F = matmul(K, u)
+    assert F.units == kN / m * mm
+    assert np.allclose(F.get_as(N), [0.0, 0.0, 4.0])
+
+    row = make(np.array([1.0, 1.0, 1.0]), m)
+    product = matmul(row, K)
+    assert product.units == kN
+    assert np.allclose(product.quantity, [1.0, 0.0, 1.0])
+
+    x = solve(K, F)
+    assert x.units.compatible(m)
+    assert np.allclose(x.get_as(mm), [1.0, 2.0, 3.0])
+
+    with pytest.raises(TypeError):
+        solve(K.quantity, F)
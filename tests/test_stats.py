@@ -0,0 +1,59 @@
+import pytest
+
+from siquant import make, si, SIUnit, stats
+from siquant.exceptions import UnitMismatchError
+from siquant.quantities import Quantity
+
+
+@pytest.fixture(autouse=True)
+def disabled():
+    yield
+    stats.disable()
+    stats.reset()
+
+
+def test_disabled_restores_originals():
+    init = Quantity.__init__
+    factory = SIUnit.__dict__["factory"]
+    stats.enable()
+    assert stats.is_enabled()
+    assert Quantity.__init__ is not init
+    stats.disable()
+    assert not stats.is_enabled()
+    assert Quantity.__init__ is init
+    assert SIUnit.__dict__["factory"] is factory
+
+
+def test_counters():
+    a = 1 * si.meters
+    with stats.collecting():
+        b = make(2, si.millimeters)
+        c = a + b
+        c.get_as(si.meters)
+        SIUnit(1.75, si.meters.dimensions)
+        with pytest.raises(UnitMismatchError):
+            a.get_as(si.seconds)
+
+    counts = stats.snapshot()
+    assert counts["quantities"]["Quantity"] == 2
+    assert counts["factory_calls"] == 2
+    assert counts["conversions"][si.meters, si.millimeters] == 1
+    assert counts["conversions"][si.millimeters, si.meters] == 1
+    assert counts["flyweight"]["misses"] == 1
+    assert counts["unit_mismatches"] == 1
+    assert not stats.is_enabled()
+
+    a + b
+    assert stats.snapshot() == counts
+
+    stats.reset()
+    assert stats.snapshot()["factory_calls"] == 0
+
+
+def test_unit_cache_counters():
+    with stats.collecting():
+        si.kilonewtons * si.meters
+        si.kilonewtons * si.meters
+    counts = stats.snapshot()
+    assert counts["unit_cache"]["hits"] + counts["unit_cache"]["misses"] == 2
+    assert counts["unit_cache"]["hits"] >= 1
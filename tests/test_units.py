@@ -1,3 +1,6 @@
+import sys
+import threading
+
 import pytest
 
 from siquant.units import SIUnit
@@ -142,3 +145,85 @@ def test_unit_compatible(unit):
     assert unit.compatible(SIUnit.Unit(2) * unit)
     assert not unit.compatible(unit * unit)
     assert not unit.compatible(SIUnit.Unit(1))
+
+
+def test_unit_cache(unit):
+    other = SIUnit.Unit(2, m=1)
+    SIUnit.cache.clear()
+
+    product = unit * other
+    assert SIUnit.cache.info()["misses"] == 1
+    assert unit * other is product
+    assert SIUnit.cache.info()["hits"] == 1
+
+    assert unit / other is unit / other
+    assert unit ** 2 is unit ** 2
+    assert ~unit is ~unit
+    assert SIUnit.cache.info()["size"] == 4
+
+    SIUnit.cache.resize(2)
+    assert len(SIUnit.cache) == 2
+    assert unit * other == product
+    assert len(SIUnit.cache) == 2
+
+    SIUnit.cache.resize(0)
+    assert unit * other == product
+    assert len(SIUnit.cache) == 0
+
+    SIUnit.cache.resize(4096)
+    SIUnit.cache.clear()
+
+
+def test_unit_cache_threads():
+    units = [SIUnit.Unit(scale, m=1) for scale in range(1, 33)]
+    errors = []
+
+    def work():
+        try:
+            for _ in range(200):
+                for a, b in zip(units, units[1:]):
+                    a * b
+                    a / b
+        except Exception as error:
+            errors.append(error)
+
+    interval = sys.getswitchinterval()
+    SIUnit.cache.resize(2)
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+        SIUnit.cache.resize(4096)
+        SIUnit.cache.clear()
+    assert not errors
+
+
+def test_unit_interning(unit):
+    assert SIUnit(10, unit.dimensions) is unit
+    assert SIUnit(10.0, unit.dimensions) is unit
+
+    float_dims = tuple(float(power) for power in unit.dimensions)
+    assert SIUnit(10, float_dims) is unit
+    assert unit.dimensions == (1, 2, 3, 4, 5, 6, 7)
+    assert all(type(power) is int for power in unit.dimensions)
+
+    assert (unit * unit) / unit is unit
+    assert ~~unit is unit
+
+
+def test_unit_exponent_overflow():
+    m = SIUnit.Unit(m=1)
+    large = m ** 3000
+    assert large.dimensions == (0, 3000, 0, 0, 0, 0, 0)
+    with pytest.raises(ValueError):
+        large * large
+    with pytest.raises(ValueError):
+        large / ~large
+    with pytest.raises(ValueError):
+        large ** 2
+    assert (large * ~m).dimensions == (0, 2999, 0, 0, 0, 0, 0)
@@ -0,0 +1,82 @@
+import math
+
+import pytest
+import numpy as np
+
+from siquant import make, si
+from siquant.exceptions import ImmutabilityError, UnitMismatchError
+from siquant.vectors import Vector2Quantity, Vector3Quantity, from_array, to_array
+
+
+def test_vector_arithmetic():
+    a = Vector3Quantity(1.0, 2.0, 3.0, si.meters)
+    b = Vector3Quantity(1000.0, 0.0, -1000.0, si.millimeters)
+
+    total = a + b
+    assert total.units is si.millimeters
+    assert total.components() == (2000.0, 2000.0, 2000.0)
+    assert (a - b).get_as(si.meters) == (0.0, 2.0, 4.0)
+    assert (-a).components() == (-1.0, -2.0, -3.0)
+    assert (2 * a).components() == (2.0, 4.0, 6.0)
+    assert (a / 2).components() == (0.5, 1.0, 1.5)
+
+    force = a * (2 * si.newtons)
+    assert force.units == si.meters * si.newtons
+    assert (2 * si.newtons * a) == force
+    assert (si.newtons * a).units == si.newtons * si.meters
+    assert (a / si.seconds).units == si.meters / si.seconds
+
+    assert a == Vector3Quantity(100.0, 200.0, 300.0, si.centimeters)
+    assert a != b
+    assert hash(a) == hash(Vector3Quantity(100.0, 200.0, 300.0, si.centimeters))
+    assert len(a) == 3 and list(a)[1] == 2 * si.meters and a[2] == 3 * si.meters
+
+    with pytest.raises(UnitMismatchError):
+        a + Vector3Quantity(1, 1, 1, si.seconds)
+    with pytest.raises(ImmutabilityError):
+        a.x = 1
+    with pytest.raises(TypeError):
+        Vector2Quantity(1, 2, 3)
+
+
+def test_vector_products():
+    x = Vector3Quantity(2.0, 0.0, 0.0, si.meters)
+    y = Vector3Quantity(0.0, 3.0, 0.0, si.newtons)
+    assert x.dot(y) == 0 * si.meters * si.newtons
+    assert x.dot(x) == 4 * si.meters ** 2
+    moment = x.cross(y)
+    assert moment.units == si.meters * si.newtons
+    assert moment.components() == (0.0, 0.0, 6.0)
+    assert Vector3Quantity(3.0, 4.0, 12.0, si.meters).norm() == 13 * si.meters
+
+    plane = Vector2Quantity(3.0, 4.0, si.meters)
+    assert plane.norm() == 5 * si.meters
+    assert plane.cross(Vector2Quantity(1.0, 0.0, si.meters)) == -4 * si.meters ** 2
+    assert plane.dot(plane) == 25 * si.meters ** 2
+
+
+def test_vector_rotate():
+    v = Vector2Quantity(1.0, 0.0, si.meters).rotate(90 * si.degrees)
+    assert v.x == pytest.approx(0.0, abs=1e-12) and v.y == pytest.approx(1.0)
+
+    w = Vector3Quantity(1.0, 0.0, 0.0, si.meters).rotate(math.pi / 2, (0, 0, 2))
+    assert w.get_as(si.meters) == pytest.approx((0.0, 1.0, 0.0))
+    axis = Vector3Quantity(1.0, 1.0, 1.0, si.meters)
+    u = Vector3Quantity(1.0, 0.0, 0.0, si.meters).rotate(120 * si.degrees, axis)
+    assert u.components() == pytest.approx((0.0, 1.0, 0.0))
+
+
+def test_vector_arrays():
+    vectors = [
+        Vector3Quantity(1.0, 2.0, 3.0, si.meters),
+        Vector3Quantity(1000.0, 0.0, 0.0, si.millimeters),
+    ]
+    array = to_array(vectors)
+    assert array.units is si.meters
+    assert np.array_equal(array.quantity, [[1.0, 2.0, 3.0], [1.0, 0.0, 0.0]])
+    assert from_array(array) == [vectors[0], vectors[1].cvt_to(si.meters)]
+
+    planar = from_array(make(np.ones((2, 2)), si.newtons))
+    assert planar == [Vector2Quantity(1.0, 1.0, si.newtons)] * 2
+    with pytest.raises(ValueError):
+        from_array(make(np.ones((2, 4)), si.newtons))